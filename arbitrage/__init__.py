@@ -1,5 +1,21 @@
 """Arbitrage calculation module."""
 
 from .arbitrage_sports import ArbitrageSportsCalculator
+from .cover import solve_cover
+from .solver import SolverArbitrageCalculator
+from .vectorized import VectorizedArbitrageCalculator
 
-__all__ = ["ArbitrageSportsCalculator"]
+# Interchangeable calculators; "solver" generalizes beyond two teams
+ENGINES: dict[str, type[ArbitrageSportsCalculator]] = {
+    "python": ArbitrageSportsCalculator,
+    "numpy": VectorizedArbitrageCalculator,
+    "solver": SolverArbitrageCalculator,
+}
+
+__all__ = [
+    "ENGINES",
+    "ArbitrageSportsCalculator",
+    "SolverArbitrageCalculator",
+    "VectorizedArbitrageCalculator",
+    "solve_cover",
+]
@@ -2,11 +2,18 @@
 
 import logging
 import os
+from collections.abc import Sequence
 from typing import Any
 
+from normalize import Market
+from sinks import OpportunitySink
 from supabase_client import write_sports_arbitrage_to_supabase
 from utils import save_to_json
 
+from .cover import solve_cover
+from .depth import Ladder, walk_depth
+from .fees import break_even_size, fee_per_contract
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,18 +22,59 @@ class ArbitrageSportsCalculator:
 
     def __init__(
         self,
-        kalshi_markets: dict[str, dict[str, Any]],
-        polymarket_markets: dict[str, dict[str, Any]],
+        kalshi_markets: dict[str, Market],
+        polymarket_markets: dict[str, Market],
         sport: str,
+        sink: OpportunitySink | None = None,
     ) -> None:
-        """Initialize calculator with Polymarket and Kalshi market data."""
+        """Initialize calculator with Polymarket and Kalshi market data.
+
+        With a ``sink``, results are handed to it for background persistence
+        instead of being inserted into Supabase synchronously.
+        """
         self.kalshi_markets = kalshi_markets
         self.polymarket_markets = polymarket_markets
         self.opportunities: list[dict[str, Any]] = []
         self.sport = sport
+        self.sink = sink
+
+    def calculate(self, persist: bool = True) -> list[dict[str, Any]]:
+        """Calculate, persist and return arbitrage opportunities.
+
+        With ``persist`` off nothing is written anywhere, for offline replay.
+
+        Each team is bought through the cheaper of its own contract and the
+        opposite side of its opponent's, and ``sides`` records which ("yes"
+        or "no") per leg. Each opportunity reports the per-contract ``fee``
+        of its legs, the ``net_profit`` left after it and the
+        ``break_even_size`` at which fees rounded up per order are covered,
+        next to the gross ``profit``. Markets whose legs carry ask ladders
+        also report the executable ``max_size``, the ``depth_profit`` earned
+        buying all of it and the ``profit_curve`` of (size, cumulative
+        profit) points.
+        """
+        opportunities = self._find_opportunities()
+
+        # Sort by profit (descending) - most profitable first
+        opportunities.sort(key=lambda x: x["profit"], reverse=True)
+
+        self.opportunities = opportunities
+        logger.info("Found %d profitable arbitrage opportunities", len(opportunities))
+        if not persist:
+            return opportunities
+
+        # Write to the sink, or straight to Supabase without one
+        if self.sink is not None:
+            self.sink.submit(self.sport, opportunities)
+        else:
+            write_sports_arbitrage_to_supabase(opportunities)
+
+        # Save results
+        self._save_to_json()
+        return opportunities
 
-    def calculate(self) -> None:
-        """Calculate and print arbitrage opportunities."""
+    def _find_opportunities(self) -> list[dict[str, Any]]:
+        """Evaluate every market listed on both platforms; results are unsorted."""
         # Find all market hashes that exist in both platforms
         common_hashes = set(self.kalshi_markets.keys()) & set(
             self.polymarket_markets.keys()
@@ -39,20 +87,10 @@ class ArbitrageSportsCalculator:
             kalshi_data = self.kalshi_markets[market_hash]
             polymarket_data = self.polymarket_markets[market_hash]
 
-            # Extract team names and prices from both markets by finding all " BUY" keys
-            # This handles cases where question order differs between platforms
-            kalshi_team_prices = {}
-            polymarket_team_prices = {}
-
-            for key, value in kalshi_data.items():
-                if key.endswith(" BUY") and value is not None:
-                    team_name = key.replace(" BUY", "")
-                    kalshi_team_prices[team_name] = value
-
-            for key, value in polymarket_data.items():
-                if key.endswith(" BUY") and value is not None:
-                    team_name = key.replace(" BUY", "")
-                    polymarket_team_prices[team_name] = value
+            # Look up prices by team name, which handles cases where question
+            # order differs between platforms
+            kalshi_team_prices = kalshi_data.prices()
+            polymarket_team_prices = polymarket_data.prices()
 
             # Get the set of teams present in both markets
             common_teams = set(kalshi_team_prices.keys()) & set(
@@ -73,176 +111,127 @@ class ArbitrageSportsCalculator:
             team2_price_polymarket = polymarket_team_prices[team2_name]
 
             # Get question for output (use the one that exists)
-            question = kalshi_data.get("question") or polymarket_data.get("question")
+            question = kalshi_data.question or polymarket_data.question
             if not question:
                 continue
 
             # Determine which platform is which
-            platform_kalshi = kalshi_data.get("platform", "kalshi")
-            platform_polymarket = polymarket_data.get("platform", "polymarket")
-
-            # Try both arbitrage strategies and pick the best one that uses different platforms
-            # Strategy 1: Buy Team1 on platform with lower Team1 price, Team2 on platform with lower Team2 price
-            if team1_price_kalshi < team1_price_polymarket:
-                team1_platform_1 = platform_kalshi
-                team1_price_1 = team1_price_kalshi
-            else:
-                team1_platform_1 = platform_polymarket
-                team1_price_1 = team1_price_polymarket
-
-            if team2_price_kalshi < team2_price_polymarket:
-                team2_platform_1 = platform_kalshi
-                team2_price_1 = team2_price_kalshi
-            else:
-                team2_platform_1 = platform_polymarket
-                team2_price_1 = team2_price_polymarket
-
-            total_cost_1 = team1_price_1 + team2_price_1
-            profit_1 = 1.0 - total_cost_1
-            uses_different_platforms_1 = team1_platform_1 != team2_platform_1
-
-            # Strategy 2: Buy Team1 on platform with higher Team1 price, Team2 on platform with lower Team2 price
-            if team1_price_kalshi > team1_price_polymarket:
-                team1_platform_2 = platform_kalshi
-                team1_price_2 = team1_price_kalshi
-            else:
-                team1_platform_2 = platform_polymarket
-                team1_price_2 = team1_price_polymarket
-
-            if team2_price_kalshi < team2_price_polymarket:
-                team2_platform_2 = platform_kalshi
-                team2_price_2 = team2_price_kalshi
-            else:
-                team2_platform_2 = platform_polymarket
-                team2_price_2 = team2_price_polymarket
-
-            total_cost_2 = team1_price_2 + team2_price_2
-            profit_2 = 1.0 - total_cost_2
-            uses_different_platforms_2 = team1_platform_2 != team2_platform_2
-
-            # Strategy 3: Buy Team1 on platform with lower Team1 price, Team2 on platform with higher Team2 price
-            if team1_price_kalshi < team1_price_polymarket:
-                team1_platform_3 = platform_kalshi
-                team1_price_3 = team1_price_kalshi
-            else:
-                team1_platform_3 = platform_polymarket
-                team1_price_3 = team1_price_polymarket
-
-            if team2_price_kalshi > team2_price_polymarket:
-                team2_platform_3 = platform_kalshi
-                team2_price_3 = team2_price_kalshi
-            else:
-                team2_platform_3 = platform_polymarket
-                team2_price_3 = team2_price_polymarket
-
-            total_cost_3 = team1_price_3 + team2_price_3
-            profit_3 = 1.0 - total_cost_3
-            uses_different_platforms_3 = team1_platform_3 != team2_platform_3
-
-            # Strategy 4: Buy Team1 on platform with higher Team1 price, Team2 on platform with higher Team2 price
-            if team1_price_kalshi > team1_price_polymarket:
-                team1_platform_4 = platform_kalshi
-                team1_price_4 = team1_price_kalshi
-            else:
-                team1_platform_4 = platform_polymarket
-                team1_price_4 = team1_price_polymarket
-
-            if team2_price_kalshi > team2_price_polymarket:
-                team2_platform_4 = platform_kalshi
-                team2_price_4 = team2_price_kalshi
-            else:
-                team2_platform_4 = platform_polymarket
-                team2_price_4 = team2_price_polymarket
-
-            total_cost_4 = team1_price_4 + team2_price_4
-            profit_4 = 1.0 - total_cost_4
-            uses_different_platforms_4 = team1_platform_4 != team2_platform_4
-
-            # Pick the best strategy that uses different platforms
-            strategies = [
-                (
-                    profit_1,
-                    team1_platform_1,
-                    team1_price_1,
-                    team2_platform_1,
-                    team2_price_1,
-                    uses_different_platforms_1,
-                ),
-                (
-                    profit_2,
-                    team1_platform_2,
-                    team1_price_2,
-                    team2_platform_2,
-                    team2_price_2,
-                    uses_different_platforms_2,
-                ),
-                (
-                    profit_3,
-                    team1_platform_3,
-                    team1_price_3,
-                    team2_platform_3,
-                    team2_price_3,
-                    uses_different_platforms_3,
-                ),
-                (
-                    profit_4,
-                    team1_platform_4,
-                    team1_price_4,
-                    team2_platform_4,
-                    team2_price_4,
-                    uses_different_platforms_4,
-                ),
-            ]
-
-            # Filter to only strategies that use different platforms, then pick the best profit
-            valid_strategies = [
-                s for s in strategies if s[5]
-            ]  # s[5] is uses_different_platforms
-            if not valid_strategies:
-                continue  # Skip if no strategy uses different platforms
-
-            # Pick the strategy with the best profit (highest, even if negative for debugging)
-            best_strategy = max(valid_strategies, key=lambda x: x[0])
-            profit, team1_platform, team1_price, team2_platform, team2_price, _ = (
-                best_strategy
+            platform_kalshi = kalshi_data.venue
+            platform_polymarket = polymarket_data.venue
+
+            # Buy each team where it is cheapest, moving one leg to the other
+            # platform when both land on the same one. Price ties keep every
+            # cross-platform pairing in play, so a complement quote matching
+            # the other platform's ask cannot push a cover off the market
+            legs = solve_cover(
+                {
+                    platform_kalshi: {
+                        team1_name: team1_price_kalshi,
+                        team2_name: team2_price_kalshi,
+                    },
+                    platform_polymarket: {
+                        team1_name: team1_price_polymarket,
+                        team2_name: team2_price_polymarket,
+                    },
+                },
+                teams,
             )
+            if legs is None:
+                continue  # Skip if no cover uses different platforms
+            (_, team1_platform, team1_price), (_, team2_platform, team2_price) = legs
 
+            profit = 1.0 - (team1_price + team2_price)
             if profit:  # TODO: Add profit threshold
-                kalshi_link = None
-                if "kalshi link" in kalshi_data:
-                    kalshi_link = kalshi_data["kalshi link"]
-                elif "kalshi link" in polymarket_data:
-                    kalshi_link = polymarket_data["kalshi link"]
-
-                polymarket_link = None
-                if "polymarket link" in kalshi_data:
-                    polymarket_link = kalshi_data["polymarket link"]
-                elif "polymarket link" in polymarket_data:
-                    polymarket_link = polymarket_data["polymarket link"]
-
-                opportunity = {
-                    "question": question,
-                    "date": kalshi_data.get("date") or polymarket_data.get("date"),
-                    "kalshi": f"{team1_name}|{team1_price}",
-                    "polymarket": f"{team2_name}|{team2_price}",
-                    "profit": round(profit, 4),
-                    "kalshi_link": kalshi_link,
-                    "polymarket_link": polymarket_link,
-                    "sport": self.sport,
+                opportunity = self._build_opportunity(
+                    market_hash,
+                    kalshi_data,
+                    polymarket_data,
+                    question,
+                    f"{team1_name}|{team1_price}",
+                    f"{team2_name}|{team2_price}",
+                    profit,
+                )
+                venue_data = {
+                    platform_kalshi: kalshi_data,
+                    platform_polymarket: polymarket_data,
                 }
+                self._add_execution(
+                    opportunity,
+                    [
+                        (team1_name, team1_platform, venue_data[team1_platform]),
+                        (team2_name, team2_platform, venue_data[team2_platform]),
+                    ],
+                )
                 opportunities.append(opportunity)
 
-        # Sort by profit (descending) - most profitable first
-        opportunities.sort(key=lambda x: x["profit"], reverse=True)
-
-        self.opportunities = opportunities
-        logger.info("Found %d profitable arbitrage opportunities", len(opportunities))
+        return opportunities
 
-        # Write to Supabase
-        write_sports_arbitrage_to_supabase(opportunities)
+    def _build_opportunity(
+        self,
+        market_hash: str,
+        kalshi_data: Market | None,
+        polymarket_data: Market | None,
+        question: str,
+        kalshi_leg: str | None,
+        polymarket_leg: str | None,
+        profit: float,
+    ) -> dict[str, Any]:
+        """Build the output record for a market's chosen strategy.
+
+        Either market may be None when the strategy has no leg on its venue.
+        """
+        markets = [m for m in (kalshi_data, polymarket_data) if m is not None]
+        links = {market.venue: market.link for market in markets}
+        return {
+            "hash": market_hash,
+            "question": question,
+            "date": next((market.date for market in markets if market.date), None),
+            "kalshi": kalshi_leg,
+            "polymarket": polymarket_leg,
+            "profit": round(profit, 4),
+            "kalshi_link": links.get("kalshi"),
+            "polymarket_link": links.get("polymarket"),
+            "sport": self.sport,
+        }
+
+    @staticmethod
+    def _add_execution(
+        opportunity: dict[str, Any], legs: Sequence[tuple[str, str, Market]]
+    ) -> None:
+        """Add fees, and executable size when every leg carries an ask ladder.
+
+        ``legs`` holds each bought team with the venue and market it is
+        bought on.
+        """
+        quotes = [market.best(team) for team, _, market in legs]
+        prices = [quote.price for quote in quotes]
+        fees = [
+            fee_per_contract(venue, price)
+            for (_, venue, _), price in zip(legs, prices)
+        ]
+        profit = 1.0 - sum(prices)
+        opportunity["sides"] = [quote.side for quote in quotes]
+        opportunity["fee"] = round(sum(fees), 4)
+        opportunity["net_profit"] = round(profit - sum(fees), 4)
+        opportunity["break_even_size"] = break_even_size(profit, fees)
+
+        ArbitrageSportsCalculator._add_depth(
+            opportunity, [quote.depth for quote in quotes]
+        )
 
-        # Save results
-        self._save_to_json()
+    @staticmethod
+    def _add_depth(
+        opportunity: dict[str, Any], ladders: Sequence[Ladder | None]
+    ) -> None:
+        """Add executable size and profit curve when every ladder is known."""
+        if any(ladder is None for ladder in ladders):
+            return
+        max_size, curve = walk_depth(ladders)
+        opportunity["max_size"] = max_size
+        opportunity["depth_profit"] = round(curve[-1][1], 4) if curve else 0.0
+        opportunity["profit_curve"] = [
+            [size, round(profit, 4)] for size, profit in curve
+        ]
 
     def _save_to_json(self) -> None:
         """Save results to JSON file."""
@@ -0,0 +1,60 @@
+"""Cheapest cross-venue cover of a set of mutually exclusive outcomes."""
+
+from collections.abc import Iterable
+
+# (outcome, venue, price) for one contract bought to cover an outcome
+Leg = tuple[str, str, float]
+
+
+def solve_cover(
+    quotes: dict[str, dict[str, float]],
+    outcomes: Iterable[str],
+    require_cross_venue: bool = True,
+) -> list[Leg] | None:
+    """Find the cheapest set of legs that pays out on every outcome.
+
+    ``quotes`` maps venue -> outcome -> ask price. Each outcome is bought
+    where it is cheapest, which is optimal for mutually exclusive outcomes
+    since one contract per outcome always pays exactly 1. With
+    ``require_cross_venue``, a cover landing entirely on one venue has the
+    leg with the smallest price increase moved to its best other venue.
+    Runs in O(outcomes x venues); returns None if no cover exists.
+    """
+    legs = []
+    # Per outcome: cheapest ask per venue, kept to find a swap if needed
+    asks_by_outcome = []
+    for outcome in outcomes:
+        asks = {
+            venue: venue_quotes[outcome]
+            for venue, venue_quotes in quotes.items()
+            if venue_quotes.get(outcome) is not None
+        }
+        if not asks:
+            return None
+        best_venue = None
+        for venue, price in asks.items():
+            # Later venues win ties, as in the two-venue reference
+            if best_venue is None or price <= asks[best_venue]:
+                best_venue = venue
+        legs.append((outcome, best_venue, asks[best_venue]))
+        asks_by_outcome.append(asks)
+
+    venues = {venue for _, venue, _ in legs}
+    if not require_cross_venue or len(venues) > 1:
+        return legs
+
+    # Everything landed on one venue: move the cheapest-to-move leg elsewhere
+    (only_venue,) = venues
+    best_swap = None
+    for i, asks in enumerate(asks_by_outcome):
+        for venue, price in asks.items():
+            if venue == only_venue:
+                continue
+            delta = price - legs[i][2]
+            if best_swap is None or delta < best_swap[0]:
+                best_swap = (delta, i, venue, price)
+    if best_swap is None:
+        return None
+    _, i, venue, price = best_swap
+    legs[i] = (legs[i][0], venue, price)
+    return legs
@@ -0,0 +1,43 @@
+"""Executable size of an arbitrage, found by walking order book depth."""
+
+from collections.abc import Sequence
+
+# Ask levels of one leg as (price, size), best (lowest) price first
+Ladder = Sequence[Sequence[float]]
+
+
+def walk_depth(ladders: Sequence[Ladder]) -> tuple[float, list[tuple[float, float]]]:
+    """Buy every leg together, level by level, while the cover stays profitable.
+
+    The ladders are merged with one pointer per leg: each step fills the
+    smallest size left at the current levels and advances only the legs
+    whose level ran out, so the walk is linear in the total number of
+    levels. Returns the maximum executable size and the profit curve as
+    (cumulative size, cumulative profit) points, one per step.
+    """
+    if not ladders or not all(ladders):
+        return 0.0, []
+
+    positions = [0] * len(ladders)
+    remaining = [ladder[0][1] for ladder in ladders]
+    size = 0.0
+    profit = 0.0
+    curve = []
+    while True:
+        # Summed fresh each step so float error never accumulates at the edge
+        cost = sum(ladder[i][0] for ladder, i in zip(ladders, positions))
+        if cost >= 1.0:
+            return size, curve
+        step = min(remaining)
+        size += step
+        profit += step * (1.0 - cost)
+        curve.append((size, profit))
+        for leg, ladder in enumerate(ladders):
+            remaining[leg] -= step
+            if remaining[leg] > 0:
+                continue
+            positions[leg] += 1
+            if positions[leg] == len(ladder):
+                # This leg's book is exhausted
+                return size, curve
+            remaining[leg] = ladder[positions[leg]][1]
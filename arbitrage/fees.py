@@ -0,0 +1,52 @@
+"""Per-venue trading fees, precomputed per cent of contract price."""
+
+import math
+from collections.abc import Sequence
+
+# Kalshi taker fee per order: rate x contracts x P x (1 - P), rounded up
+# to the next cent
+KALSHI_FEE_RATE = 0.07
+# Polymarket sports markets charge no trading fee and orders are gasless
+POLYMARKET_FEE_RATE = 0.0
+
+
+def _fee_table(rate: float) -> tuple[float, ...]:
+    """Per-contract fee before rounding at every cent price from 0 to 1."""
+    return tuple(rate * (cents / 100) * (1 - cents / 100) for cents in range(101))
+
+
+# Venue -> per-contract fee indexed by price in cents; unlisted venues are free
+FEE_TABLES: dict[str, tuple[float, ...]] = {
+    "kalshi": _fee_table(KALSHI_FEE_RATE),
+    "polymarket": _fee_table(POLYMARKET_FEE_RATE),
+}
+
+
+def fee_per_contract(venue: str, price: float) -> float:
+    """Look up the unrounded fee for one contract bought at ``price``."""
+    table = FEE_TABLES.get(venue)
+    if table is None:
+        return 0.0
+    return table[round(price * 100)]
+
+
+def order_fee(fee: float, size: int) -> float:
+    """Fee for an order of ``size`` contracts, rounded up to the cent."""
+    # Rounding first keeps float noise such as 7.0000000001 from adding a cent
+    return math.ceil(round(fee * size * 100, 6)) / 100
+
+
+def break_even_size(profit: float, fees: Sequence[float]) -> int | None:
+    """Return the order size from which fees are covered however they round.
+
+    ``fees`` holds the per-contract fee of each leg. Fees are rounded up per
+    order, costing under a cent per charged leg, so small orders pay
+    relatively more; None when the per-contract fees alone eat the whole
+    profit.
+    """
+    margin = profit - sum(fees)
+    if margin <= 0:
+        return None
+    charged = sum(1 for fee in fees if fee > 0)
+    # Solves size x margin >= 0.01 x charged, allowing for float noise
+    return max(1, math.ceil(charged / (100 * margin) - 1e-9))
@@ -0,0 +1,110 @@
+"""Arbitrage solver for any number of outcomes and venues."""
+
+import logging
+from collections import Counter
+from typing import Any
+
+from normalize import Market
+from sinks import OpportunitySink
+
+from .arbitrage_sports import ArbitrageSportsCalculator
+from .cover import solve_cover
+
+logger = logging.getLogger(__name__)
+
+
+class SolverArbitrageCalculator(ArbitrageSportsCalculator):
+    """Arbitrage calculator covering N outcomes across N venues.
+
+    Unlike the two-team reference, markets may list any number of outcomes
+    (e.g. win/draw/win) and ``extra_venues`` adds more venues, keyed by name
+    and mapping market hash to market record like the built-in two. Output
+    keeps the reference format: each venue's field lists its legs as
+    ``"team|price"`` joined by commas, and ``legs`` holds the full cover.
+    The venue clients only list two-outcome moneyline games so far, so
+    three or more outcomes are only exercised by the unit tests.
+    """
+
+    def __init__(
+        self,
+        kalshi_markets: dict[str, Market],
+        polymarket_markets: dict[str, Market],
+        sport: str,
+        sink: OpportunitySink | None = None,
+        extra_venues: dict[str, dict[str, Market]] | None = None,
+        require_cross_venue: bool = True,
+    ) -> None:
+        """Initialize calculator with per-venue normalized markets."""
+        super().__init__(kalshi_markets, polymarket_markets, sport, sink=sink)
+        self.venues = {
+            "kalshi": kalshi_markets,
+            "polymarket": polymarket_markets,
+            **(extra_venues or {}),
+        }
+        self.require_cross_venue = require_cross_venue
+
+    def _find_opportunities(self) -> list[dict[str, Any]]:
+        """Evaluate every market listed on enough venues; results are unsorted."""
+        listings = Counter(
+            market_hash for markets in self.venues.values() for market_hash in markets
+        )
+        min_venues = 2 if self.require_cross_venue else 1
+        candidates = [h for h, count in listings.items() if count >= min_venues]
+        logger.info(
+            "Found %d markets present on at least %d venues",
+            len(candidates),
+            min_venues,
+        )
+
+        opportunities = []
+        for market_hash in candidates:
+            entries = {
+                venue: markets[market_hash]
+                for venue, markets in self.venues.items()
+                if market_hash in markets
+            }
+            quotes = {venue: entry.prices() for venue, entry in entries.items()}
+            # Every outcome any venue lists must be covered, priced or not
+            outcomes = sorted(
+                {team for entry in entries.values() for team in entry.quotes}
+            )
+            if len(outcomes) < 2:
+                continue
+
+            question = next((e.question for e in entries.values() if e.question), None)
+            if not question:
+                continue
+
+            legs = solve_cover(quotes, outcomes, self.require_cross_venue)
+            if legs is None:
+                continue
+            profit = 1.0 - sum(price for _, _, price in legs)
+            if not profit:
+                continue
+
+            venue_legs = {venue: [] for venue in self.venues}
+            for outcome, venue, price in legs:
+                venue_legs[venue].append(f"{outcome}|{price}")
+            opportunity = self._build_opportunity(
+                market_hash,
+                entries.get("kalshi"),
+                entries.get("polymarket"),
+                question,
+                ",".join(venue_legs["kalshi"]) or None,
+                ",".join(venue_legs["polymarket"]) or None,
+                profit,
+            )
+            if not opportunity["date"]:
+                opportunity["date"] = next(
+                    (e.date for e in entries.values() if e.date), None
+                )
+            opportunity["legs"] = [
+                {"outcome": outcome, "venue": venue, "price": price}
+                for outcome, venue, price in legs
+            ]
+            self._add_execution(
+                opportunity,
+                [(outcome, venue, entries[venue]) for outcome, venue, _ in legs],
+            )
+            opportunities.append(opportunity)
+        return opportunities
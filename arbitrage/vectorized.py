@@ -0,0 +1,244 @@
+"""Vectorized arbitrage calculator evaluating all markets with NumPy."""
+
+import logging
+from typing import Any
+
+import numpy as np
+
+from normalize import Market
+
+from .arbitrage_sports import ArbitrageSportsCalculator
+from .fees import FEE_TABLES
+
+logger = logging.getLogger(__name__)
+
+# Venue -> per-contract fee by price in cents, as arrays for fancy indexing
+FEE_ARRAYS = {venue: np.asarray(table) for venue, table in FEE_TABLES.items()}
+NO_FEES = np.zeros(101)
+
+
+def _own_price(market: Market, team: str) -> float | None:
+    """Return the price of a team's own contract, None if unquoted."""
+    quote = market.quotes.get(team)
+    return None if quote is None else quote.price
+
+
+def _complement_price(market: Market, team: str) -> float | None:
+    """Return the price of a team via its opponent's contract, None if unquoted."""
+    quote = market.complements.get(team)
+    return None if quote is None else quote.price
+
+
+class VectorizedArbitrageCalculator(ArbitrageSportsCalculator):
+    """Arbitrage calculator that scores every market with array operations.
+
+    One pass over the matched records gathers each team's own and complement
+    prices per venue into columns. Best sides, the cheapest cross-venue
+    cover, fees, net profit and break-even size are then computed for all
+    markets at once, and output records are only built for markets that
+    pass the profit filter. Output is identical to
+    ``ArbitrageSportsCalculator``, including ordering and rounding.
+    """
+
+    def _find_opportunities(self) -> list[dict[str, Any]]:
+        """Evaluate every market listed on both platforms; results are unsorted."""
+        # Same set construction as the reference, so ties sort identically
+        common_hashes = set(self.kalshi_markets.keys()) & set(
+            self.polymarket_markets.keys()
+        )
+        logger.info("Found %d markets present on both platforms", len(common_hashes))
+
+        markets = []
+        # Own and complement price of team 1 and team 2 on Kalshi, then the
+        # same four on Polymarket; None becomes NaN
+        columns: list[list[float | None]] = [[] for _ in range(8)]
+        for market_hash in common_hashes:
+            kalshi_data = self.kalshi_markets[market_hash]
+            polymarket_data = self.polymarket_markets[market_hash]
+
+            common_teams = kalshi_data.quotes.keys() & polymarket_data.quotes.keys()
+            if len(common_teams) != 2:
+                # Only teams priced on both venues count, as in the reference
+                common_teams = (
+                    kalshi_data.prices().keys() & polymarket_data.prices().keys()
+                )
+                if len(common_teams) != 2:
+                    continue
+            team1_name, team2_name = sorted(common_teams)
+
+            question = kalshi_data.question or polymarket_data.question
+            if not question:
+                continue
+
+            # With one platform name on both sides no cover is cross-venue
+            if kalshi_data.venue == polymarket_data.venue:
+                continue
+
+            markets.append(
+                (
+                    market_hash,
+                    kalshi_data,
+                    polymarket_data,
+                    question,
+                    team1_name,
+                    team2_name,
+                )
+            )
+            column = iter(columns)
+            for data in (kalshi_data, polymarket_data):
+                for team in (team1_name, team2_name):
+                    next(column).append(_own_price(data, team))
+                    next(column).append(_complement_price(data, team))
+
+        if not markets:
+            return []
+
+        (
+            kalshi_own_1,
+            kalshi_complement_1,
+            kalshi_own_2,
+            kalshi_complement_2,
+            polymarket_own_1,
+            polymarket_complement_1,
+            polymarket_own_2,
+            polymarket_complement_2,
+        ) = (np.array(column, dtype=np.float64) for column in columns)
+
+        # Market.best: the own contract unless the complement is cheaper or
+        # the only side quoted
+        def best(own, complement):
+            use_complement = (complement < own) | (
+                np.isnan(own) & ~np.isnan(complement)
+            )
+            return np.where(use_complement, complement, own), use_complement
+
+        kalshi_1, kalshi_no_1 = best(kalshi_own_1, kalshi_complement_1)
+        kalshi_2, kalshi_no_2 = best(kalshi_own_2, kalshi_complement_2)
+        polymarket_1, polymarket_no_1 = best(polymarket_own_1, polymarket_complement_1)
+        polymarket_2, polymarket_no_2 = best(polymarket_own_2, polymarket_complement_2)
+
+        # A team without a price on either venue leaves the market unmatched
+        rows = np.flatnonzero(
+            ~(
+                np.isnan(kalshi_1)
+                | np.isnan(kalshi_2)
+                | np.isnan(polymarket_1)
+                | np.isnan(polymarket_2)
+            )
+        )
+        kalshi_1, kalshi_2 = kalshi_1[rows], kalshi_2[rows]
+        polymarket_1, polymarket_2 = polymarket_1[rows], polymarket_2[rows]
+
+        # Buy each team where it is cheaper, ties falling to Polymarket as in
+        # solve_cover. When both land on one venue, move the leg whose other
+        # price is closest, team 1 winning equal moves like the solver's scan.
+        team1_on_kalshi = kalshi_1 < polymarket_1
+        team2_on_kalshi = kalshi_2 < polymarket_2
+        same_venue = team1_on_kalshi == team2_on_kalshi
+        move_team1 = same_venue & (
+            np.abs(kalshi_1 - polymarket_1) <= np.abs(kalshi_2 - polymarket_2)
+        )
+        team1_on_kalshi ^= move_team1
+        team2_on_kalshi ^= same_venue & ~move_team1
+
+        team1_price = np.where(team1_on_kalshi, kalshi_1, polymarket_1)
+        team2_price = np.where(team2_on_kalshi, kalshi_2, polymarket_2)
+        team1_no = np.where(team1_on_kalshi, kalshi_no_1[rows], polymarket_no_1[rows])
+        team2_no = np.where(team2_on_kalshi, kalshi_no_2[rows], polymarket_no_2[rows])
+        profit = 1.0 - (team1_price + team2_price)
+
+        # Fee tables indexed by cent, rounding half to even like round()
+        kalshi_fees = FEE_ARRAYS.get("kalshi", NO_FEES)
+        polymarket_fees = FEE_ARRAYS.get("polymarket", NO_FEES)
+        team1_cents = np.rint(team1_price * 100).astype(np.intp)
+        team2_cents = np.rint(team2_price * 100).astype(np.intp)
+        team1_fee = np.where(
+            team1_on_kalshi, kalshi_fees[team1_cents], polymarket_fees[team1_cents]
+        )
+        team2_fee = np.where(
+            team2_on_kalshi, kalshi_fees[team2_cents], polymarket_fees[team2_cents]
+        )
+        fee = team1_fee + team2_fee
+        net_profit = profit - fee
+        # fees.break_even_size over every row; only read where margin > 0
+        charged = (team1_fee > 0).astype(np.float64) + (team2_fee > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            size = np.maximum(1.0, np.ceil(charged / (100 * net_profit) - 1e-9))
+
+        kept = np.flatnonzero(profit != 0)
+        # Prices have at most three decimals and fees six with no half-way
+        # fourth decimal, so np.round lands on the same float as round()
+        rounded_profit = np.round(profit, 4)
+        rounded_fee = np.round(fee, 4)
+        rounded_net_profit = np.round(net_profit, 4)
+        # Back to Python scalars once, rather than indexing arrays per market
+        records = zip(
+            rows[kept].tolist(),
+            team1_on_kalshi[kept].tolist(),
+            team2_on_kalshi[kept].tolist(),
+            team1_price[kept].tolist(),
+            team2_price[kept].tolist(),
+            team1_no[kept].tolist(),
+            team2_no[kept].tolist(),
+            rounded_profit[kept].tolist(),
+            rounded_fee[kept].tolist(),
+            rounded_net_profit[kept].tolist(),
+            (net_profit[kept] > 0).tolist(),
+            size[kept].tolist(),
+        )
+
+        opportunities = []
+        for (
+            i,
+            team1_kalshi,
+            team2_kalshi,
+            team1_price_i,
+            team2_price_i,
+            team1_no_i,
+            team2_no_i,
+            profit_i,
+            fee_i,
+            net_profit_i,
+            covers_fees,
+            size_i,
+        ) in records:
+            (
+                market_hash,
+                kalshi_data,
+                polymarket_data,
+                question,
+                team1_name,
+                team2_name,
+            ) = markets[i]
+            team1_market = kalshi_data if team1_kalshi else polymarket_data
+            team2_market = kalshi_data if team2_kalshi else polymarket_data
+            team1_quote = (
+                team1_market.complements if team1_no_i else team1_market.quotes
+            )[team1_name]
+            team2_quote = (
+                team2_market.complements if team2_no_i else team2_market.quotes
+            )[team2_name]
+            links = {
+                kalshi_data.venue: kalshi_data.link,
+                polymarket_data.venue: polymarket_data.link,
+            }
+            # Same fields as _build_opportunity and _add_execution
+            opportunity = {
+                "hash": market_hash,
+                "question": question,
+                "date": kalshi_data.date or polymarket_data.date or None,
+                "kalshi": f"{team1_name}|{team1_price_i}",
+                "polymarket": f"{team2_name}|{team2_price_i}",
+                "profit": profit_i,
+                "kalshi_link": links.get("kalshi"),
+                "polymarket_link": links.get("polymarket"),
+                "sport": self.sport,
+                "sides": [team1_quote.side, team2_quote.side],
+                "fee": fee_i,
+                "net_profit": net_profit_i,
+                "break_even_size": int(size_i) if covers_fees else None,
+            }
+            if team1_quote.depth is not None and team2_quote.depth is not None:
+                self._add_depth(opportunity, [team1_quote.depth, team2_quote.depth])
+            opportunities.append(opportunity)
+        return opportunities
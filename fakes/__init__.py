@@ -0,0 +1,6 @@
+"""Local stand-in servers that replay recorded fixtures for offline runs."""
+
+from .kalshi_server import FakeKalshiServer
+from .polymarket_server import FakePolymarketServer
+
+__all__ = ["FakeKalshiServer", "FakePolymarketServer"]
@@ -0,0 +1,309 @@
+"""Local stand-in for the Kalshi REST and websocket APIs.
+
+Replays a recorded ``data/<sport>_markets_kalshi.json`` fixture: markets are
+grouped into events by ticker prefix and served through the paginated events
+endpoint. Websocket subscribers receive an orderbook snapshot per market and
+then a seeded random walk of orderbook deltas. ``drop_after`` closes the
+socket after that many deltas and ``gap_every`` skips a sequence number, so
+the client's reconnect and resync paths can be exercised offline:
+
+    python -m fakes.kalshi_server --sport nba --port 8766
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+from typing import Any
+
+from aiohttp import web
+
+from kalshi import Kalshi
+from orderbook import OrderBook
+
+logger = logging.getLogger(__name__)
+
+# Contracts resting at each synthetic price level
+LEVEL_SIZE = 100
+
+
+class FakeKalshiServer:
+    """Serve recorded Kalshi fixtures over HTTP and websocket."""
+
+    def __init__(
+        self,
+        sport: str,
+        data_dir: str = "data",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        interval: float = 1.0,
+        seed: int = 0,
+        drop_after: int | None = None,
+        gap_every: int | None = None,
+    ) -> None:
+        """Initialize server for a sport's recorded fixture."""
+        self.sport = sport
+        self.host = host
+        self.port = port
+        self.interval = interval
+        self.random = random.Random(seed)
+        self.drop_after = drop_after
+        self.gap_every = gap_every
+        self.events: list[dict[str, Any]] = []
+        self.markets: dict[str, dict[str, Any]] = {}
+        # Market ticker -> YES bids in ``bids`` and NO bids in ``asks``
+        self.books: dict[str, OrderBook] = {}
+        self.connections = 0
+        self._runner: web.AppRunner | None = None
+        self._load_fixture(os.path.join(data_dir, f"{sport}_markets_kalshi.json"))
+
+    @property
+    def api_url(self) -> str:
+        """Return the REST base URL of the running server."""
+        return f"http://{self.host}:{self.port}/trade-api/v2"
+
+    @property
+    def ws_url(self) -> str:
+        """Return the websocket URL of the running server."""
+        return f"ws://{self.host}:{self.port}/trade-api/ws/v2"
+
+    def client(self, **kwargs: Any) -> Kalshi:
+        """Create a Kalshi client pointed at this server."""
+        return Kalshi(
+            series_ticker=self.sport,
+            market=self.sport,
+            api_url=self.api_url,
+            ws_url=self.ws_url,
+            **kwargs,
+        )
+
+    async def start(self) -> None:
+        """Start serving; binds an ephemeral port when port is 0."""
+        app = web.Application()
+        app.router.add_get("/trade-api/v2/events", self._handle_events)
+        app.router.add_get("/trade-api/v2/markets", self._handle_markets)
+        app.router.add_get(
+            "/trade-api/v2/markets/{ticker}/orderbook", self._handle_orderbook
+        )
+        app.router.add_get("/trade-api/ws/v2", self._handle_ws)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        logger.info(
+            "Fake Kalshi server for %s listening on %s", self.sport, self.api_url
+        )
+
+    async def stop(self) -> None:
+        """Stop serving and close open websockets."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _load_fixture(self, path: str) -> None:
+        """Build events, markets and books from a recorded fixture."""
+        with open(path, encoding="utf-8") as f:
+            fixture = json.load(f)
+
+        events: dict[str, dict[str, Any]] = {}
+        for record in fixture:
+            ticker = record["market_ticker"]
+            event_ticker = "-".join(ticker.split("-")[:2])
+            event = events.setdefault(
+                event_ticker,
+                {
+                    "event_ticker": event_ticker,
+                    "title": record["event_title"],
+                    "markets": [],
+                },
+            )
+            market = {
+                "ticker": ticker,
+                "event_ticker": event_ticker,
+                "yes_bid": record.get("yes_bid"),
+                "yes_ask": record.get("yes_ask"),
+                "no_bid": record.get("no_bid"),
+                "no_ask": record.get("no_ask"),
+            }
+            event["markets"].append(market)
+            self.markets[ticker] = market
+
+            book = OrderBook()
+            book.replace(
+                [(record["yes_bid"], LEVEL_SIZE)] if record.get("yes_bid") else [],
+                [(record["no_bid"], LEVEL_SIZE)] if record.get("no_bid") else [],
+            )
+            self.books[ticker] = book
+        self.events = list(events.values())
+
+    async def _handle_events(self, request: web.Request) -> web.Response:
+        """Serve a page of events, optionally with nested markets."""
+        limit = int(request.query.get("limit", 200))
+        offset = int(request.query.get("cursor") or 0)
+        nested = request.query.get("with_nested_markets") == "true"
+
+        page = []
+        for event in self.events[offset : offset + limit]:
+            event = dict(event)
+            if nested:
+                event["markets"] = [self._market(m["ticker"]) for m in event["markets"]]
+            else:
+                del event["markets"]
+            page.append(event)
+
+        cursor = str(offset + limit) if offset + limit < len(self.events) else ""
+        return web.json_response({"events": page, "cursor": cursor})
+
+    async def _handle_markets(self, request: web.Request) -> web.Response:
+        """Serve markets filtered by event ticker or a list of tickers."""
+        if "tickers" in request.query:
+            tickers = request.query["tickers"].split(",")
+        else:
+            event_ticker = request.query.get("event_ticker")
+            tickers = [
+                ticker
+                for ticker, market in self.markets.items()
+                if event_ticker is None or market["event_ticker"] == event_ticker
+            ]
+        markets = [self._market(t) for t in tickers if t in self.markets]
+        return web.json_response({"markets": markets, "cursor": ""})
+
+    async def _handle_orderbook(self, request: web.Request) -> web.Response:
+        """Serve the YES and NO bid levels of a market's current book."""
+        book = self.books.get(request.match_info["ticker"])
+        if book is None:
+            raise web.HTTPNotFound()
+        return web.json_response(
+            {
+                "orderbook": {
+                    "yes": [[price, size] for price, size in sorted(book.bids.items())],
+                    "no": [[price, size] for price, size in sorted(book.asks.items())],
+                }
+            }
+        )
+
+    def _market(self, ticker: str) -> dict[str, Any]:
+        """Return a market with quotes derived from the current book."""
+        book = self.books[ticker]
+        yes_bid, no_bid = book.best_bid(), book.best_ask()
+        return {
+            **self.markets[ticker],
+            "yes_bid": yes_bid,
+            "yes_ask": 100 - no_bid if no_bid is not None else None,
+            "no_bid": no_bid,
+            "no_ask": 100 - yes_bid if yes_bid is not None else None,
+        }
+
+    async def _handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        """Send snapshots for subscribed markets, then replay orderbook deltas."""
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections += 1
+
+        command = await ws.receive_json()
+        requested = command.get("params", {}).get("market_tickers", [])
+        tickers = [t for t in requested if t in self.books]
+        sid = self.connections
+        await ws.send_json(
+            {"id": command.get("id"), "type": "subscribed", "msg": {"sid": sid}}
+        )
+
+        replay = asyncio.create_task(self._replay(ws, sid, tickers))
+        try:
+            # Keep reading so close handshakes from the client complete
+            async for _ in ws:
+                pass
+        finally:
+            replay.cancel()
+        return ws
+
+    async def _replay(
+        self, ws: web.WebSocketResponse, sid: int, tickers: list[str]
+    ) -> None:
+        """Send snapshots and a random walk of deltas until the socket closes."""
+        seq = 0
+
+        async def send(message_type: str, msg: dict[str, Any]) -> None:
+            nonlocal seq
+            seq += 1
+            if self.gap_every and seq % self.gap_every == 0:
+                seq += 1
+            await ws.send_json(
+                {"type": message_type, "sid": sid, "seq": seq, "msg": msg}
+            )
+
+        for ticker in tickers:
+            book = self.books[ticker]
+            await send(
+                "orderbook_snapshot",
+                {
+                    "market_ticker": ticker,
+                    "yes": [[price, size] for price, size in book.bids.items()],
+                    "no": [[price, size] for price, size in book.asks.items()],
+                },
+            )
+
+        deltas = 0
+        while not ws.closed and tickers:
+            await asyncio.sleep(self.interval)
+            ticker = self.random.choice(tickers)
+            for side, price, delta in self._step(ticker):
+                await send(
+                    "orderbook_delta",
+                    {
+                        "market_ticker": ticker,
+                        "price": price,
+                        "delta": delta,
+                        "side": side,
+                    },
+                )
+            deltas += 1
+            if self.drop_after and deltas >= self.drop_after:
+                await ws.close()
+
+    def _step(self, ticker: str) -> list[tuple[str, int, int]]:
+        """Move one side's best bid by a cent and describe the level deltas."""
+        book = self.books[ticker]
+        side = self.random.choice(("yes", "no"))
+        levels, other = (
+            (book.bids, book.asks) if side == "yes" else (book.asks, book.bids)
+        )
+        if not levels:
+            return []
+        price = max(levels)
+        new_price = price + self.random.choice((-1, 1))
+        # YES bid + NO bid must stay below 100 or the book would be crossed
+        if not 0 < new_price < 100 - (max(other) if other else 0):
+            return []
+        size = levels.pop(price)
+        levels[new_price] = size
+        return [(side, price, -size), (side, new_price, size)]
+
+
+async def _serve(sport: str, port: int, interval: float) -> None:
+    """Run the fake server until interrupted."""
+    server = FakeKalshiServer(sport=sport, port=port, interval=interval)
+    await server.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake Kalshi API server")
+    parser.add_argument("--sport", default="nba", help="Fixture sport to replay")
+    parser.add_argument("--port", type=int, default=8766, help="Port to listen on")
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Seconds between replayed orderbook deltas",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_serve(args.sport, args.port, args.interval))
@@ -0,0 +1,267 @@
+"""Local stand-in for the Polymarket Gamma, CLOB and market websocket APIs.
+
+Replays a recorded ``data/<sport>_markets_polymarket.json`` fixture: each
+market becomes a Gamma market with two synthetic CLOB tokens whose best ask is
+the recorded BUY price. Websocket subscribers receive full book snapshots and
+then a seeded random walk of price changes, so the streaming client can be
+exercised without network access:
+
+    python -m fakes.polymarket_server --sport nba --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+from typing import Any
+
+from aiohttp import web
+
+from normalize.resolver import normalize_name
+from orderbook import OrderBook
+from polymarket import Polymarket
+
+logger = logging.getLogger(__name__)
+
+# Size resting at each synthetic price level
+LEVEL_SIZE = 100.0
+# Gap between the synthetic best bid and best ask
+SPREAD = 0.01
+
+
+class FakePolymarketServer:
+    """Serve recorded Polymarket fixtures over HTTP and websocket."""
+
+    def __init__(
+        self,
+        sport: str,
+        data_dir: str = "data",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        interval: float = 1.0,
+        seed: int = 0,
+    ) -> None:
+        """Initialize server for a sport's recorded fixture."""
+        self.sport = sport
+        self.host = host
+        self.port = port
+        self.interval = interval
+        self.random = random.Random(seed)
+        self.markets: list[dict[str, Any]] = []
+        self.books: dict[str, OrderBook] = {}
+        self._runner: web.AppRunner | None = None
+        self._load_fixture(
+            os.path.join(data_dir, f"{sport}_markets_polymarket.json")
+        )
+
+    @property
+    def base_url(self) -> str:
+        """Return the HTTP base URL of the running server."""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def ws_url(self) -> str:
+        """Return the market channel websocket URL of the running server."""
+        return f"ws://{self.host}:{self.port}/ws/market"
+
+    def client(self, **kwargs: Any) -> Polymarket:
+        """Create a Polymarket client pointed at this server."""
+        return Polymarket(
+            tag_id=self.sport,
+            market=self.sport,
+            gamma_url=self.base_url,
+            clob_url=self.base_url,
+            ws_url=self.ws_url,
+            **kwargs,
+        )
+
+    async def start(self) -> None:
+        """Start serving; binds an ephemeral port when port is 0."""
+        app = web.Application()
+        app.router.add_get("/markets", self._handle_markets)
+        app.router.add_post("/prices", self._handle_prices)
+        app.router.add_post("/books", self._handle_books)
+        app.router.add_get("/ws/market", self._handle_ws)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        logger.info(
+            "Fake Polymarket server for %s listening on %s", self.sport, self.base_url
+        )
+
+    async def stop(self) -> None:
+        """Stop serving and close open websockets."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _load_fixture(self, path: str) -> None:
+        """Build Gamma markets and token books from a recorded fixture."""
+        with open(path, encoding="utf-8") as f:
+            fixture = json.load(f)
+
+        for entry in fixture:
+            question = entry.get("question", "")
+            teams = Polymarket._parse_teams(question)
+            if teams is None:
+                continue
+            # Recorded keys may spell names differently, e.g. "MapleLeafs BUY"
+            # for "Maple Leafs", so look prices up by normalized team name
+            asks = {
+                normalize_name(key[: -len(" BUY")]): value
+                for key, value in entry.items()
+                if key.endswith(" BUY")
+            }
+            slug = entry.get("slug", question)
+            tokens = [f"{slug}-{i}" for i in range(len(teams))]
+            for token, team in zip(tokens, teams):
+                book = OrderBook()
+                ask = asks.get(normalize_name(team))
+                if ask is not None:
+                    bid = round(ask - SPREAD, 2)
+                    book.replace(
+                        [(bid, LEVEL_SIZE)] if bid > 0 else [], [(ask, LEVEL_SIZE)]
+                    )
+                self.books[token] = book
+
+            self.markets.append(
+                {
+                    "question": question,
+                    "slug": slug,
+                    # Mid-afternoon UTC keeps the date unchanged in US Eastern
+                    "endDate": f"{entry.get('date')}T20:00:00Z",
+                    "clobTokenIds": json.dumps(tokens),
+                    "closed": False,
+                    "acceptingOrders": True,
+                }
+            )
+
+    async def _handle_markets(self, request: web.Request) -> web.Response:
+        """Serve a Gamma markets page."""
+        limit = int(request.query.get("limit", 100))
+        offset = int(request.query.get("offset", 0))
+        return web.json_response(self.markets[offset : offset + limit])
+
+    async def _handle_prices(self, request: web.Request) -> web.Response:
+        """Serve batched CLOB prices."""
+        prices: dict[str, dict[str, str]] = {}
+        for item in await request.json():
+            book = self.books.get(item["token_id"])
+            if book is None:
+                continue
+            # SELL quotes the best ask, BUY the best bid
+            price = book.best_ask() if item["side"] == "SELL" else book.best_bid()
+            if price is not None:
+                prices.setdefault(item["token_id"], {})[item["side"]] = str(price)
+        return web.json_response(prices)
+
+    async def _handle_books(self, request: web.Request) -> web.Response:
+        """Serve batched CLOB order book snapshots."""
+        tokens = [item["token_id"] for item in await request.json()]
+        return web.json_response(
+            [self._book_event(token) for token in tokens if token in self.books]
+        )
+
+    async def _handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        """Send book snapshots for subscribed tokens, then replay price changes."""
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        subscription = await ws.receive_json()
+        tokens = [t for t in subscription.get("assets_ids", []) if t in self.books]
+        await ws.send_json([self._book_event(token) for token in tokens])
+
+        replay = asyncio.create_task(self._replay(ws, tokens))
+        try:
+            # Keep reading so close handshakes from the client complete
+            async for _ in ws:
+                pass
+        finally:
+            replay.cancel()
+        return ws
+
+    async def _replay(self, ws: web.WebSocketResponse, tokens: list[str]) -> None:
+        """Send a random walk of price changes until the socket closes."""
+        while not ws.closed and tokens:
+            await asyncio.sleep(self.interval)
+            token = self.random.choice(tokens)
+            changes = self._step(token)
+            if changes:
+                await ws.send_json(
+                    {"event_type": "price_change", "price_changes": changes}
+                )
+
+    def _book_event(self, token: str) -> dict[str, Any]:
+        """Build a full book snapshot event for a token."""
+        book = self.books[token]
+        return {
+            "event_type": "book",
+            "asset_id": token,
+            "bids": [
+                {"price": str(price), "size": str(size)}
+                for price, size in book.bids.items()
+            ],
+            "asks": [
+                {"price": str(price), "size": str(size)}
+                for price, size in book.asks.items()
+            ],
+        }
+
+    def _step(self, token: str) -> list[dict[str, Any]]:
+        """Move a token's best ask by one tick and describe the level changes."""
+        book = self.books[token]
+        ask = book.best_ask()
+        if ask is None:
+            return []
+        new_ask = round(ask + self.random.choice((-SPREAD, SPREAD)), 2)
+        # Keep the book uncrossed and inside the (0, 1) price range
+        if not (book.best_bid() or 0) < new_ask < 1:
+            return []
+        book.set_level("ask", ask, 0)
+        book.set_level("ask", new_ask, LEVEL_SIZE)
+        return [
+            self._level_change(token, ask, 0),
+            self._level_change(token, new_ask, LEVEL_SIZE),
+        ]
+
+    def _level_change(self, token: str, price: float, size: float) -> dict[str, Any]:
+        """Describe an ask level update in the market channel format."""
+        book = self.books[token]
+        return {
+            "asset_id": token,
+            "price": str(price),
+            "size": str(size),
+            "side": "SELL",
+            "best_bid": str(book.best_bid() or 0),
+            "best_ask": str(book.best_ask() or 0),
+        }
+
+
+async def _serve(sport: str, port: int, interval: float) -> None:
+    """Run the fake server until interrupted."""
+    server = FakePolymarketServer(sport=sport, port=port, interval=interval)
+    await server.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake Polymarket API server")
+    parser.add_argument("--sport", default="nba", help="Fixture sport to replay")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Seconds between replayed price changes",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_serve(args.sport, args.port, args.interval))
@@ -0,0 +1,126 @@
+"""Shared HTTP session pool used by all venue clients."""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import aiohttp
+from yarl import URL
+
+from rate_limit import DEFAULT_RETRY_AFTER, RateLimiter, parse_retry_after
+from request_policy import RequestPolicy
+
+logger = logging.getLogger(__name__)
+
+# Total open connections across all hosts
+DEFAULT_LIMIT = 100
+# Open connections per (host, port, ssl) triple
+DEFAULT_LIMIT_PER_HOST = 20
+# Seconds to cache resolved DNS entries
+DEFAULT_DNS_TTL = 300
+# Seconds an idle keep-alive connection stays in the pool
+DEFAULT_KEEPALIVE_TIMEOUT = 60
+# Times a request is re-sent after an HTTP 429
+MAX_THROTTLE_RETRIES = 3
+
+
+def create_session(
+    limit: int = DEFAULT_LIMIT,
+    limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+    dns_ttl: int = DEFAULT_DNS_TTL,
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+) -> aiohttp.ClientSession:
+    """Create a long-lived session with a pooled, DNS-caching connector.
+
+    Must be called from within a running event loop. The caller owns the
+    session and is responsible for closing it.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        use_dns_cache=True,
+        ttl_dns_cache=dns_ttl,
+        keepalive_timeout=keepalive_timeout,
+    )
+    logger.info(
+        "Created shared HTTP session (limit=%d, limit_per_host=%d, dns_ttl=%ds)",
+        limit,
+        limit_per_host,
+        dns_ttl,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+@asynccontextmanager
+async def session_scope(
+    session: aiohttp.ClientSession | None,
+) -> AsyncIterator[aiohttp.ClientSession]:
+    """Yield the injected session, or a short-lived one if none was provided."""
+    if session is not None:
+        yield session
+        return
+
+    async with aiohttp.ClientSession() as own_session:
+        yield own_session
+
+
+async def request_json(
+    session: aiohttp.ClientSession,
+    method: str,
+    url: str,
+    params: dict[str, Any] | None = None,
+    body: Any = None,
+    rate_limiter: RateLimiter | None = None,
+    timeout: float = 30,
+    policy: RequestPolicy | None = None,
+) -> Any:
+    """Send a request through the host's rate limiter and return the JSON body.
+
+    Throttled (HTTP 429) responses feed back into the limiter, which honors
+    Retry-After before the request is re-sent. With a ``policy`` each HTTP
+    attempt also runs under its deadline, retry and hedging rules; waiting
+    for a limiter token or a Retry-After pause happens outside the deadline,
+    so a throttled host is not mistaken for a slow one.
+    """
+    host = URL(url).host or ""
+    host_limiter = rate_limiter.for_url(url) if rate_limiter is not None else None
+    acquire = host_limiter.acquire if host_limiter is not None else None
+
+    async def send() -> Any:
+        start_time = time.monotonic()
+        async with session.request(
+            method, url, params=params, json=body, timeout=timeout
+        ) as response:
+            response.raise_for_status()
+            data = await response.json()
+        if host_limiter is not None:
+            host_limiter.on_success()
+        if policy is not None:
+            # Only time on the wire counts, not waiting for a token
+            policy.record(host, time.monotonic() - start_time)
+        return data
+
+    for attempt in range(MAX_THROTTLE_RETRIES + 1):
+        try:
+            if policy is None:
+                if acquire is not None:
+                    await acquire()
+                return await send()
+            return await policy.run(host, send, acquire)
+        except aiohttp.ClientResponseError as e:
+            if e.status != 429:
+                raise
+            retry_after = parse_retry_after(
+                e.headers.get("Retry-After") if e.headers else None
+            )
+            if host_limiter is not None:
+                host_limiter.on_throttled(retry_after)
+            if attempt >= MAX_THROTTLE_RETRIES:
+                raise
+            if host_limiter is None:
+                await asyncio.sleep(
+                    retry_after if retry_after is not None else DEFAULT_RETRY_AFTER
+                )
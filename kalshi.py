@@ -1,12 +1,19 @@
 """Kalshi API client for fetching prediction market data."""
 
 import asyncio
+import json
 import logging
 import time
+from collections.abc import AsyncIterator, Callable, Collection, Iterable
 from typing import Any
 
 import aiohttp
 
+from http_session import request_json, session_scope
+from orderbook import OrderBook
+from rate_limit import RateLimiter
+from request_policy import RequestPolicy
+from ticks import TickRecorder
 from utils import parse_date, save_to_json
 
 logger = logging.getLogger(__name__)
@@ -15,132 +22,572 @@ logger = logging.getLogger(__name__)
 class Kalshi:
     """Kalshi Client"""
 
-    BASE_EVENTS_URL = "https://api.elections.kalshi.com/trade-api/v2/events"
-    BASE_MARKETS_URL = "https://api.elections.kalshi.com/trade-api/v2/markets"
+    API_URL = "https://api.elections.kalshi.com/trade-api/v2"
+    WS_URL = "wss://api.elections.kalshi.com/trade-api/ws/v2"
+    # Maximum page size accepted by the events endpoint
+    EVENTS_PAGE_LIMIT = 200
+    # Seconds between full event discoveries; prices refresh every call
+    DEFAULT_DISCOVERY_INTERVAL = 600.0
+    # Seconds before a failed rediscovery is retried while streaming
+    DISCOVERY_RETRY_DELAY = 30.0
+    # Tickers per price-only markets request
+    TICKER_BATCH_SIZE = 100
+    # Top-of-book quote fields kept on every market record, in cents
+    QUOTE_SIDES = ("yes_bid", "yes_ask", "no_bid", "no_ask")
+    # Websocket channels subscribed in streaming mode ("orderbook_delta", "ticker")
+    STREAM_CHANNELS = ("orderbook_delta",)
+    # Reconnect backoff bounds for the websocket, in seconds
+    WS_RECONNECT_DELAY = 1.0
+    WS_MAX_RECONNECT_DELAY = 30.0
 
-    def __init__(self, series_ticker: str, market: str) -> None:
-        """Initialize Kalshi client with series ticker."""
+    def __init__(
+        self,
+        series_ticker: str,
+        market: str,
+        session: aiohttp.ClientSession | None = None,
+        bulk: bool = True,
+        api_url: str = API_URL,
+        ws_url: str = WS_URL,
+        ws_headers: Callable[[], dict[str, str]] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        request_policy: RequestPolicy | None = None,
+        discovery_interval: float = DEFAULT_DISCOVERY_INTERVAL,
+        depth: bool = False,
+        recorder: TickRecorder | None = None,
+    ) -> None:
+        """Initialize Kalshi client with series ticker and optional shared session.
+
+        With ``bulk`` enabled, markets are pulled as nested fields of paginated
+        event pages instead of one markets request per event. ``ws_headers``
+        is called on every websocket connect to build authentication headers.
+        A shared ``rate_limiter`` keeps all clients within the venue's budget
+        and ``request_policy`` bounds slow or failed requests.
+        The event catalog is rediscovered every ``discovery_interval`` seconds;
+        calls in between only refresh prices for the cached tickers.
+        With ``depth``, every market's order book is fetched as well and its
+        YES and NO ask ladders kept as ``yes_asks`` and ``no_asks`` (cents,
+        best first). A ``recorder`` receives every quote as it arrives, keyed
+        by market ticker.
+        """
         self.series_ticker = series_ticker
         self.status_filter = "open"
         self.market_data = []
+        # Market ticker -> live order book, maintained in streaming mode
+        self.books: dict[str, OrderBook] = {}
         self.market = market
+        self.session = session
+        self.bulk = bulk
+        self.events_url = f"{api_url}/events"
+        self.markets_url = f"{api_url}/markets"
+        self.ws_url = ws_url
+        self.ws_headers = ws_headers
+        self.rate_limiter = rate_limiter
+        self.request_policy = request_policy
+        self.discovery_interval = discovery_interval
+        self.discovered_at: float | None = None
+        self.depth = depth
+        self.recorder = recorder
 
     async def get_market_data(self) -> list[dict[str, Any]]:
-        """Fetch and process market data from events."""
+        """Fetch and process market data, rediscovering events when stale."""
         start_time = time.time()
+        # Discovery pulls quotes along with the catalog, so no refresh is needed
+        if not await self.ensure_discovered():
+            await self.refresh_prices()
+        elif self.depth:
+            await self.refresh_depth()
+
+        elapsed_time = time.time() - start_time
         logger.info(
-            "Starting Kalshi market data fetch for series: %s", self.series_ticker
+            "Kalshi market data fetch completed in %.2f seconds. Loaded %d markets",
+            elapsed_time,
+            len(self.market_data),
         )
+        save_to_json(self.market_data, f"data/{self.market}_markets_kalshi.json")
+        return self.market_data
 
-        async with aiohttp.ClientSession() as session:
-            events = await self._fetch_events(session)
-            logger.info("Fetched %d events from Kalshi", len(events))
-
-            # Fetch markets for all events concurrently
-            tasks = [
-                self._fetch_markets_for_event(session, event["event_ticker"])
-                for event in events
-            ]
-            markets_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            results = []
-            for i, event in enumerate(events):
-                markets_result = markets_results[i]
-                if isinstance(markets_result, Exception):
-                    logger.error(
-                        "Failed to fetch markets for event %s: %s",
-                        event["event_ticker"],
-                        markets_result,
-                    )
-                    continue
+    def discovery_due(self) -> bool:
+        """Return True when the cached event catalog needs refreshing."""
+        return (
+            self.discovered_at is None
+            or time.time() - self.discovered_at >= self.discovery_interval
+        )
 
-                markets = markets_result
-                event_title = event["title"]
+    async def ensure_discovered(self) -> bool:
+        """Rediscover the event catalog if stale and return True if it ran.
 
-                for m in markets:
-                    ticker = m.get("ticker", "")
-                    parts = ticker.split("-")
-
-                    game_date = None
-                    if len(parts) >= 2:
-                        date_segment = parts[1][:7]
-                        game_date = parse_date(date_segment)
-
-                    results.append(
-                        {
-                            "event_title": event_title,
-                            "market_ticker": ticker,
-                            "game_date": game_date,
-                            "yes_bid": m.get("yes_bid"),
-                            "yes_ask": m.get("yes_ask"),
-                            "no_bid": m.get("no_bid"),
-                            "no_ask": m.get("no_ask"),
-                        }
-                    )
+        Discovered records already carry quotes, so they are fresh on return.
+        """
+        if not self.discovery_due():
+            return False
 
-        elapsed_time = time.time() - start_time
         logger.info(
-            "Kalshi market data fetch completed in %.2f seconds. Loaded %d markets",
-            elapsed_time,
-            len(results),
+            "Starting Kalshi market discovery for series: %s", self.series_ticker
         )
-        self.market_data = results
-        save_to_json(self.market_data, f"data/{self.market}_markets_kalshi.json")
+        async with session_scope(self.session) as session:
+            if self.bulk:
+                self.market_data = await self._collect_bulk(session)
+            else:
+                self.market_data = await self._collect_per_event(session)
+        self.discovered_at = time.time()
+        if self.recorder is not None:
+            self.recorder.record_catalog(
+                self.market,
+                "kalshi",
+                {
+                    record["market_ticker"]: {
+                        "event_title": record["event_title"],
+                        "game_date": record["game_date"],
+                    }
+                    for record in self.market_data
+                },
+                self.discovered_at,
+            )
+        self._record_quotes(self.market_data)
+        return True
+
+    async def refresh_prices(
+        self, tickers: Collection[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Refresh quotes for cached markets, limited to ``tickers`` if given.
+
+        In depth mode the order books are fetched alongside the quotes.
+        """
+        logger.info(
+            "Refreshing Kalshi prices for %d cached markets in series: %s",
+            len(self.market_data) if tickers is None else len(tickers),
+            self.series_ticker,
+        )
+        async with session_scope(self.session) as session:
+            if self.depth:
+                await asyncio.gather(
+                    self._refresh_prices(session, tickers),
+                    self._refresh_depth(session, tickers),
+                )
+                return self.market_data
+            return await self._refresh_prices(session, tickers)
+
+    async def refresh_depth(
+        self, tickers: Collection[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch order books for cached markets, limited to ``tickers`` if given."""
+        async with session_scope(self.session) as session:
+            return await self._refresh_depth(session, tickers)
+
+    async def _refresh_prices(
+        self,
+        session: aiohttp.ClientSession,
+        tickers: Collection[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Refresh quotes for the cached markets by ticker."""
+        records = {record["market_ticker"]: record for record in self.market_data}
+        if tickers is None:
+            tickers = list(records)
+        else:
+            tickers = [ticker for ticker in tickers if ticker in records]
+        chunks = [
+            tickers[i : i + self.TICKER_BATCH_SIZE]
+            for i in range(0, len(tickers), self.TICKER_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(
+            *[self._fetch_markets_by_ticker(session, chunk) for chunk in chunks],
+            return_exceptions=True,
+        )
+
+        for chunk, markets in zip(chunks, results):
+            if isinstance(markets, Exception):
+                logger.error("Failed to refresh Kalshi prices: %s", markets)
+                markets = []
+            # Stale quotes are worse than none, so unreturned markets are cleared
+            returned = {m.get("ticker"): m for m in markets}
+            for ticker in chunk:
+                market = returned.get(ticker, {})
+                for key in self.QUOTE_SIDES:
+                    records[ticker][key] = market.get(key)
+            self._record_quotes(records[ticker] for ticker in chunk)
+        return self.market_data
+
+    async def _refresh_depth(
+        self,
+        session: aiohttp.ClientSession,
+        tickers: Collection[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Replace each cached market's ask ladder with a fresh book snapshot."""
+        records = {record["market_ticker"]: record for record in self.market_data}
+        if tickers is None:
+            tickers = list(records)
+        else:
+            tickers = [ticker for ticker in tickers if ticker in records]
+        results = await asyncio.gather(
+            *[self._fetch_orderbook(session, ticker) for ticker in tickers],
+            return_exceptions=True,
+        )
+
+        failed_count = 0
+        for ticker, orderbook in zip(tickers, results):
+            if isinstance(orderbook, Exception):
+                failed_count += 1
+                orderbook = {}
+            # Kalshi books hold bids only: a NO bid at p is a YES ask at 100 - p
+            book = self.books.setdefault(ticker, OrderBook())
+            book.replace(
+                [(price, size) for price, size in orderbook.get("yes") or []],
+                [(100 - price, size) for price, size in orderbook.get("no") or []],
+            )
+            records[ticker]["yes_asks"] = book.ask_levels()
+            records[ticker]["no_asks"] = self._no_asks(book)
+        if failed_count:
+            logger.error("Failed to fetch %d Kalshi order books", failed_count)
+        return self.market_data
+
+    async def _fetch_orderbook(
+        self, session: aiohttp.ClientSession, ticker: str
+    ) -> dict[str, Any]:
+        """Fetch the YES and NO bid levels of a market."""
+        url = f"{self.markets_url}/{ticker}/orderbook"
+        data = await self._fetch_json(session, url, {})
+        return data.get("orderbook") or {}
+
+    async def _fetch_markets_by_ticker(
+        self, session: aiohttp.ClientSession, tickers: list[str]
+    ) -> list[dict[str, Any]]:
+        """Fetch markets for a list of tickers, following the cursor."""
+        params = {"tickers": ",".join(tickers), "limit": len(tickers)}
+        markets = []
+        while True:
+            data = await self._fetch_json(session, self.markets_url, params)
+            markets.extend(data.get("markets", []))
+            cursor = data.get("cursor")
+            if not cursor or not data.get("markets"):
+                return markets
+            params["cursor"] = cursor
+
+    async def stream_market_data(self) -> AsyncIterator[dict[str, Any]]:
+        """Stream incremental market updates over the Kalshi websocket.
+
+        Takes a REST snapshot for the series, subscribes to every market and
+        yields each market record whose top of book changed. ``market_data``
+        always reflects the latest state. On disconnect or a sequence gap the
+        socket is reopened and resubscribed, which resyncs every book from a
+        fresh snapshot. Events are rediscovered every ``discovery_interval``
+        seconds, after which the socket is resubscribed to the new markets.
+        """
+        await self.get_market_data()
+        if not self.market_data:
+            logger.warning(
+                "No Kalshi markets to stream for series: %s", self.series_ticker
+            )
+            return
+
+        delay = self.WS_RECONNECT_DELAY
+        async with session_scope(self.session) as session:
+            while True:
+                records = {
+                    record["market_ticker"]: record for record in self.market_data
+                }
+                # Drop books of markets that are no longer listed
+                self.books = {
+                    ticker: book
+                    for ticker, book in self.books.items()
+                    if ticker in records
+                }
+                headers = self.ws_headers() if self.ws_headers else None
+                resync = False
+                discovered_at = self.discovered_at
+                try:
+                    async with session.ws_connect(
+                        self.ws_url, headers=headers, heartbeat=30
+                    ) as ws:
+                        await ws.send_json(
+                            {
+                                "id": 1,
+                                "cmd": "subscribe",
+                                "params": {
+                                    "channels": list(self.STREAM_CHANNELS),
+                                    "market_tickers": list(records),
+                                },
+                            }
+                        )
+                        logger.info(
+                            "Subscribed to %d Kalshi markets for series: %s",
+                            len(records),
+                            self.series_ticker,
+                        )
+                        rediscovery = asyncio.create_task(self._rediscover(ws))
+                        last_seq: dict[int, int] = {}
+                        try:
+                            async for msg in ws:
+                                if msg.type != aiohttp.WSMsgType.TEXT:
+                                    break
+                                delay = self.WS_RECONNECT_DELAY
+                                data = json.loads(msg.data)
+                                seq = data.get("seq")
+                                if seq is not None:
+                                    sid = data.get("sid")
+                                    expected = last_seq.get(sid, seq - 1) + 1
+                                    if seq != expected:
+                                        logger.warning(
+                                            "Kalshi sequence gap on sid %s: expected %d, got %d",
+                                            sid,
+                                            expected,
+                                            seq,
+                                        )
+                                        resync = True
+                                        break
+                                    last_seq[sid] = seq
+                                record = self._apply_stream_message(data, records)
+                                if record is not None:
+                                    yield record
+                        finally:
+                            rediscovery.cancel()
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.error("Kalshi websocket error: %s", e)
+
+                if resync or self.discovered_at != discovered_at:
+                    # Resubscribe straight away to get fresh snapshots
+                    continue
+                logger.info("Reconnecting Kalshi websocket in %.1f seconds", delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.WS_MAX_RECONNECT_DELAY)
+
+    async def _rediscover(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Rediscover events when due, then close ``ws`` to resubscribe.
+
+        Failed discoveries keep the socket open and are retried after
+        ``DISCOVERY_RETRY_DELAY`` seconds.
+        """
+        while True:
+            due_in = self.discovered_at + self.discovery_interval - time.time()
+            await asyncio.sleep(max(due_in, 0.0))
+            try:
+                await self.ensure_discovered()
+            except Exception as e:
+                logger.error("Kalshi rediscovery failed: %s", e)
+            else:
+                await ws.close()
+                return
+            await asyncio.sleep(self.DISCOVERY_RETRY_DELAY)
+
+    def _apply_stream_message(
+        self, data: dict[str, Any], records: dict[str, dict[str, Any]]
+    ) -> dict[str, Any] | None:
+        """Apply a websocket message and return the record if its quotes changed."""
+        message_type = data.get("type")
+        msg = data.get("msg", {})
+        ticker = msg.get("market_ticker")
+        record = records.get(ticker)
+        if record is None:
+            return None
+
+        if message_type == "ticker":
+            quotes = {
+                "yes_bid": msg.get("yes_bid"),
+                "yes_ask": msg.get("yes_ask"),
+            }
+        elif message_type in ("orderbook_snapshot", "orderbook_delta"):
+            # Kalshi books hold bids only: a NO bid at p is a YES ask at 100 - p
+            book = self.books.setdefault(ticker, OrderBook())
+            if message_type == "orderbook_snapshot":
+                book.replace(
+                    [(price, size) for price, size in msg.get("yes", [])],
+                    [(100 - price, size) for price, size in msg.get("no", [])],
+                )
+            elif msg.get("side") == "yes":
+                book.adjust_level("bid", msg["price"], msg["delta"])
+            else:
+                book.adjust_level("ask", 100 - msg["price"], msg["delta"])
+            quotes = {"yes_bid": book.best_bid(), "yes_ask": book.best_ask()}
+            if self.depth:
+                quotes["yes_asks"] = book.ask_levels()
+                quotes["no_asks"] = self._no_asks(book)
+        else:
+            return None
+
+        yes_bid, yes_ask = quotes["yes_bid"], quotes["yes_ask"]
+        quotes["no_bid"] = 100 - yes_ask if yes_ask is not None else None
+        quotes["no_ask"] = 100 - yes_bid if yes_bid is not None else None
+        if all(record.get(key) == value for key, value in quotes.items()):
+            return None
+        record.update(quotes)
+        self._record_quotes([record])
+        return record
+
+    def _record_quotes(self, records: Iterable[dict[str, Any]]) -> None:
+        """Pass the records' top-of-book quotes to the recorder, if any."""
+        if self.recorder is None:
+            return
+        self.recorder.record_quotes(
+            self.market,
+            "kalshi",
+            [
+                (record["market_ticker"], side, record.get(side))
+                for record in records
+                for side in self.QUOTE_SIDES
+            ],
+        )
+
+    @staticmethod
+    def _no_asks(book: OrderBook) -> list[tuple[int, int]]:
+        """Return the NO ask ladder, mirrored from the YES bids, best first."""
+        return [(100 - price, size) for price, size in book.bid_levels()]
+
+    async def _collect_bulk(
+        self, session: aiohttp.ClientSession
+    ) -> list[dict[str, Any]]:
+        """Collect markets from event pages with nested markets."""
+        results = []
+        event_count = 0
+        async for events in self._iter_event_pages(session, with_nested_markets=True):
+            event_count += len(events)
+            for event in events:
+                event_title = event["title"]
+                for m in event.get("markets", []):
+                    results.append(self._market_record(event_title, m))
+        logger.info("Fetched %d events from Kalshi", event_count)
         return results
 
-    async def _fetch_events(
+    async def _collect_per_event(
         self, session: aiohttp.ClientSession
     ) -> list[dict[str, Any]]:
-        """Fetch open events from Kalshi API."""
+        """Collect markets with one markets request per event."""
+        events = await self._fetch_events(session)
+        logger.info("Fetched %d events from Kalshi", len(events))
+
+        # Fetch markets for all events concurrently
+        tasks = [
+            self._fetch_markets_for_event(session, event["event_ticker"])
+            for event in events
+        ]
+        markets_results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        results = []
+        for i, event in enumerate(events):
+            markets_result = markets_results[i]
+            if isinstance(markets_result, Exception):
+                logger.error(
+                    "Failed to fetch markets for event %s: %s",
+                    event["event_ticker"],
+                    markets_result,
+                )
+                continue
+
+            event_title = event["title"]
+            for m in markets_result:
+                results.append(self._market_record(event_title, m))
+        return results
+
+    @staticmethod
+    def _market_record(event_title: str, market: dict[str, Any]) -> dict[str, Any]:
+        """Build a market record from a raw Kalshi market."""
+        ticker = market.get("ticker", "")
+        parts = ticker.split("-")
+
+        game_date = None
+        if len(parts) >= 2:
+            date_segment = parts[1][:7]
+            game_date = parse_date(date_segment)
+
+        return {
+            "event_title": event_title,
+            "market_ticker": ticker,
+            "game_date": game_date,
+            "yes_bid": market.get("yes_bid"),
+            "yes_ask": market.get("yes_ask"),
+            "no_bid": market.get("no_bid"),
+            "no_ask": market.get("no_ask"),
+        }
+
+    async def _fetch_json(
+        self, session: aiohttp.ClientSession, url: str, params: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Fetch JSON data from URL."""
+        return await request_json(
+            session,
+            "GET",
+            url,
+            params=params,
+            rate_limiter=self.rate_limiter,
+            policy=self.request_policy,
+        )
+
+    async def _iter_event_pages(
+        self, session: aiohttp.ClientSession, with_nested_markets: bool = False
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield pages of open events for the series, following the cursor."""
         start_time = time.time()
-        params = {"series_ticker": self.series_ticker, "status": self.status_filter}
-        logger.debug("Fetching events from Kalshi with params: %s", params)
+        params = {
+            "series_ticker": self.series_ticker,
+            "status": self.status_filter,
+            "limit": self.EVENTS_PAGE_LIMIT,
+        }
+        if with_nested_markets:
+            params["with_nested_markets"] = "true"
 
-        try:
-            async with session.get(
-                self.BASE_EVENTS_URL, params=params, timeout=30
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
+        page_count = 0
+        while True:
+            logger.debug("Fetching events from Kalshi with params: %s", params)
+            try:
+                data = await self._fetch_json(session, self.events_url, params)
+            except Exception as e:
                 elapsed_time = time.time() - start_time
-                events = data.get("events", [])
-                logger.debug(
-                    "Fetched %d events in %.2f seconds", len(events), elapsed_time
+                logger.error(
+                    "Failed to fetch events page %d from Kalshi after %.2f seconds: %s",
+                    page_count + 1,
+                    elapsed_time,
+                    e,
                 )
-                return events
-        except Exception as e:
-            elapsed_time = time.time() - start_time
-            logger.error(
-                "Failed to fetch events from Kalshi after %.2f seconds: %s",
-                elapsed_time,
-                e,
+                raise
+
+            page_count += 1
+            events = data.get("events", [])
+            logger.debug(
+                "Fetched events page %d (%d events) in %.2f seconds",
+                page_count,
+                len(events),
+                time.time() - start_time,
             )
-            raise
+            yield events
+
+            cursor = data.get("cursor")
+            if not cursor or not events:
+                break
+            params["cursor"] = cursor
+
+    async def _fetch_events(
+        self, session: aiohttp.ClientSession
+    ) -> list[dict[str, Any]]:
+        """Fetch all open events from Kalshi API."""
+        events = []
+        async for page in self._iter_event_pages(session):
+            events.extend(page)
+        return events
 
     async def _fetch_markets_for_event(
         self, session: aiohttp.ClientSession, event_ticker: str
     ) -> list[dict[str, Any]]:
-        """Fetch markets for a specific event."""
+        """Fetch markets for a specific event, following the cursor."""
 
         start_time = time.time()
         params = {"event_ticker": event_ticker}
         logger.debug("Fetching markets for event: %s", event_ticker)
 
         try:
-            async with session.get(
-                self.BASE_MARKETS_URL, params=params, timeout=30
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
-                elapsed_time = time.time() - start_time
-                markets = data.get("markets", [])
-                logger.debug(
-                    "Fetched %d markets for event %s in %.2f seconds",
-                    len(markets),
-                    event_ticker,
-                    elapsed_time,
-                )
-                return markets
+            markets = []
+            while True:
+                data = await self._fetch_json(session, self.markets_url, params)
+                markets.extend(data.get("markets", []))
+                cursor = data.get("cursor")
+                if not cursor or not data.get("markets"):
+                    break
+                params["cursor"] = cursor
+            elapsed_time = time.time() - start_time
+            logger.debug(
+                "Fetched %d markets for event %s in %.2f seconds",
+                len(markets),
+                event_ticker,
+                elapsed_time,
+            )
+            return markets
         except Exception as e:
             elapsed_time = time.time() - start_time
             logger.error(
@@ -0,0 +1,61 @@
+"""Signed request headers for Kalshi's authenticated websocket."""
+
+import base64
+import os
+import time
+from collections.abc import Callable
+
+from dotenv import load_dotenv
+from yarl import URL
+
+load_dotenv()
+
+# Environment variables holding the API key ID and its RSA private key file
+KEY_ID_ENV = "KALSHI_API_KEY_ID"
+PRIVATE_KEY_PATH_ENV = "KALSHI_PRIVATE_KEY_PATH"
+
+
+def ws_headers(
+    key_id: str, private_key_path: str, ws_url: str
+) -> Callable[[], dict[str, str]]:
+    """Return a callable building fresh signed headers for a websocket connect.
+
+    Kalshi signs "<timestamp ms>GET<path>" with RSA-PSS over SHA-256, so
+    headers are rebuilt on every connect. Needs the ``cryptography`` package,
+    which is only imported when streaming Kalshi.
+    """
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import padding
+
+    with open(private_key_path, "rb") as f:
+        private_key = serialization.load_pem_private_key(f.read(), password=None)
+    path = URL(ws_url).path
+
+    def build() -> dict[str, str]:
+        timestamp = str(int(time.time() * 1000))
+        signature = private_key.sign(
+            f"{timestamp}GET{path}".encode(),
+            padding.PSS(
+                mgf=padding.MGF1(hashes.SHA256()),
+                salt_length=padding.PSS.DIGEST_LENGTH,
+            ),
+            hashes.SHA256(),
+        )
+        return {
+            "KALSHI-ACCESS-KEY": key_id,
+            "KALSHI-ACCESS-SIGNATURE": base64.b64encode(signature).decode(),
+            "KALSHI-ACCESS-TIMESTAMP": timestamp,
+        }
+
+    return build
+
+
+def ws_headers_from_env(ws_url: str) -> Callable[[], dict[str, str]]:
+    """Build the websocket header callable from the Kalshi API key env vars."""
+    key_id = os.getenv(KEY_ID_ENV)
+    private_key_path = os.getenv(PRIVATE_KEY_PATH_ENV)
+    if not key_id or not private_key_path:
+        raise RuntimeError(
+            f"Streaming Kalshi needs {KEY_ID_ENV} and {PRIVATE_KEY_PATH_ENV} set"
+        )
+    return ws_headers(key_id, private_key_path, ws_url)
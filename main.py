@@ -4,12 +4,37 @@ import argparse
 import asyncio
 import logging
 
-from sports import cfb, cs2, nba, nfl, nhl
+from arbitrage import ENGINES
+from http_session import DEFAULT_DNS_TTL, DEFAULT_LIMIT_PER_HOST, create_session
+from kalshi import Kalshi
+from kalshi_auth import ws_headers_from_env
+from normalize import SPORT_CONFIG
+from rate_limit import RateLimiter
+from request_policy import DEFAULT_DEADLINE, RequestPolicy
+from sinks import SINKS, create_sink
+from sports import run_scheduler
+from ticks import TickRecorder
 
 logger = logging.getLogger(__name__)
 
 
-async def main(quiet: bool = False, enabled_markets: list[str] | None = None):
+async def main(
+    quiet: bool = False,
+    enabled_markets: list[str] | None = None,
+    limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+    dns_ttl: int = DEFAULT_DNS_TTL,
+    stream: bool = False,
+    match_first: bool = False,
+    pipeline: bool = False,
+    request_deadline: float = DEFAULT_DEADLINE,
+    hedge: bool = True,
+    sink_name: str = "supabase",
+    sink_path: str | None = None,
+    engine: str = "python",
+    depth: bool = False,
+    record_dir: str | None = None,
+    stream_kalshi: bool = False,
+):
     """Main entry point for the prediction market arbitrage script."""
     if not quiet:
         logging.basicConfig(
@@ -21,35 +46,55 @@ async def main(quiet: bool = False, enabled_markets: list[str] | None = None):
     else:
         logging.disable(logging.CRITICAL)
 
-    # Map market names to their corresponding functions
-    market_functions = {
-        "nba": nba,
-        "nfl": nfl,
-        "nhl": nhl,
-        "cfb": cfb,
-        "cs2": cs2,
-    }
-
     # If no markets specified, run all markets
     if enabled_markets is None or len(enabled_markets) == 0:
-        enabled_markets = list(market_functions.keys())
-
-    # Get the functions for enabled markets
-    tasks = [
-        market_functions[market]()
-        for market in enabled_markets
-        if market in market_functions
-    ]
+        enabled_markets = list(SPORT_CONFIG.keys())
 
-    if not tasks:
+    enabled_markets = [m for m in enabled_markets if m in SPORT_CONFIG]
+    if not enabled_markets:
         logger.warning(
             "No valid markets specified. Available markets: %s",
-            ", ".join(market_functions.keys()),
+            ", ".join(SPORT_CONFIG.keys()),
         )
         return
 
-    logger.info("Running markets: %s", ", ".join(enabled_markets))
-    await asyncio.gather(*tasks)
+    # The Kalshi websocket needs signed headers from the API key env vars
+    kalshi_ws_headers = ws_headers_from_env(Kalshi.WS_URL) if stream_kalshi else None
+
+    # Share one connection pool, one set of host budgets and one latency
+    # history across every venue client and sport loop
+    rate_limiter = RateLimiter()
+    request_policy = RequestPolicy(deadline=request_deadline, hedge=hedge)
+    # Persistence happens in the background so it never stalls fetches
+    sink_options = {"path": sink_path} if sink_path else {}
+    sink = create_sink(sink_name, **sink_options)
+    await sink.start()
+    recorder = TickRecorder(record_dir) if record_dir else None
+    if recorder is not None:
+        await recorder.start()
+    try:
+        async with create_session(
+            limit_per_host=limit_per_host, dns_ttl=dns_ttl
+        ) as session:
+            await run_scheduler(
+                enabled_markets,
+                session,
+                rate_limiter,
+                request_policy,
+                stream=stream,
+                match_first=match_first,
+                pipeline=pipeline,
+                sink=sink,
+                engine=engine,
+                depth=depth,
+                recorder=recorder,
+                stream_kalshi=stream_kalshi,
+                kalshi_ws_headers=kalshi_ws_headers,
+            )
+    finally:
+        if recorder is not None:
+            await recorder.close()
+        await sink.close()
 
 
 if __name__ == "__main__":
@@ -60,47 +105,108 @@ if __name__ == "__main__":
         action="store_true",
         help="Disable logging output",
     )
+    for sport in SPORT_CONFIG:
+        parser.add_argument(
+            f"--{sport}",
+            action="store_true",
+            help=f"Enable {sport.upper()} market",
+        )
+    parser.add_argument(
+        "--limit-per-host",
+        type=int,
+        default=DEFAULT_LIMIT_PER_HOST,
+        help="Maximum pooled connections per host",
+    )
     parser.add_argument(
-        "--nba",
+        "--dns-ttl",
+        type=int,
+        default=DEFAULT_DNS_TTL,
+        help="Seconds to cache DNS lookups",
+    )
+    parser.add_argument(
+        "--stream",
         action="store_true",
-        help="Enable NBA market",
+        help="Stream Polymarket order books instead of polling prices",
     )
     parser.add_argument(
-        "--nfl",
+        "--stream-kalshi",
         action="store_true",
-        help="Enable NFL market",
+        help="With --stream, also stream Kalshi order books (needs "
+        "KALSHI_API_KEY_ID and KALSHI_PRIVATE_KEY_PATH)",
     )
     parser.add_argument(
-        "--nhl",
+        "--match-first",
         action="store_true",
-        help="Enable NHL market",
+        help="Only request prices for markets listed on both venues",
     )
     parser.add_argument(
-        "--cfb",
+        "--pipeline",
         action="store_true",
-        help="Enable CFB market",
+        help="Fetch the next snapshot while the current one is processed",
+    )
+    parser.add_argument(
+        "--request-deadline",
+        type=float,
+        default=DEFAULT_DEADLINE,
+        help="Seconds before a request attempt is abandoned and retried",
     )
     parser.add_argument(
-        "--cs2",
+        "--no-hedge",
         action="store_true",
-        help="Enable CS2 market",
+        help="Disable duplicate requests for calls slower than p95 latency",
+    )
+    parser.add_argument(
+        "--sink",
+        choices=list(SINKS),
+        default="supabase",
+        help="Where to write arbitrage opportunities",
+    )
+    parser.add_argument(
+        "--sink-path",
+        help="Database or file path for the sqlite and jsonl sinks",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=list(ENGINES),
+        default="python",
+        help="Arbitrage calculator implementation",
+    )
+    parser.add_argument(
+        "--depth",
+        action="store_true",
+        help="Fetch order books and report executable size per opportunity",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="DIR",
+        help="Append every received quote to compressed tick logs in DIR",
     )
     args = parser.parse_args()
+    if args.stream_kalshi and not args.stream:
+        parser.error("--stream-kalshi requires --stream")
 
     # Collect enabled markets from arguments
-    enabled_markets = []
-    if args.nba:
-        enabled_markets.append("nba")
-    if args.nfl:
-        enabled_markets.append("nfl")
-    if args.nhl:
-        enabled_markets.append("nhl")
-    if args.cfb:
-        enabled_markets.append("cfb")
-    if args.cs2:
-        enabled_markets.append("cs2")
+    enabled_markets = [sport for sport in SPORT_CONFIG if getattr(args, sport)]
 
     # If no markets specified, pass None to run all markets
     enabled_markets = enabled_markets if enabled_markets else None
 
-    asyncio.run(main(quiet=args.quiet, enabled_markets=enabled_markets))
+    asyncio.run(
+        main(
+            quiet=args.quiet,
+            enabled_markets=enabled_markets,
+            limit_per_host=args.limit_per_host,
+            dns_ttl=args.dns_ttl,
+            stream=args.stream,
+            match_first=args.match_first,
+            pipeline=args.pipeline,
+            request_deadline=args.request_deadline,
+            hedge=not args.no_hedge,
+            sink_name=args.sink,
+            sink_path=args.sink_path,
+            engine=args.engine,
+            depth=args.depth,
+            record_dir=args.record,
+            stream_kalshi=args.stream_kalshi,
+        )
+    )
@@ -0,0 +1,14 @@
+-- Key the sports table by market hash so the Supabase sink can upsert and
+-- delete only the rows that changed, and store the fee-aware results next to
+-- the gross profit. Until this is applied the sink replaces each sport's
+-- rows on every snapshot.
+alter table sports add column if not exists hash text;
+alter table sports add column if not exists fee double precision;
+alter table sports add column if not exists net_profit double precision;
+alter table sports add column if not exists break_even_size integer;
+
+-- Rows written before the migration have no hash; the next snapshot
+-- rewrites them.
+delete from sports where hash is null;
+
+create unique index if not exists sports_hash_key on sports (hash);
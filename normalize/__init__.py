@@ -1,5 +1,7 @@
 """Market normalization module."""
 
-from .normalize_sports_market import NormalizeSportsMarket
+from .normalize_sports_market import SPORT_CONFIG, NormalizeSportsMarket
+from .records import Market, Quote
+from .resolver import TeamResolver
 
-__all__ = ["NormalizeSportsMarket"]
+__all__ = ["SPORT_CONFIG", "Market", "NormalizeSportsMarket", "Quote", "TeamResolver"]
@@ -5,7 +5,7 @@ import os
 from collections import defaultdict
 from typing import Any
 
-from utils import save_to_json
+from utils import save_to_json, saving_enabled
 
 from .constants import (
     CFB_KALSHI_BASE_URL,
@@ -20,39 +20,61 @@ from .constants import (
     NHL_TEAM_MAPPING,
     POLYMARKET_URL,
 )
+from .records import Market, Quote
+from .resolver import TeamResolver
 
+# Sport registry: Kalshi series, Polymarket tag, team names and cycle period.
+# Adding a sport only takes a new entry here.
 SPORT_CONFIG: dict[str, dict[str, Any]] = {
     "nba": {
         "team_map": NBA_TEAM_MAPPING,
         "kalshi_url": NBA_KALSHI_BASE_URL,
         "polymarket_url": POLYMARKET_URL,
         "output_prefix": "nba",
+        "series_ticker": "KXNBAGAME",
+        "tag_id": "745",
+        "interval": 30.0,
     },
     "nhl": {
         "team_map": NHL_TEAM_MAPPING,
         "kalshi_url": NHL_KALSHI_BASE_URL,
         "polymarket_url": POLYMARKET_URL,
         "output_prefix": "nhl",
+        "series_ticker": "KXNHLGAME",
+        "tag_id": "899",
+        "interval": 30.0,
     },
     "nfl": {
         "team_map": NFL_TEAM_MAPPING,
         "kalshi_url": NFL_KALSHI_BASE_URL,
         "polymarket_url": POLYMARKET_URL,
         "output_prefix": "nfl",
+        "series_ticker": "KXNFLGAME",
+        "tag_id": "450",
+        "interval": 30.0,
     },
     "cfb": {
         "team_map": CFB_TEAM_MAPPING,
         "kalshi_url": CFB_KALSHI_BASE_URL,
         "polymarket_url": POLYMARKET_URL,
         "output_prefix": "cfb",
+        "series_ticker": "KXNCAAFGAME",
+        "tag_id": "100351",
+        "interval": 30.0,
     },
     "cs2": {
         "team_map": CS2_TEAM_MAPPING,
         "kalshi_url": CS2_KALSHI_BASE_URL,
         "polymarket_url": POLYMARKET_URL,
         "output_prefix": "cs2",
+        "series_ticker": "KXCSGOGAME",
+        "tag_id": "100780",
+        "interval": 30.0,
     },
 }
+# Team resolvers are built once, here, and shared by every normalizer
+for _config in SPORT_CONFIG.values():
+    _config["resolver"] = TeamResolver(_config["team_map"])
 
 
 class NormalizeSportsMarket:
@@ -69,28 +91,32 @@ class NormalizeSportsMarket:
         self.kalshi_markets = kalshi_markets
         self.sport = sport
         config = SPORT_CONFIG[sport]
-        self.team_name_map = config["team_map"]
+        self.resolver: TeamResolver = config["resolver"]
         self.kalshi_base_url = config["kalshi_url"]
         self.polymarket_base_url = config["polymarket_url"]
         self.output_prefix = config.get("output_prefix", sport)
 
     def normalize_markets(
         self, output_dir: str = "data", save: bool = True
-    ) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
-        """Normalize and optionally save market data from both platforms."""
-        os.makedirs(output_dir, exist_ok=True)
+    ) -> tuple[dict[str, Market], dict[str, Market]]:
+        """Normalize and optionally save market data from both platforms.
+
+        Returns records keyed by market hash; the inputs are not modified.
+        """
         normalized_kalshi = self._normalize_kalshi_markets()
         normalized_polymarket = self._normalize_polymarket_markets()
 
-        if save:
+        # Records only become dicts when a snapshot is actually written
+        if save and saving_enabled():
+            os.makedirs(output_dir, exist_ok=True)
             save_to_json(
-                normalized_kalshi,
+                {h: market.to_dict() for h, market in normalized_kalshi.items()},
                 path=os.path.join(
                     output_dir, f"{self.output_prefix}_markets_kalshi_normalized.json"
                 ),
             )
             save_to_json(
-                normalized_polymarket,
+                {h: market.to_dict() for h, market in normalized_polymarket.items()},
                 path=os.path.join(
                     output_dir,
                     f"{self.output_prefix}_markets_polymarket_normalized.json",
@@ -99,14 +125,58 @@ class NormalizeSportsMarket:
 
         return normalized_kalshi, normalized_polymarket
 
-    def _normalize_kalshi_markets(self) -> dict[str, dict[str, Any]]:
-        """Normalize Kalshi market data to standard format."""
+    def match_markets(self) -> tuple[set[str], set[str]]:
+        """Find games listed on both platforms from discovery metadata alone.
+
+        Returns the Kalshi market tickers and the raw Polymarket questions of
+        the matched games. Prices are not read, so this can run before any
+        quotes are fetched. Neither input list is modified.
+        """
+        kalshi_hashes, polymarket_hashes = self.market_hashes()
+        common = set(kalshi_hashes.values()) & set(polymarket_hashes.values())
+        tickers = {t for t, h in kalshi_hashes.items() if h in common}
+        questions = {q for q, h in polymarket_hashes.items() if h in common}
+        return tickers, questions
+
+    def market_hashes(self) -> tuple[dict[str, str], dict[str, str]]:
+        """Map Kalshi tickers and raw Polymarket questions to their game hash.
+
+        Only discovery metadata is read. Markets that do not form a two-team
+        game are left out.
+        """
+        kalshi_hashes = {}
+        for question, date_str, team_list in self._group_kalshi_games():
+            market_hash = self._market_hash(question, date_str)
+            for team in team_list:
+                kalshi_hashes[team["market"]["market_ticker"]] = market_hash
+
+        polymarket_hashes = {}
+        for market in self.polymarket_markets:
+            if "question" not in market:
+                continue
+            question = self._polymarket_question(market["question"])
+            if question is None:
+                # Futures and other non head-to-head questions never match
+                continue
+            polymarket_hashes[market["question"]] = self._market_hash(
+                question, market["date"]
+            )
+        return kalshi_hashes, polymarket_hashes
+
+    def _group_kalshi_games(
+        self,
+    ) -> list[tuple[str, str, list[dict[str, Any]]]]:
+        """Group Kalshi markets into two-team games.
+
+        Returns (question, date, teams) tuples where teams holds the mapped
+        name and market of each side, sorted by name.
+        """
         grouped_markets = defaultdict(list)
         for market in self.kalshi_markets:
             key = (market["event_title"], market["game_date"])
             grouped_markets[key].append(market)
 
-        normalized = []
+        games = []
 
         for (_, game_date), markets in grouped_markets.items():
             if len(markets) != 2:
@@ -116,101 +186,146 @@ class NormalizeSportsMarket:
             for market in markets:
                 ticker = market["market_ticker"]
                 team_abbr = ticker.split("-")[-1] if "-" in ticker else None
+                team_name = self.resolver.resolve(team_abbr) if team_abbr else None
 
-                if team_abbr and team_abbr in self.team_name_map:
-                    team_name = self.team_name_map[team_abbr]
+                if team_name:
                     teams[team_abbr] = {"name": team_name, "market": market}
 
             if len(teams) != 2:
                 continue
 
             team_list = sorted(teams.values(), key=lambda x: x["name"])
-            team1 = team_list[0]
-            team2 = team_list[1]
+            question = " vs ".join(sorted(team["name"] for team in team_list))
+            date_str = game_date if game_date else ""
+            games.append((question, date_str, team_list))
 
-            team1_buy = (
-                team1["market"]["yes_ask"] / 100.0
-                if team1["market"]["yes_ask"] is not None
-                else None
+        return games
+
+    def _normalize_kalshi_markets(self) -> dict[str, Market]:
+        """Normalize Kalshi market data to market records."""
+        normalized = {}
+
+        for question, date_str, team_list in self._group_kalshi_games():
+            quotes = {}
+            complements = {}
+            for team, opponent in (team_list, team_list[::-1]):
+                team_name = team["name"].replace(" ", "")
+                # Ask ladders are present when the client fetched depth
+                quotes[team_name] = self._kalshi_quote(
+                    team_name, team["market"]["yes_ask"], team["market"].get("yes_asks")
+                )
+                # NO on the opponent's market pays out when this team wins
+                complements[team_name] = self._kalshi_quote(
+                    team_name,
+                    opponent["market"].get("no_ask"),
+                    opponent["market"].get("no_asks"),
+                    side="no",
+                )
+
+            ticker = team_list[1]["market"]["market_ticker"]
+            event_ticker = "-".join(ticker.split("-")[:2])
+            market_hash = self._market_hash(question, date_str)
+            normalized[market_hash] = Market(
+                market_hash,
+                question,
+                date_str,
+                "kalshi",
+                f"{self.kalshi_base_url}{event_ticker}",
+                quotes,
+                complements,
             )
-            team2_buy = (
-                team2["market"]["yes_ask"] / 100.0
-                if team2["market"]["yes_ask"] is not None
+
+        return normalized
+
+    @staticmethod
+    def _kalshi_quote(
+        team_name: str,
+        ask: int | None,
+        ladder: list[tuple[int, int]] | None,
+        side: str = "yes",
+    ) -> Quote:
+        """Build a quote from a Kalshi ask and ask ladder in cents."""
+        return Quote(
+            team_name,
+            round(ask / 100.0, 2) if ask is not None else None,
+            (
+                [(round(price / 100.0, 2), size) for price, size in ladder]
+                if ladder is not None
                 else None
-            )
+            ),
+            side,
+        )
 
-            question = " vs ".join(sorted([team1["name"], team2["name"]]))
-            date_str = game_date if game_date else ""
-            team1_name = team1["name"].replace(" ", "")
-            team2_name = team2["name"].replace(" ", "")
-
-            normalized_entry = {
-                "question": question,
-                "date": date_str,
-                "platform": "kalshi",
-                f"{team1_name} BUY": (
-                    round(team1_buy, 2) if team1_buy is not None else None
-                ),
-                f"{team2_name} BUY": (
-                    round(team2_buy, 2) if team2_buy is not None else None
-                ),
-                "kalshi link": (
-                    f"{self.kalshi_base_url}"
-                    f"{'-'.join(market['market_ticker'].split('-')[:2])}"
-                ),
-            }
+    def _normalize_polymarket_markets(self) -> dict[str, Market]:
+        """Normalize Polymarket market data to market records."""
+        normalized = {}
 
-            normalized.append(normalized_entry)
+        for market in self.polymarket_markets:
+            if "question" not in market:
+                continue
+            question = self._polymarket_question(market["question"])
+            if question is None:
+                # Futures and other non head-to-head questions never match
+                continue
+            market_hash = self._market_hash(question, market["date"])
+
+            teams = [key[: -len(" BUY")] for key in market if key.endswith(" BUY")]
+            quotes = {}
+            complements = {}
+            for team in teams:
+                team_name = self._polymarket_team(team)
+                quotes[team_name] = Quote(
+                    team_name, market[f"{team} BUY"], market.get(f"{team} DEPTH")
+                )
+            if len(teams) == 2:
+                for team, opponent in (teams, teams[::-1]):
+                    # A buy at 1 - p matches a bid of p on the opponent's token
+                    bid = market.get(f"{opponent} BID")
+                    bids = market.get(f"{opponent} BID DEPTH")
+                    team_name = self._polymarket_team(team)
+                    complements[team_name] = Quote(
+                        team_name,
+                        round(1.0 - bid, 4) if bid is not None else None,
+                        (
+                            [(round(1.0 - price, 4), size) for price, size in bids]
+                            if bids is not None
+                            else None
+                        ),
+                        side="no",
+                    )
+
+            normalized[market_hash] = Market(
+                market_hash,
+                question,
+                market["date"],
+                "polymarket",
+                f"{self.polymarket_base_url}{market['slug']}",
+                quotes,
+                complements,
+            )
 
-        normalized = self._create_hash_and_save_as_map(normalized)
         return normalized
 
-    def _normalize_polymarket_markets(self) -> dict[str, dict[str, Any]]:
-        """Normalize Polymarket market data to standard format."""
-        for market in self.polymarket_markets:
-            if "question" in market:
-                question = market["question"]
-                # Clean up CS2 questions: remove "Counter-Strike:" prefix and "(BO1/BO3)" suffix
-                if "Counter-Strike:" in question:
-                    question = question.split("Counter-Strike:")[-1].strip()
-                if "(" in question:
-                    question = question.split("(")[0].strip()
-                question = question.replace(" vs. ", " vs ")
-                market["question"] = question
-
-                # Normalize BUY keys to remove spaces (match Kalshi format)
-                buy_keys_to_update = {}
-                for key in list(market.keys()):
-                    if key.endswith(" BUY") and " " in key:
-                        team_name = key.replace(" BUY", "")
-                        normalized_team_name = team_name.replace(" ", "")
-                        if normalized_team_name != team_name:
-                            buy_keys_to_update[key] = f"{normalized_team_name} BUY"
-
-                # Update BUY keys
-                for old_key, new_key in buy_keys_to_update.items():
-                    if old_key in market:
-                        market[new_key] = market.pop(old_key)
-
-            market["platform"] = "polymarket"
-            market["polymarket link"] = f"{self.polymarket_base_url}{market['slug']}"
-
-        self.polymarket_markets = self._create_hash_and_save_as_map(
-            self.polymarket_markets
-        )
-        return self.polymarket_markets
+    def _polymarket_question(self, question: str) -> str | None:
+        """Reduce a Polymarket question to "Team1 vs Team2" in canonical names.
 
-    def _create_hash_and_save_as_map(self, data: list[dict]) -> dict:
-        """Create hash for each entry and return as dictionary map."""
-        for entry in data:
-            team1, team2 = sorted(entry["question"].split(" vs "))
-            date = entry["date"]
-            key = f"{team1}{team2}{date}"
-            entry["hash"] = hashlib.sha256(key.encode()).hexdigest()
+        Returns None for questions that do not name two teams.
+        """
+        teams = self.resolver.teams(question)
+        if teams is None:
+            return None
+        return " vs ".join(teams)
 
-        new_map = {}
+    def _polymarket_team(self, team: str) -> str:
+        """Return the canonical name of a Polymarket team, without spaces.
 
-        for entry in data:
-            new_map[entry["hash"]] = entry
+        Spaces are dropped to match the Kalshi format; unknown names are kept.
+        """
+        return (self.resolver.resolve(team) or team).replace(" ", "")
 
-        return new_map
+    @staticmethod
+    def _market_hash(question: str, date: str) -> str:
+        """Hash a game by its sorted team names and date."""
+        team1, team2 = sorted(question.split(" vs "))
+        key = f"{team1}{team2}{date}"
+        return hashlib.sha256(key.encode()).hexdigest()
@@ -0,0 +1,124 @@
+"""Compact typed records for normalized markets."""
+
+from typing import Any
+
+# Ask levels as (price, size), best (lowest) price first
+Ladder = list[tuple[float, float]]
+
+
+class Quote:
+    """Price to buy one team's win on one venue, with its ask ladder if fetched.
+
+    ``side`` names the instrument: "yes" buys the team's own contract and
+    "no" buys the opposite side of the opponent's contract, which pays out
+    on the same result.
+    """
+
+    __slots__ = ("team", "price", "depth", "side")
+
+    def __init__(
+        self,
+        team: str,
+        price: float | None,
+        depth: Ladder | None = None,
+        side: str = "yes",
+    ) -> None:
+        """Initialize quote; a price of None means the team has no ask."""
+        self.team = team
+        self.price = price
+        self.depth = depth
+        self.side = side
+
+
+class Market:
+    """A game as listed on one venue, with a quote per team."""
+
+    __slots__ = ("hash", "question", "date", "venue", "link", "quotes", "complements")
+
+    def __init__(
+        self,
+        market_hash: str,
+        question: str,
+        date: str | None,
+        venue: str,
+        link: str | None = None,
+        quotes: dict[str, Quote] | None = None,
+        complements: dict[str, Quote] | None = None,
+    ) -> None:
+        """Initialize market record keyed by the cross-venue game hash."""
+        self.hash = market_hash
+        self.question = question
+        self.date = date
+        self.venue = venue
+        self.link = link
+        # Team name without spaces -> quote on the team's own contract
+        self.quotes: dict[str, Quote] = quotes if quotes is not None else {}
+        # Team name without spaces -> quote via the opponent's contract
+        self.complements: dict[str, Quote] = (
+            complements if complements is not None else {}
+        )
+
+    def best(self, team: str) -> Quote | None:
+        """Return the cheaper priced side for a team, preferring its own contract."""
+        quote = self.quotes.get(team)
+        complement = self.complements.get(team)
+        if quote is None or quote.price is None:
+            return complement if complement and complement.price is not None else None
+        if complement is not None and complement.price is not None:
+            if complement.price < quote.price:
+                return complement
+        return quote
+
+    def prices(self) -> dict[str, float]:
+        """Map each team with an ask on either side to its cheapest price."""
+        prices = {}
+        for team in self.quotes:
+            quote = self.best(team)
+            if quote is not None:
+                prices[team] = quote.price
+        return prices
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the JSON layout of the saved normalized files."""
+        entry: dict[str, Any] = {
+            "question": self.question,
+            "date": self.date,
+            "platform": self.venue,
+        }
+        for team, quote in self.quotes.items():
+            entry[f"{team} BUY"] = quote.price
+            if quote.depth is not None:
+                entry[f"{team} DEPTH"] = quote.depth
+        for team, quote in self.complements.items():
+            entry[f"{team} COMPLEMENT"] = quote.price
+            if quote.depth is not None:
+                entry[f"{team} COMPLEMENT DEPTH"] = quote.depth
+        if self.link is not None:
+            entry[f"{self.venue} link"] = self.link
+        entry["hash"] = self.hash
+        return entry
+
+    @classmethod
+    def from_dict(cls, entry: dict[str, Any]) -> "Market":
+        """Build a record from the JSON layout written by ``to_dict``."""
+        venue = entry["platform"]
+        quotes = {}
+        complements = {}
+        for key, value in entry.items():
+            if key.endswith(" BUY"):
+                team = key[: -len(" BUY")]
+                quotes[team] = Quote(team, value, entry.get(f"{team} DEPTH"))
+            elif key.endswith(" COMPLEMENT"):
+                team = key[: -len(" COMPLEMENT")]
+                complements[team] = Quote(
+                    team, value, entry.get(f"{key} DEPTH"), side="no"
+                )
+        return cls(
+            entry["hash"],
+            entry["question"],
+            entry.get("date"),
+            venue,
+            entry.get(f"{venue} link"),
+            quotes,
+            complements,
+        )
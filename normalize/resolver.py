@@ -0,0 +1,75 @@
+"""Team name resolution from the per-sport alias tables."""
+
+import re
+from functools import lru_cache
+
+# Parsed questions kept per resolver
+QUESTION_CACHE_SIZE = 4096
+
+# Optional "Prefix:" and "(Suffix)" around the teams, as in CS2 questions
+# like "Counter-Strike: Team1 vs Team2 (BO3)"
+QUESTION_PATTERN = re.compile(r"^(?:[^:]*:)?\s*(?P<teams>.+?)\s*(?:\([^)]*\))?\s*$")
+SEPARATOR_PATTERN = re.compile(r"\s+vs\.?\s+")
+NAME_PATTERN = re.compile(r"[^\W_]+")
+
+
+def normalize_name(name: str) -> str:
+    """Reduce a name to its lowercase letters and digits.
+
+    "Trail Blazers", "TrailBlazers" and "trail-blazers" all become
+    "trailblazers".
+    """
+    return "".join(NAME_PATTERN.findall(name.casefold()))
+
+
+def split_question(question: str) -> tuple[str, str] | None:
+    """Return the two team names of a head-to-head question as written."""
+    match = QUESTION_PATTERN.match(question)
+    if match is None:
+        return None
+    teams = SEPARATOR_PATTERN.split(match["teams"])
+    if len(teams) != 2:
+        return None
+    return teams[0], teams[1]
+
+
+class TeamResolver:
+    """Map a sport's team aliases and market questions to canonical names.
+
+    Built once from a ``*_TEAM_MAPPING`` table, whose values are the canonical
+    names. Every alias and canonical name is indexed by its normalized form,
+    so case, spacing and punctuation variants resolve with one lookup. Names
+    must match an alias as a whole: prefix matching would pair an academy
+    roster like "MOUZ NXT" with its main team. Parsed questions are cached.
+    """
+
+    def __init__(
+        self, mapping: dict[str, str], cache_size: int = QUESTION_CACHE_SIZE
+    ) -> None:
+        """Index the aliases and canonical names of ``mapping``."""
+        self.index: dict[str, str] = {}
+        for team in mapping.values():
+            self.index.setdefault(normalize_name(team), team)
+        for alias, team in mapping.items():
+            self.index.setdefault(normalize_name(alias), team)
+        self._cached_teams = lru_cache(maxsize=cache_size)(self._parse_teams)
+
+    def resolve(self, name: str) -> str | None:
+        """Return the canonical name for an alias, or None if it is unknown."""
+        return self.index.get(normalize_name(name))
+
+    def teams(self, question: str) -> tuple[str, str] | None:
+        """Return a question's two teams, canonical where the alias is known.
+
+        Unknown names are kept as written so unmapped teams can still match
+        by exact name. Returns None unless the question reads "A vs B".
+        """
+        return self._cached_teams(question)
+
+    def _parse_teams(self, question: str) -> tuple[str, str] | None:
+        """Parse and resolve a question; ``teams`` caches the result."""
+        teams = split_question(question)
+        if teams is None:
+            return None
+        first, second = teams
+        return self.resolve(first) or first, self.resolve(second) or second
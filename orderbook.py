@@ -0,0 +1,50 @@
+"""In-memory order book kept up to date from venue snapshots and deltas."""
+
+from collections.abc import Iterable
+
+
+class OrderBook:
+    """Bid and ask price levels for a single instrument."""
+
+    def __init__(self) -> None:
+        """Initialize an empty book."""
+        self.bids: dict[float, float] = {}
+        self.asks: dict[float, float] = {}
+
+    def replace(
+        self,
+        bids: Iterable[tuple[float, float]],
+        asks: Iterable[tuple[float, float]],
+    ) -> None:
+        """Replace both sides with a full snapshot of (price, size) levels."""
+        self.bids = {price: size for price, size in bids if size > 0}
+        self.asks = {price: size for price, size in asks if size > 0}
+
+    def set_level(self, side: str, price: float, size: float) -> None:
+        """Set the size resting at a price level; a size of zero removes it."""
+        levels = self.bids if side == "bid" else self.asks
+        if size > 0:
+            levels[price] = size
+        else:
+            levels.pop(price, None)
+
+    def adjust_level(self, side: str, price: float, delta: float) -> None:
+        """Add a signed size change to a price level."""
+        levels = self.bids if side == "bid" else self.asks
+        self.set_level(side, price, levels.get(price, 0) + delta)
+
+    def best_bid(self) -> float | None:
+        """Return the highest bid price, or None if there are no bids."""
+        return max(self.bids) if self.bids else None
+
+    def best_ask(self) -> float | None:
+        """Return the lowest ask price, or None if there are no asks."""
+        return min(self.asks) if self.asks else None
+
+    def bid_levels(self) -> list[tuple[float, float]]:
+        """Return the bid side as (price, size) levels, best (highest) first."""
+        return sorted(self.bids.items(), reverse=True)
+
+    def ask_levels(self) -> list[tuple[float, float]]:
+        """Return the ask side as (price, size) levels, best (lowest) first."""
+        return sorted(self.asks.items())
@@ -5,10 +5,18 @@ import datetime
 import json
 import logging
 import time
+from collections import deque
+from collections.abc import AsyncIterator, Collection, Iterable
 from typing import Any
 
 import aiohttp
 
+from http_session import request_json, session_scope
+from normalize.resolver import split_question
+from orderbook import OrderBook
+from rate_limit import RateLimiter
+from request_policy import RequestPolicy
+from ticks import TickRecorder
 from utils import save_to_json, utc_to_est
 
 logger = logging.getLogger(__name__)
@@ -17,79 +25,176 @@ logger = logging.getLogger(__name__)
 class Polymarket:
     """Polymarket Client"""
 
-    GAMMA_MARKET_URL = "https://gamma-api.polymarket.com/markets"
-    CLOB_PRICE_URL = "https://clob.polymarket.com/price"
+    GAMMA_API_URL = "https://gamma-api.polymarket.com"
+    CLOB_API_URL = "https://clob.polymarket.com"
+    CLOB_WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+    # The CLOB "SELL" side quotes the best ask, i.e. the price paid to buy a token
+    BUY_PRICE_SIDE = "SELL"
+    # The "BUY" side quotes the best bid, which prices the opponent's complement
+    BID_PRICE_SIDE = "BUY"
+    # Sides requested for each token, both in the same batched request
+    PRICE_SIDES = (BUY_PRICE_SIDE, BID_PRICE_SIDE)
+    # Tokens priced per batched request
+    DEFAULT_PRICE_BATCH_SIZE = 100
+    # Markets per Gamma discovery page
+    GAMMA_PAGE_LIMIT = 100
+    # Gamma pages requested concurrently ahead of the consumer
+    DEFAULT_DISCOVERY_PREFETCH = 3
+    # Hard stop in case the API ignores the offset parameter
+    MAX_DISCOVERY_PAGES = 50
+    # Seconds to wait before reconnecting a dropped websocket
+    WS_RECONNECT_DELAY = 2.0
+    # Seconds between full Gamma discoveries; prices refresh every call
+    DEFAULT_DISCOVERY_INTERVAL = 600.0
+    # Seconds before a failed rediscovery is retried while streaming
+    DISCOVERY_RETRY_DELAY = 30.0
 
-    def __init__(self, tag_id: str, market: str) -> None:
-        """Initialize Polymarket client with tag ID."""
+    def __init__(
+        self,
+        tag_id: str,
+        market: str,
+        session: aiohttp.ClientSession | None = None,
+        price_batch_size: int = DEFAULT_PRICE_BATCH_SIZE,
+        discovery_prefetch: int = DEFAULT_DISCOVERY_PREFETCH,
+        gamma_url: str = GAMMA_API_URL,
+        clob_url: str = CLOB_API_URL,
+        ws_url: str = CLOB_WS_URL,
+        rate_limiter: RateLimiter | None = None,
+        request_policy: RequestPolicy | None = None,
+        discovery_interval: float = DEFAULT_DISCOVERY_INTERVAL,
+        depth: bool = False,
+        recorder: TickRecorder | None = None,
+    ) -> None:
+        """Initialize Polymarket client with tag ID and optional shared session.
+
+        The API base URLs can be overridden to point the client at a local
+        stand-in server such as ``fakes.polymarket_server``. A shared
+        ``rate_limiter`` keeps all clients within the venue's budget and
+        ``request_policy`` bounds slow or failed requests. Markets are
+        rediscovered every ``discovery_interval`` seconds; calls in between
+        only reprice the cached tokens. With ``depth``, every token's order
+        book is fetched as well and its ask and bid ladders kept under
+        "<team> DEPTH" and "<team> BID DEPTH". A ``recorder`` receives every
+        BUY and BID quote as it arrives, keyed by token ID.
+        """
         self.tag_id = tag_id
+        self.price_batch_size = price_batch_size
+        self.discovery_prefetch = max(1, discovery_prefetch)
+        self.gamma_market_url = f"{gamma_url}/markets"
+        self.clob_prices_url = f"{clob_url}/prices"
+        self.clob_books_url = f"{clob_url}/books"
+        self.ws_url = ws_url
+        self.rate_limiter = rate_limiter
+        self.request_policy = request_policy
+        self.discovery_interval = discovery_interval
+        self.discovered_at: float | None = None
+        self.depth = depth
+        self.recorder = recorder
         self.market_data = []
+        # Question -> cached market entry, repriced on every call
+        self.entries: dict[str, dict[str, Any]] = {}
+        # Token ID -> (question, team) for every priced token
+        self.token_teams: dict[str, tuple[str, str]] = {}
+        # Token ID -> live order book, maintained in streaming mode
+        self.books: dict[str, OrderBook] = {}
         self.market = market
+        self.session = session
 
     async def get_market_data(self) -> list[dict[str, Any]]:
-        """Fetch and process market data from Polymarket."""
+        """Fetch and process market data, rediscovering markets when stale."""
         start_time = time.time()
-        logger.info("Starting Polymarket market data fetch for tag_id: %s", self.tag_id)
+        async with session_scope(self.session) as session:
+            if self.discovery_due():
+                logger.info(
+                    "Starting Polymarket market discovery for tag_id: %s", self.tag_id
+                )
+                batches = await self._discover(session, price=True)
+            else:
+                logger.info(
+                    "Refreshing Polymarket prices for %d cached tokens for tag_id: %s",
+                    len(self.token_teams),
+                    self.tag_id,
+                )
+                batches = self._start_price_batches(session, self.token_teams)
 
-        async with aiohttp.ClientSession() as session:
-            markets = await self._fetch_games(session)
-            if not markets:
-                logger.warning("No markets found from Polymarket")
+            if not self.entries:
                 self.market_data = []
                 return []
 
-            logger.info("Fetched %d markets from Polymarket", len(markets))
+            logger.debug("Awaiting %d price batches", len(batches))
+            failed_count = await self._apply_quotes(session, batches, self.token_teams)
 
-            tasks = []
-            questions = []
-            for market in markets:
-                question = market.get("question", "")
-                questions.append(question)
-                clob_token_ids = json.loads(market.get("clobTokenIds", "[]"))
-                try:
-                    # Handle both "vs." and " vs " formats
-                    # First try "vs." format (traditional sports)
-                    if " vs " in question:
-                        # CS2 format: "Counter-Strike: Team1 vs Team2 (BO1)"
-                        # Remove prefix and suffix, then split
-                        clean_question = question
-                        if "Counter-Strike:" in clean_question:
-                            clean_question = clean_question.split("Counter-Strike:")[
-                                -1
-                            ].strip()
-                        if "(" in clean_question:
-                            clean_question = clean_question.split("(")[0].strip()
-                        team1, team2 = clean_question.split(" vs ", 1)
-                        team1 = team1.strip()
-                        team2 = team2.strip()
-                    else:
-                        # Traditional format: "Team1 vs. Team2"
-                        team1, team2 = question.replace(" ", "").split("vs.")
-                except (ValueError, IndexError):
-                    continue
+        elapsed_time = time.time() - start_time
+        logger.info(
+            "Polymarket market data fetch completed in %.2f seconds. Loaded %d markets (%d requests failed)",
+            elapsed_time,
+            len(self.entries),
+            failed_count,
+        )
+        # Hand out copies since normalization rewrites entries in place
+        self.market_data = [dict(entry) for entry in self.entries.values()]
+        save_to_json(self.market_data, f"data/{self.market}_markets_polymarket.json")
+        return self.market_data
 
-                for i, token in enumerate(clob_token_ids):
-                    team = team1 if i == 0 else team2
-                    tasks.append(
-                        self._fetch_buy_sell_for_token(session, question, team, token)
-                    )
+    def discovery_due(self) -> bool:
+        """Return True when the cached market catalog needs refreshing."""
+        return (
+            self.discovered_at is None
+            or time.time() - self.discovered_at >= self.discovery_interval
+        )
 
-            # Limit concurrency to avoid overloading server
-            sem = asyncio.Semaphore(8)
+    async def ensure_discovered(self) -> bool:
+        """Rediscover the market catalog without pricing it; True if it ran."""
+        if not self.discovery_due():
+            return False
 
-            async def sem_task(task):
-                async with sem:
-                    return await task
+        logger.info("Starting Polymarket market discovery for tag_id: %s", self.tag_id)
+        async with session_scope(self.session) as session:
+            await self._discover(session)
+        return True
 
-            logger.debug(
-                "Fetching prices for %d tokens with concurrency limit of 8", len(tasks)
-            )
-            results = await asyncio.gather(
-                *[sem_task(t) for t in tasks], return_exceptions=True
-            )
+    async def refresh_prices(
+        self, tokens: Collection[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Reprice cached tokens, limited to ``tokens`` if given.
+
+        Entries whose tokens are not repriced keep their previous prices.
+        """
+        if tokens is None:
+            tokens = self.token_teams
+        tokens = [token for token in tokens if token in self.token_teams]
+        logger.info(
+            "Refreshing Polymarket prices for %d tokens for tag_id: %s",
+            len(tokens),
+            self.tag_id,
+        )
+        async with session_scope(self.session) as session:
+            batches = self._start_price_batches(session, tokens)
+            failed_count = await self._apply_quotes(session, batches, tokens)
+        if failed_count:
+            logger.warning("%d Polymarket price requests failed", failed_count)
+
+        self.market_data = [dict(entry) for entry in self.entries.values()]
+        return self.market_data
+
+    async def _discover(
+        self, session: aiohttp.ClientSession, price: bool = False
+    ) -> list[tuple[list[tuple[str, str, str]], asyncio.Task]]:
+        """Rebuild the cached market entries and token index from Gamma.
 
-            question_to_market = {}
-            for market in markets:
+        With ``price`` set, price batches are started while discovery is still
+        running and returned for the caller to await. The catalog is only
+        replaced after a complete walk; if a page fails, the previous one is
+        kept (and repriced with ``price``) and discovery stays due.
+        """
+        question_to_market = {}
+        token_teams = []
+        token_index = {}
+        batches = []
+        market_count = 0
+        try:
+            async for market in self._iter_games(session):
+                market_count += 1
                 question = market.get("question", "")
                 if question:
                     slug = market.get("slug", "")
@@ -101,33 +206,312 @@ class Polymarket:
                         market_entry["slug"] = slug
                     question_to_market[question] = market_entry
 
-            failed_count = 0
-            for r in results:
-                if isinstance(r, Exception):
-                    logger.error("Request failed: %s", r)
-                    failed_count += 1
+                teams = self._parse_teams(question)
+                if teams is None:
                     continue
-                question, team, buy_json, sell_json = r
-                market_data = question_to_market.get(question)
-                if market_data is not None:
-                    market_data[f"{team} BUY"] = (
-                        float(buy_json.get("price", 0))
-                        if buy_json.get("price")
-                        else None
-                    )
+                clob_token_ids = json.loads(market.get("clobTokenIds", "[]"))
+                for i, token in enumerate(clob_token_ids):
+                    team = teams[0] if i == 0 else teams[1]
+                    token_teams.append((question, team, token))
+                    token_index[token] = (question, team)
 
-            elapsed_time = time.time() - start_time
-            logger.info(
-                "Polymarket market data fetch completed in %.2f seconds. Loaded %d markets (%d requests failed)",
-                elapsed_time,
-                len(question_to_market),
-                failed_count,
+                # Start pricing each full batch while discovery is still running
+                if price and len(token_teams) >= self.price_batch_size:
+                    batches.append(self._start_price_batch(session, token_teams))
+                    token_teams = []
+        except Exception as e:
+            # Keep the previous catalog and retry discovery on the next cycle
+            for _, task in batches:
+                task.cancel()
+            logger.error(
+                "Polymarket discovery failed, keeping %d cached markets: %s",
+                len(self.entries),
+                e,
             )
-            self.market_data = list(question_to_market.values())
-            save_to_json(
-                self.market_data, f"data/{self.market}_markets_polymarket.json"
+            if price:
+                return self._start_price_batches(session, self.token_teams)
+            return []
+
+        if price and token_teams:
+            batches.append(self._start_price_batch(session, token_teams))
+
+        if not market_count:
+            logger.warning("No markets found from Polymarket")
+        else:
+            logger.info("Fetched %d markets from Polymarket", market_count)
+
+        self.entries = question_to_market
+        self.token_teams = token_index
+        self.discovered_at = time.time()
+        if self.recorder is not None:
+            self.recorder.record_catalog(
+                self.market,
+                "polymarket",
+                {
+                    token: {**question_to_market.get(question, {}), "team": team}
+                    for token, (question, team) in token_index.items()
+                },
+                self.discovered_at,
             )
-            return self.market_data
+        return batches
+
+    async def _apply_quotes(
+        self,
+        session: aiohttp.ClientSession,
+        batches: list[tuple[list[tuple[str, str, str]], asyncio.Task]],
+        tokens: Iterable[str],
+    ) -> int:
+        """Apply price batches, fetching ``tokens`` books alongside in depth mode.
+
+        Returns the number of failed requests.
+        """
+        if not self.depth:
+            return await self._apply_price_batches(batches)
+        failures = await asyncio.gather(
+            self._apply_price_batches(batches), self._refresh_depth(session, tokens)
+        )
+        return sum(failures)
+
+    async def _refresh_depth(
+        self, session: aiohttp.ClientSession, tokens: Iterable[str]
+    ) -> int:
+        """Fetch order books in batches and store each token's ask ladder.
+
+        Returns the number of failed requests.
+        """
+        tokens = list(tokens)
+        size = self.price_batch_size
+        chunks = [tokens[i : i + size] for i in range(0, len(tokens), size)]
+        results = await asyncio.gather(
+            *[
+                self._post_json(
+                    session, self.clob_books_url, [{"token_id": t} for t in chunk]
+                )
+                for chunk in chunks
+            ],
+            return_exceptions=True,
+        )
+
+        failed_count = 0
+        for chunk, snapshots in zip(chunks, results):
+            if isinstance(snapshots, Exception):
+                logger.error("Order book request failed: %s", snapshots)
+                failed_count += 1
+                snapshots = []
+            # Tokens missing from the response are cleared rather than kept stale
+            returned = {snapshot.get("asset_id"): snapshot for snapshot in snapshots}
+            for token in chunk:
+                snapshot = returned.get(token, {})
+                book = self.books.setdefault(token, OrderBook())
+                book.replace(
+                    self._parse_levels(snapshot.get("bids", [])),
+                    self._parse_levels(snapshot.get("asks", [])),
+                )
+                question, team = self.token_teams[token]
+                market_entry = self.entries.get(question)
+                if market_entry is not None:
+                    market_entry[f"{team} DEPTH"] = book.ask_levels()
+                    market_entry[f"{team} BID DEPTH"] = book.bid_levels()
+        return failed_count
+
+    async def _apply_price_batches(
+        self, batches: list[tuple[list[tuple[str, str, str]], asyncio.Task]]
+    ) -> int:
+        """Await price batches, write prices into the entries and count failures."""
+        results = await asyncio.gather(
+            *[task for _, task in batches], return_exceptions=True
+        )
+
+        failed_count = 0
+        quotes = []
+        for (batch, _), prices in zip(batches, results):
+            if isinstance(prices, Exception):
+                logger.error("Request failed: %s", prices)
+                failed_count += 1
+                prices = {}
+            for question, team, token in batch:
+                token_prices = prices.get(token, {})
+                price = token_prices.get(self.BUY_PRICE_SIDE)
+                bid = token_prices.get(self.BID_PRICE_SIDE)
+                price = float(price) if price else None
+                bid = float(bid) if bid else None
+                market_entry = self.entries.get(question)
+                if market_entry is not None:
+                    market_entry[f"{team} BUY"] = price
+                    market_entry[f"{team} BID"] = bid
+                quotes.append((token, "BUY", price))
+                quotes.append((token, "BID", bid))
+        if self.recorder is not None:
+            self.recorder.record_quotes(self.market, "polymarket", quotes)
+        return failed_count
+
+    async def stream_market_data(self) -> AsyncIterator[dict[str, Any]]:
+        """Stream top-of-book changes over the CLOB market websocket.
+
+        Takes a REST snapshot first, then subscribes to every discovered token
+        and yields each market entry whose quotes changed. ``market_data``
+        always reflects the latest state. Dropped connections are re-opened
+        and resubscribed, which makes the server resend full book snapshots.
+        Markets are rediscovered every ``discovery_interval`` seconds, after
+        which the socket is resubscribed to the new token set.
+        """
+        await self.get_market_data()
+        if not self.token_teams:
+            logger.warning("No Polymarket tokens to stream for tag_id: %s", self.tag_id)
+            return
+
+        discovered_at = self.discovered_at
+        async with session_scope(self.session) as session:
+            while True:
+                if self.discovered_at != discovered_at:
+                    # Carry the streamed quotes over to the rediscovered markets;
+                    # new tokens are filled in by the resubscription's snapshots
+                    streamed = {entry["question"]: entry for entry in self.market_data}
+                    self.market_data = [
+                        {**streamed.get(question, {}), **entry}
+                        for question, entry in self.entries.items()
+                    ]
+                entries = {entry["question"]: entry for entry in self.market_data}
+                # Drop books of tokens that are no longer listed
+                self.books = {
+                    token: book
+                    for token, book in self.books.items()
+                    if token in self.token_teams
+                }
+                discovered_at = self.discovered_at
+                try:
+                    async with session.ws_connect(self.ws_url, heartbeat=30) as ws:
+                        await ws.send_json(
+                            {"assets_ids": list(self.token_teams), "type": "market"}
+                        )
+                        logger.info(
+                            "Subscribed to %d Polymarket tokens for tag_id: %s",
+                            len(self.token_teams),
+                            self.tag_id,
+                        )
+                        rediscovery = asyncio.create_task(self._rediscover(ws))
+                        try:
+                            async for msg in ws:
+                                if msg.type != aiohttp.WSMsgType.TEXT:
+                                    break
+                                for entry in self._apply_book_message(
+                                    msg.data, entries
+                                ):
+                                    yield entry
+                        finally:
+                            rediscovery.cancel()
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.error("Polymarket websocket error: %s", e)
+
+                if self.discovered_at != discovered_at:
+                    # Resubscribe straight away to the rediscovered tokens
+                    continue
+                logger.info(
+                    "Polymarket websocket closed, reconnecting in %.1f seconds",
+                    self.WS_RECONNECT_DELAY,
+                )
+                await asyncio.sleep(self.WS_RECONNECT_DELAY)
+
+    async def _rediscover(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Rediscover markets when due, then close ``ws`` to resubscribe.
+
+        Discovery does not reprice, so ``market_data`` keeps receiving the
+        socket's updates until the new catalog is subscribed. Failed
+        discoveries keep the socket open and are retried after
+        ``DISCOVERY_RETRY_DELAY`` seconds.
+        """
+        while True:
+            due_in = self.discovered_at + self.discovery_interval - time.time()
+            await asyncio.sleep(max(due_in, 0.0))
+            discovered_at = self.discovered_at
+            try:
+                await self.ensure_discovered()
+            except Exception as e:
+                logger.error("Polymarket rediscovery failed: %s", e)
+            if self.discovered_at != discovered_at:
+                await ws.close()
+                return
+            await asyncio.sleep(self.DISCOVERY_RETRY_DELAY)
+
+    def _apply_book_message(
+        self, data: str, entries: dict[str, dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Apply a websocket message to the books and return changed entries."""
+        try:
+            events = json.loads(data)
+        except ValueError:
+            # Non-JSON keepalive frames such as "PONG"
+            return []
+        if isinstance(events, dict):
+            events = [events]
+
+        touched = set()
+        for event in events:
+            event_type = event.get("event_type")
+            if event_type == "book":
+                token = event.get("asset_id")
+                if token not in self.token_teams:
+                    continue
+                book = self.books.setdefault(token, OrderBook())
+                book.replace(
+                    self._parse_levels(event.get("bids", [])),
+                    self._parse_levels(event.get("asks", [])),
+                )
+                touched.add(token)
+            elif event_type == "price_change":
+                # Newer payloads nest changes per asset, older ones are flat
+                changes = event.get("price_changes") or [
+                    {**change, "asset_id": event.get("asset_id")}
+                    for change in event.get("changes", [])
+                ]
+                for change in changes:
+                    token = change.get("asset_id")
+                    if token not in self.token_teams:
+                        continue
+                    book = self.books.setdefault(token, OrderBook())
+                    book.set_level(
+                        "bid" if change["side"] == "BUY" else "ask",
+                        float(change["price"]),
+                        float(change["size"]),
+                    )
+                    touched.add(token)
+
+        changed = {}
+        recorded = []
+        for token in touched:
+            question, team = self.token_teams[token]
+            entry = entries.get(question)
+            if entry is None:
+                continue
+            book = self.books[token]
+            quotes = {"BUY": book.best_ask(), "BID": book.best_bid()}
+            if any(entry.get(f"{team} {side}") != p for side, p in quotes.items()):
+                for side, price in quotes.items():
+                    entry[f"{team} {side}"] = price
+                    recorded.append((token, side, price))
+                changed[question] = entry
+            if self.depth:
+                ladders = {
+                    f"{team} DEPTH": book.ask_levels(),
+                    f"{team} BID DEPTH": book.bid_levels(),
+                }
+                for key, ladder in ladders.items():
+                    if entry.get(key) != ladder:
+                        entry[key] = ladder
+                        changed[question] = entry
+        if recorded and self.recorder is not None:
+            self.recorder.record_quotes(self.market, "polymarket", recorded)
+        return list(changed.values())
+
+    @staticmethod
+    def _parse_levels(levels: list[dict[str, str]]) -> list[tuple[float, float]]:
+        """Convert CLOB price levels to (price, size) tuples."""
+        return [(float(level["price"]), float(level["size"])) for level in levels]
+
+    @staticmethod
+    def _parse_teams(question: str) -> tuple[str, str] | None:
+        """Extract the two team names from a market question."""
+        return split_question(question)
 
     async def _fetch_json(
         self, session: aiohttp.ClientSession, url: str, params: dict[str, Any]
@@ -136,12 +520,17 @@ class Polymarket:
         start_time = time.time()
         logger.debug("Fetching from %s with params: %s", url, params)
         try:
-            async with session.get(url, params=params, timeout=30) as resp:
-                resp.raise_for_status()
-                data = await resp.json()
-                elapsed_time = time.time() - start_time
-                logger.debug("Fetched from %s in %.2f seconds", url, elapsed_time)
-                return data
+            data = await request_json(
+                session,
+                "GET",
+                url,
+                params=params,
+                rate_limiter=self.rate_limiter,
+                policy=self.request_policy,
+            )
+            elapsed_time = time.time() - start_time
+            logger.debug("Fetched from %s in %.2f seconds", url, elapsed_time)
+            return data
         except Exception as e:
             elapsed_time = time.time() - start_time
             logger.error(
@@ -149,10 +538,39 @@ class Polymarket:
             )
             raise
 
-    async def _fetch_games(
+    async def _post_json(
+        self, session: aiohttp.ClientSession, url: str, body: Any
+    ) -> dict[str, Any]:
+        """Post JSON body to URL and return the JSON response."""
+        start_time = time.time()
+        logger.debug("Posting to %s", url)
+        try:
+            data = await request_json(
+                session,
+                "POST",
+                url,
+                body=body,
+                rate_limiter=self.rate_limiter,
+                policy=self.request_policy,
+            )
+            elapsed_time = time.time() - start_time
+            logger.debug("Posted to %s in %.2f seconds", url, elapsed_time)
+            return data
+        except Exception as e:
+            elapsed_time = time.time() - start_time
+            logger.error(
+                "Failed to post to %s after %.2f seconds: %s", url, elapsed_time, e
+            )
+            raise
+
+    async def _iter_games(
         self, session: aiohttp.ClientSession
-    ) -> list[dict[str, Any]]:
-        """Fetch games from Polymarket API."""
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield open games from Polymarket API, prefetching pages concurrently.
+
+        Raises if a page fails, so callers never mistake a partial walk for
+        the full catalog.
+        """
         now = datetime.datetime.utcnow()
         three_weeks = now + datetime.timedelta(days=21)
 
@@ -161,55 +579,79 @@ class Polymarket:
             "end_date_max": three_weeks.isoformat() + "Z",
             "sports_market_types": "moneyline",
             "tag_id": self.tag_id,
-            "limit": 100,
+            "limit": self.GAMMA_PAGE_LIMIT,
         }
 
-        try:
-            markets = await self._fetch_json(
-                session, self.GAMMA_MARKET_URL, query_string
+        pages: deque[asyncio.Task] = deque()
+        next_offset = 0
+
+        def schedule_page() -> None:
+            nonlocal next_offset
+            params = {**query_string, "offset": next_offset}
+            pages.append(
+                asyncio.create_task(
+                    self._fetch_json(session, self.gamma_market_url, params)
+                )
             )
-            # Filter to only include open, tradeable markets
-            markets = [
-                m
-                for m in markets
-                if not m.get("closed", False) and m.get("acceptingOrders", True)
-            ]
-            return markets
-        except Exception as e:
-            logger.error("Failed to fetch games: %s", e)
-            return []
+            next_offset += self.GAMMA_PAGE_LIMIT
 
-    async def _fetch_buy_sell_for_token(
-        self, session: aiohttp.ClientSession, question: str, team: str, token: str
-    ) -> tuple[str, str, dict[str, Any], dict[str, Any]]:
-        """Fetch buy and sell prices for a token."""
-        start_time = time.time()
-        buy_task = self._fetch_json(
-            session, self.CLOB_PRICE_URL, {"token_id": token, "side": "SELL"}
-        )
-        sell_task = self._fetch_json(
-            session, self.CLOB_PRICE_URL, {"token_id": token, "side": "BUY"}
-        )
+        try:
+            for _ in range(min(self.discovery_prefetch, self.MAX_DISCOVERY_PAGES)):
+                schedule_page()
 
-        buy_json, sell_json = await asyncio.gather(
-            buy_task, sell_task, return_exceptions=True
-        )
+            while pages:
+                markets = await pages.popleft()
 
-        # Handle exceptions from individual tasks
-        if isinstance(buy_json, Exception):
-            logger.error("Failed to fetch buy price for token %s: %s", token, buy_json)
-            buy_json = {}
-        if isinstance(sell_json, Exception):
-            logger.error(
-                "Failed to fetch sell price for token %s: %s", token, sell_json
-            )
-            sell_json = {}
+                if len(markets) < self.GAMMA_PAGE_LIMIT:
+                    # Last page reached; anything still in flight is past the end
+                    for page in pages:
+                        page.cancel()
+                    pages.clear()
+                elif next_offset < self.MAX_DISCOVERY_PAGES * self.GAMMA_PAGE_LIMIT:
+                    schedule_page()
 
-        elapsed_time = time.time() - start_time
+                # Filter to only include open, tradeable markets
+                for m in markets:
+                    if not m.get("closed", False) and m.get("acceptingOrders", True):
+                        yield m
+        finally:
+            for page in pages:
+                page.cancel()
+
+    def _start_price_batches(
+        self, session: aiohttp.ClientSession, tokens: Iterable[str]
+    ) -> list[tuple[list[tuple[str, str, str]], asyncio.Task]]:
+        """Start price batches for cached tokens."""
+        token_teams = [(*self.token_teams[token], token) for token in tokens]
+        size = self.price_batch_size
+        return [
+            self._start_price_batch(session, token_teams[i : i + size])
+            for i in range(0, len(token_teams), size)
+        ]
+
+    def _start_price_batch(
+        self,
+        session: aiohttp.ClientSession,
+        token_teams: list[tuple[str, str, str]],
+    ) -> tuple[list[tuple[str, str, str]], asyncio.Task]:
+        """Start pricing a batch of (question, team, token) entries."""
+        tokens = [token for _, _, token in token_teams]
+        return token_teams, asyncio.create_task(self._fetch_prices(session, tokens))
+
+    async def _fetch_prices(
+        self, session: aiohttp.ClientSession, tokens: list[str]
+    ) -> dict[str, dict[str, str]]:
+        """Fetch prices for a batch of tokens in a single request."""
+        start_time = time.time()
+        body = [
+            {"token_id": token, "side": side}
+            for token in tokens
+            for side in self.PRICE_SIDES
+        ]
+        prices = await self._post_json(session, self.clob_prices_url, body)
         logger.debug(
-            "Fetched prices for token %s (%s) in %.2f seconds",
-            token,
-            team,
-            elapsed_time,
+            "Fetched prices for %d tokens in %.2f seconds",
+            len(tokens),
+            time.time() - start_time,
         )
-        return question, team, buy_json, sell_json
+        return prices
@@ -0,0 +1,123 @@
+"""Adaptive per-host rate limiting shared by all venue clients."""
+
+import asyncio
+import logging
+import time
+from email.utils import parsedate_to_datetime
+
+from yarl import URL
+
+logger = logging.getLogger(__name__)
+
+# Requests per second allowed for each venue host
+DEFAULT_HOST_RATES = {
+    "api.elections.kalshi.com": 10.0,
+    "gamma-api.polymarket.com": 10.0,
+    "clob.polymarket.com": 20.0,
+}
+# Rate for hosts without an explicit budget
+DEFAULT_RATE = 10.0
+# Rate never drops below this fraction of the configured maximum
+MIN_RATE_FRACTION = 0.05
+# Multiplicative decrease applied on every throttled response
+DECREASE_FACTOR = 0.5
+# Fraction of the maximum rate regained per clean response
+INCREASE_FRACTION = 0.02
+# Pause applied on a 429 that carries no usable Retry-After header
+DEFAULT_RETRY_AFTER = 1.0
+
+
+class HostRateLimiter:
+    """Token bucket for a single host with AIMD rate adaptation."""
+
+    def __init__(self, host: str, max_rate: float, burst: float | None = None) -> None:
+        """Initialize bucket allowing up to ``max_rate`` requests per second."""
+        self.host = host
+        self.max_rate = max_rate
+        self.min_rate = max_rate * MIN_RATE_FRACTION
+        self.rate = max_rate
+        self.burst = burst if burst is not None else max_rate
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent to this host."""
+        # Waiters queue on the lock, so tokens are handed out in FIFO order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+
+                self.tokens = min(
+                    self.burst, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def on_success(self) -> None:
+        """Additively raise the rate after a clean response."""
+        step = self.max_rate * INCREASE_FRACTION
+        self.rate = min(self.max_rate, self.rate + step)
+
+    def on_throttled(self, retry_after: float | None) -> None:
+        """Halve the rate and pause the host after an HTTP 429."""
+        now = time.monotonic()
+        # Requests already in flight when the pause began count as one signal
+        if now >= self.blocked_until:
+            self.rate = max(self.min_rate, self.rate * DECREASE_FACTOR)
+        self.tokens = 0.0
+        pause = retry_after if retry_after is not None else DEFAULT_RETRY_AFTER
+        self.blocked_until = max(self.blocked_until, now + pause)
+        # Refill from the end of the pause, so no burst follows it
+        self.updated = self.blocked_until
+        logger.warning(
+            "Throttled by %s, pausing %.1f seconds and lowering rate to %.2f/s",
+            self.host,
+            pause,
+            self.rate,
+        )
+
+
+class RateLimiter:
+    """Registry of per-host limiters shared across all sport tasks."""
+
+    def __init__(
+        self,
+        host_rates: dict[str, float] | None = None,
+        default_rate: float = DEFAULT_RATE,
+    ) -> None:
+        """Initialize registry with per-host request budgets."""
+        self.host_rates = {**DEFAULT_HOST_RATES, **(host_rates or {})}
+        self.default_rate = default_rate
+        self.hosts: dict[str, HostRateLimiter] = {}
+
+    def for_url(self, url: str) -> HostRateLimiter:
+        """Return the limiter for the host a URL points at."""
+        host = URL(url).host or ""
+        limiter = self.hosts.get(host)
+        if limiter is None:
+            rate = self.host_rates.get(host, self.default_rate)
+            limiter = self.hosts[host] = HostRateLimiter(host, rate)
+        return limiter
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
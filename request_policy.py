@@ -0,0 +1,174 @@
+"""Deadlines, jittered retries and hedged requests for venue API calls."""
+
+import asyncio
+import logging
+import random
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Seconds a single attempt may take before it is abandoned
+DEFAULT_DEADLINE = 10.0
+# Attempts re-sent after a timeout, connection error or 5xx response
+DEFAULT_MAX_RETRIES = 2
+# Bounds of the exponential backoff window, in seconds
+DEFAULT_BASE_DELAY = 0.25
+DEFAULT_MAX_DELAY = 4.0
+# Latency percentile after which a duplicate request is sent
+DEFAULT_HEDGE_PERCENTILE = 0.95
+# Latency samples kept per host, and the minimum before hedging starts
+LATENCY_WINDOW = 200
+MIN_LATENCY_SAMPLES = 20
+
+
+class RequestPolicy:
+    """Retry and hedging policy shared by all venue clients.
+
+    Every attempt runs under ``deadline``. Timeouts, connection errors and
+    server errors are retried up to ``max_retries`` times after a full-jitter
+    exponential backoff. With ``hedge`` enabled, an attempt still running
+    once the host's ``hedge_percentile`` latency has passed gets a duplicate
+    request, and whichever response arrives first is used.
+    """
+
+    def __init__(
+        self,
+        deadline: float = DEFAULT_DEADLINE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        hedge: bool = True,
+        hedge_percentile: float = DEFAULT_HEDGE_PERCENTILE,
+    ) -> None:
+        """Initialize policy with attempt deadline, retry and hedging settings."""
+        self.deadline = deadline
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        # Host -> recent request latencies in seconds
+        self.latencies: dict[str, deque[float]] = {}
+
+    def record(self, host: str, latency: float) -> None:
+        """Record the latency of a completed request to a host."""
+        samples = self.latencies.get(host)
+        if samples is None:
+            samples = self.latencies[host] = deque(maxlen=LATENCY_WINDOW)
+        samples.append(latency)
+
+    def hedge_delay(self, host: str) -> float | None:
+        """Return seconds to wait before hedging, or None to not hedge."""
+        samples = self.latencies.get(host)
+        if not self.hedge or samples is None or len(samples) < MIN_LATENCY_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.hedge_percentile))
+        delay = ordered[index]
+        return delay if delay < self.deadline else None
+
+    def backoff(self, attempt: int) -> float:
+        """Return a full-jitter backoff delay for a retry attempt."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    async def run(
+        self,
+        host: str,
+        send: Callable[[], Awaitable[T]],
+        acquire: Callable[[], Awaitable[None]] | None = None,
+    ) -> T:
+        """Run ``send`` under the policy and return its first successful result.
+
+        ``acquire`` is awaited before every request, hedges included, and an
+        attempt's deadline only starts once its first request may be sent.
+        """
+        attempt = 0
+        while True:
+            try:
+                return await self._attempt(host, send, acquire)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if not _is_retryable(e) or attempt >= self.max_retries:
+                    raise
+                delay = self.backoff(attempt)
+                logger.warning(
+                    "Request to %s failed (%s), retrying in %.2f seconds",
+                    host,
+                    e or type(e).__name__,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _attempt(
+        self,
+        host: str,
+        send: Callable[[], Awaitable[T]],
+        acquire: Callable[[], Awaitable[None]] | None = None,
+    ) -> T:
+        """Run one attempt, hedging it once the host's latency percentile passes."""
+        if acquire is not None:
+            await acquire()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.deadline
+        tasks = [asyncio.ensure_future(send())]
+        try:
+            delay = self.hedge_delay(host)
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done:
+                    logger.debug(
+                        "Hedging request to %s after %.2f seconds", host, delay
+                    )
+                    tasks.append(asyncio.ensure_future(_hedge(send, acquire)))
+
+            pending = set(tasks)
+            error: BaseException | None = None
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+
+            # Both copies failed: surface the real error rather than a timeout
+            if error is not None and not pending:
+                raise error
+            raise asyncio.TimeoutError(
+                f"Request to {host} exceeded {self.deadline:.1f}s deadline"
+            )
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # Mark the losing copy's error as retrieved
+                    task.exception()
+
+
+async def _hedge(
+    send: Callable[[], Awaitable[T]],
+    acquire: Callable[[], Awaitable[None]] | None,
+) -> T:
+    """Send a duplicate request once the limiter allows it."""
+    if acquire is not None:
+        await acquire()
+    return await send()
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Return True for errors a repeated request may not hit again."""
+    if isinstance(error, aiohttp.ClientResponseError):
+        # Client errors repeat deterministically and 429s are already retried
+        return error.status >= 500
+    return True
@@ -0,0 +1,35 @@
+"""Pluggable destinations for arbitrage opportunities."""
+
+from typing import Any
+
+from .base import OpportunitySink
+from .jsonl import JSONLSink
+from .null import NullSink
+from .sqlite import SQLiteSink
+from .supabase import SupabaseSink
+
+SINKS: dict[str, type[OpportunitySink]] = {
+    sink.name: sink for sink in (SupabaseSink, SQLiteSink, JSONLSink, NullSink)
+}
+
+
+def create_sink(name: str, **kwargs: Any) -> OpportunitySink:
+    """Create a sink by name, passing backend options such as ``path``."""
+    try:
+        sink_class = SINKS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown sink {name!r}. Available sinks: {', '.join(SINKS)}"
+        ) from None
+    return sink_class(**kwargs)
+
+
+__all__ = [
+    "SINKS",
+    "JSONLSink",
+    "NullSink",
+    "OpportunitySink",
+    "SQLiteSink",
+    "SupabaseSink",
+    "create_sink",
+]
@@ -0,0 +1,103 @@
+"""Base class for asynchronous, batching opportunity sinks."""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Rows sent per write request or transaction
+DEFAULT_BATCH_SIZE = 500
+
+# Sport -> (submission time, opportunities)
+Batch = dict[str, tuple[float, list[dict[str, Any]]]]
+
+
+class OpportunitySink:
+    """Destination for arbitrage opportunity snapshots.
+
+    ``submit`` only buffers the snapshot and returns, so a slow backend never
+    holds up the event loop or price collection. A background task hands
+    everything buffered since its last write to ``_write_batch``, which runs
+    in a worker thread. A sport's pending snapshot is superseded by a newer
+    one, which bounds the buffer to one snapshot per sport. Pending snapshots
+    are flushed on close.
+    """
+
+    name = "base"
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        """Initialize sink writing up to ``batch_size`` rows per request."""
+        self.batch_size = batch_size
+        self.pending: Batch = {}
+        self.written_count = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._closing = False
+
+    async def start(self) -> None:
+        """Start the background writer task on the running loop."""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    def submit(self, sport: str, opportunities: list[dict[str, Any]]) -> None:
+        """Queue a sport's snapshot for writing; safe to call from any thread."""
+        if self._loop is None:
+            raise RuntimeError(f"{type(self).__name__}.start() must be awaited first")
+        self._loop.call_soon_threadsafe(
+            self._enqueue, sport, time.time(), opportunities
+        )
+
+    async def close(self) -> None:
+        """Write every pending snapshot, stop the writer and release resources."""
+        if self._task is None:
+            return
+        # Let snapshots submitted just before closing reach the buffer
+        await asyncio.sleep(0)
+        self._closing = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+        await asyncio.to_thread(self._close)
+
+    def _enqueue(
+        self, sport: str, timestamp: float, opportunities: list[dict[str, Any]]
+    ) -> None:
+        """Buffer a snapshot, replacing any unwritten one for the same sport."""
+        if sport in self.pending:
+            logger.debug("Superseding unwritten %s snapshot", sport)
+        self.pending[sport] = (timestamp, opportunities)
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        """Write buffered snapshots whenever new ones arrive."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self.pending:
+                batch, self.pending = self.pending, {}
+                start_time = time.time()
+                try:
+                    await asyncio.to_thread(self._write_batch, batch)
+                except Exception as e:
+                    logger.error("%s sink failed to write batch: %s", self.name, e)
+                    continue
+                self.written_count += sum(len(rows) for _, rows in batch.values())
+                logger.debug(
+                    "%s sink wrote %d sport snapshots in %.3f seconds",
+                    self.name,
+                    len(batch),
+                    time.time() - start_time,
+                )
+            if self._closing:
+                return
+
+    def _write_batch(self, batch: Batch) -> None:
+        """Write a batch of sport snapshots; runs in a worker thread."""
+        raise NotImplementedError
+
+    def _close(self) -> None:
+        """Release backend resources; runs in a worker thread after the flush."""
@@ -0,0 +1,35 @@
+"""Sink appending opportunity snapshots to a JSON Lines file."""
+
+import json
+import os
+from typing import Any
+
+from .base import Batch, OpportunitySink
+
+DEFAULT_PATH = "data/opportunities.jsonl"
+
+
+class JSONLSink(OpportunitySink):
+    """Append one timestamped JSON object per opportunity."""
+
+    name = "jsonl"
+
+    def __init__(self, path: str = DEFAULT_PATH, **kwargs: Any) -> None:
+        """Initialize sink appending to the file at ``path``."""
+        super().__init__(**kwargs)
+        self.path = path
+
+    def _write_batch(self, batch: Batch) -> None:
+        """Append every snapshot in the batch with a single write."""
+        lines = [
+            json.dumps({"ts": timestamp, **opportunity})
+            for _, (timestamp, opportunities) in batch.items()
+            for opportunity in opportunities
+        ]
+        if not lines:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
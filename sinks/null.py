@@ -0,0 +1,12 @@
+"""Sink that discards opportunities, for benchmarks and dry runs."""
+
+from .base import Batch, OpportunitySink
+
+
+class NullSink(OpportunitySink):
+    """Accept snapshots and drop them; only ``written_count`` is kept."""
+
+    name = "null"
+
+    def _write_batch(self, batch: Batch) -> None:
+        """Discard the batch."""
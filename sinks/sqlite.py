@@ -0,0 +1,92 @@
+"""Sink appending opportunity snapshots to a local SQLite database."""
+
+import logging
+import os
+import sqlite3
+from typing import Any
+
+from .base import Batch, OpportunitySink
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = "data/opportunities.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS opportunities (
+    ts REAL NOT NULL,
+    sport TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    question TEXT,
+    date TEXT,
+    kalshi TEXT,
+    polymarket TEXT,
+    profit REAL,
+    kalshi_link TEXT,
+    polymarket_link TEXT
+);
+CREATE INDEX IF NOT EXISTS opportunities_sport_hash_ts
+    ON opportunities (sport, hash, ts);
+"""
+
+INSERT = """
+INSERT INTO opportunities (
+    ts, sport, hash, question, date, kalshi, polymarket, profit,
+    kalshi_link, polymarket_link
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class SQLiteSink(OpportunitySink):
+    """Record every snapshot as timestamped rows in a WAL-mode database."""
+
+    name = "sqlite"
+
+    def __init__(self, path: str = DEFAULT_PATH, **kwargs: Any) -> None:
+        """Initialize sink writing to the database at ``path``."""
+        super().__init__(**kwargs)
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and create the schema."""
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Writes come from worker threads, but never two at a time
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            self._connection = connection
+            logger.info("Opened SQLite sink at %s", self.path)
+        return self._connection
+
+    def _write_batch(self, batch: Batch) -> None:
+        """Insert every snapshot in the batch in one transaction."""
+        rows = [
+            (
+                timestamp,
+                sport,
+                opportunity["hash"],
+                opportunity.get("question"),
+                opportunity.get("date"),
+                opportunity.get("kalshi"),
+                opportunity.get("polymarket"),
+                opportunity.get("profit"),
+                opportunity.get("kalshi_link"),
+                opportunity.get("polymarket_link"),
+            )
+            for sport, (timestamp, opportunities) in batch.items()
+            for opportunity in opportunities
+        ]
+        connection = self._connect()
+        with connection:
+            for i in range(0, len(rows), self.batch_size):
+                connection.executemany(INSERT, rows[i : i + self.batch_size])
+
+    def _close(self) -> None:
+        """Close the database connection."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -0,0 +1,48 @@
+"""Sink keeping the Supabase sports table in sync with the latest snapshots."""
+
+import logging
+from typing import Any
+
+from supabase_client import (
+    fetch_written_rows,
+    hash_keyed,
+    replace_sport_opportunities,
+    sync_sport_opportunities,
+)
+
+from .base import Batch, OpportunitySink
+
+logger = logging.getLogger(__name__)
+
+
+class SupabaseSink(OpportunitySink):
+    """Diff each snapshot against the table and write only what changed.
+
+    Write volume follows churn rather than table size. Tables without the
+    columns from misc/sports_hash.sql get each sport's rows replaced instead.
+    """
+
+    name = "supabase"
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize sink with an empty per-sport view of the table."""
+        super().__init__(**kwargs)
+        # Sport -> market hash -> row last written; only touched by the worker
+        self.written: dict[str, dict[str, dict[str, Any]]] = {}
+
+    def _write_batch(self, batch: Batch) -> None:
+        """Sync each sport's rows with its snapshot."""
+        for sport, (_, opportunities) in batch.items():
+            try:
+                if not hash_keyed():
+                    replace_sport_opportunities(sport, opportunities, self.batch_size)
+                    continue
+                if sport not in self.written:
+                    self.written[sport] = fetch_written_rows(sport)
+                sync_sport_opportunities(
+                    sport, opportunities, self.written[sport], self.batch_size
+                )
+            except Exception as e:
+                logger.error("Failed to sync opportunities for sport %s: %s", sport, e)
+                # The table state is unknown now, so reload it before the next diff
+                self.written.pop(sport, None)
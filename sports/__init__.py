@@ -1,9 +1,5 @@
 """Sports arbitrage modules."""
 
-from .cfb import cfb
-from .cs2 import cs2
-from .nba import nba
-from .nfl import nfl
-from .nhl import nhl
+from .scheduler import run_scheduler, run_sport
 
-__all__ = ["cfb", "cs2", "nba", "nfl", "nhl"]
+__all__ = ["run_scheduler", "run_sport"]
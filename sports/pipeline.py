@@ -0,0 +1,67 @@
+"""Match-first fetching that only prices markets listed on both venues."""
+
+import asyncio
+import logging
+from typing import Any
+
+from kalshi import Kalshi
+from normalize import NormalizeSportsMarket
+from polymarket import Polymarket
+from utils import save_to_json
+
+logger = logging.getLogger(__name__)
+
+
+async def fetch_matched_markets(
+    kalshi: Kalshi, polymarket: Polymarket, sport: str
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Fetch market data, requesting prices only for cross-venue matches.
+
+    Both catalogs are discovered (when stale) without Polymarket pricing,
+    matched on their normalized metadata, and then only the matched Kalshi
+    tickers and Polymarket tokens are priced. Kalshi quotes that arrived with
+    a fresh discovery are used as is, though in depth mode the matched order
+    books are still fetched.
+    """
+    kalshi_discovered, _ = await asyncio.gather(
+        kalshi.ensure_discovered(), polymarket.ensure_discovered()
+    )
+
+    matcher = NormalizeSportsMarket(
+        polymarket_markets=list(polymarket.entries.values()),
+        kalshi_markets=kalshi.market_data,
+        sport=sport,
+    )
+    tickers, questions = matcher.match_markets()
+    tokens = [
+        token
+        for token, (question, _) in polymarket.token_teams.items()
+        if question in questions
+    ]
+    logger.info(
+        "Matched %d %s games across venues (%d Kalshi tickers, %d Polymarket tokens)",
+        len(questions),
+        sport,
+        len(tickers),
+        len(tokens),
+    )
+
+    refreshes = [polymarket.refresh_prices(tokens)]
+    if not kalshi_discovered:
+        # Fetches the matched order books too in depth mode
+        refreshes.append(kalshi.refresh_prices(tickers))
+    elif kalshi.depth:
+        # Discovery carries quotes but no order books
+        refreshes.append(kalshi.refresh_depth(tickers))
+    await asyncio.gather(*refreshes)
+
+    # Only matched markets can produce an opportunity
+    markets_kalshi = [m for m in kalshi.market_data if m["market_ticker"] in tickers]
+    markets_polymarket = [
+        m for m in polymarket.market_data if m["question"] in questions
+    ]
+    save_to_json(markets_kalshi, f"data/{kalshi.market}_markets_kalshi.json")
+    save_to_json(
+        markets_polymarket, f"data/{polymarket.market}_markets_polymarket.json"
+    )
+    return markets_kalshi, markets_polymarket
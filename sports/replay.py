@@ -0,0 +1,256 @@
+"""Offline replay of recorded snapshots through normalization and arbitrage.
+
+Snapshots are processed back to back with no network, sleeping or
+persistence, so detection logic can be evaluated over long recordings in
+seconds:
+
+    python -m sports.replay data --engine numpy --output replay.jsonl
+
+Directories of tick logs written with ``main.py --record`` are rebuilt into
+snapshots. Any source can be limited to a time range:
+
+    python -m sports.replay data/ticks --start 1760000000 --end 1760086400
+"""
+
+import argparse
+import glob
+import heapq
+import json
+import logging
+import os
+import time
+from collections.abc import Iterable, Iterator
+from operator import itemgetter
+from typing import Any
+
+from arbitrage import ENGINES
+from normalize import SPORT_CONFIG, NormalizeSportsMarket
+from ticks import TickLog
+from ticks.format import SEGMENT_SUFFIX
+
+logger = logging.getLogger(__name__)
+
+# (timestamp, sport, raw Kalshi records, raw Polymarket entries)
+Snapshot = tuple[float, str, list[dict[str, Any]], list[dict[str, Any]]]
+
+KALSHI_SUFFIX = "_markets_kalshi.json"
+POLYMARKET_SUFFIX = "_markets_polymarket.json"
+
+
+def _in_range(timestamp: float, start: float | None, end: float | None) -> bool:
+    """Return True if ``timestamp`` falls in the half-open [start, end)."""
+    return (start is None or timestamp >= start) and (end is None or timestamp < end)
+
+
+def iter_directory(
+    path: str,
+    sports: Iterable[str] | None = None,
+    start: float | None = None,
+    end: float | None = None,
+) -> Iterator[Snapshot]:
+    """Yield snapshots from recorded ``<sport>_markets_*.json`` fixture pairs.
+
+    Pairs are read from ``path`` itself and then from each subdirectory in
+    name order, one snapshot per directory and sport. The Kalshi file's
+    modification time serves as the snapshot time and must fall in
+    [``start``, ``end``). Sports missing either venue's file are skipped.
+    """
+    directories = [path] + sorted(
+        entry.path for entry in os.scandir(path) if entry.is_dir()
+    )
+    for directory in directories:
+        pattern = os.path.join(directory, f"*{KALSHI_SUFFIX}")
+        for kalshi_path in sorted(glob.glob(pattern)):
+            sport = os.path.basename(kalshi_path)[: -len(KALSHI_SUFFIX)]
+            if sport not in SPORT_CONFIG or (sports and sport not in sports):
+                continue
+            polymarket_path = os.path.join(directory, f"{sport}{POLYMARKET_SUFFIX}")
+            if not os.path.exists(polymarket_path):
+                logger.debug("No Polymarket snapshot next to %s", kalshi_path)
+                continue
+            timestamp = os.path.getmtime(kalshi_path)
+            if not _in_range(timestamp, start, end):
+                continue
+            with open(kalshi_path, encoding="utf-8") as f:
+                kalshi_markets = json.load(f)
+            with open(polymarket_path, encoding="utf-8") as f:
+                polymarket_markets = json.load(f)
+            yield timestamp, sport, kalshi_markets, polymarket_markets
+
+
+def iter_log(
+    path: str,
+    sports: Iterable[str] | None = None,
+    start: float | None = None,
+    end: float | None = None,
+) -> Iterator[Snapshot]:
+    """Yield snapshots from a JSON Lines log, one snapshot per line.
+
+    Each line holds ``ts``, ``sport``, ``kalshi`` and ``polymarket`` keys,
+    the last two being raw venue records as the clients return them. Only
+    lines with ``ts`` in [``start``, ``end``) are replayed.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if sports and record["sport"] not in sports:
+                continue
+            if not _in_range(record["ts"], start, end):
+                continue
+            yield record["ts"], record["sport"], record["kalshi"], record["polymarket"]
+
+
+def iter_ticks(
+    path: str,
+    sports: Iterable[str] | None = None,
+    start: float | None = None,
+    end: float | None = None,
+) -> Iterator[Snapshot]:
+    """Yield snapshots rebuilt from a directory of recorded tick logs.
+
+    Only ticks received in [``start``, ``end``) are applied. Sports are
+    merged into one stream ordered by snapshot time.
+    """
+    log = TickLog(path)
+    streams = [
+        log.snapshots(sport, start, end)
+        for sport in log.sports()
+        if sport in SPORT_CONFIG and not (sports and sport not in sports)
+    ]
+    return heapq.merge(*streams, key=itemgetter(0))
+
+
+def replay(
+    snapshots: Iterable[Snapshot], engine: str = "python"
+) -> Iterator[tuple[float, str, list[dict[str, Any]]]]:
+    """Normalize and calculate each snapshot, yielding its opportunities."""
+    calculator = ENGINES[engine]
+    for timestamp, sport, kalshi_markets, polymarket_markets in snapshots:
+        normalizer = NormalizeSportsMarket(
+            polymarket_markets=polymarket_markets,
+            kalshi_markets=kalshi_markets,
+            sport=sport,
+        )
+        kalshi, polymarket = normalizer.normalize_markets(save=False)
+        opportunities = calculator(
+            kalshi_markets=kalshi, polymarket_markets=polymarket, sport=sport
+        ).calculate(persist=False)
+        yield timestamp, sport, opportunities
+
+
+def run_replay(
+    path: str,
+    engine: str = "python",
+    sports: Iterable[str] | None = None,
+    output: str | None = None,
+    start: float | None = None,
+    end: float | None = None,
+) -> dict[str, float]:
+    """Replay a snapshot directory, tick log directory or log and report throughput.
+
+    Per-snapshot results are logged and, with ``output``, written as JSON
+    Lines of ``ts``, ``sport`` and ``opportunities``. ``start`` and ``end``
+    limit the replay to a time range. Returns the totals.
+    """
+    sports = set(sports) if sports else None
+    if os.path.isdir(path) and glob.glob(os.path.join(path, f"*{SEGMENT_SUFFIX}")):
+        snapshots = iter_ticks(path, sports, start, end)
+    elif os.path.isdir(path):
+        snapshots = iter_directory(path, sports, start, end)
+    else:
+        snapshots = iter_log(path, sports, start, end)
+
+    snapshot_count = 0
+    opportunity_count = 0
+    profitable_count = 0
+    out = open(output, "w", encoding="utf-8") if output else None
+    start_time = time.perf_counter()
+    try:
+        for timestamp, sport, opportunities in replay(snapshots, engine):
+            snapshot_count += 1
+            opportunity_count += len(opportunities)
+            profitable = sum(1 for o in opportunities if o["profit"] > 0)
+            profitable_count += profitable
+            logger.info(
+                "%s snapshot at %.3f: %d opportunities, %d profitable, best %s",
+                sport,
+                timestamp,
+                len(opportunities),
+                profitable,
+                opportunities[0]["profit"] if opportunities else None,
+            )
+            if out is not None:
+                record = {"ts": timestamp, "sport": sport}
+                record["opportunities"] = opportunities
+                out.write(json.dumps(record) + "\n")
+    finally:
+        if out is not None:
+            out.close()
+    elapsed_time = time.perf_counter() - start_time
+
+    stats = {
+        "snapshots": snapshot_count,
+        "opportunities": opportunity_count,
+        "profitable": profitable_count,
+        "seconds": elapsed_time,
+        "snapshots_per_second": snapshot_count / elapsed_time if elapsed_time else 0.0,
+    }
+    logger.info(
+        "Replayed %d snapshots in %.3f seconds (%.1f snapshots/s): "
+        "%d opportunities, %d profitable",
+        snapshot_count,
+        elapsed_time,
+        stats["snapshots_per_second"],
+        opportunity_count,
+        profitable_count,
+    )
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay recorded market snapshots")
+    parser.add_argument(
+        "path", help="Snapshot directory, tick log directory or JSON Lines log"
+    )
+    parser.add_argument(
+        "--engine",
+        choices=list(ENGINES),
+        default="python",
+        help="Arbitrage calculator implementation",
+    )
+    parser.add_argument(
+        "--sport",
+        action="append",
+        choices=list(SPORT_CONFIG),
+        help="Only replay this sport; repeat for several",
+    )
+    parser.add_argument("--output", help="JSON Lines file for per-snapshot results")
+    parser.add_argument(
+        "--start", type=float, help="Earliest snapshot or receive time (Unix)"
+    )
+    parser.add_argument(
+        "--end", type=float, help="Snapshot or receive time to stop at (Unix)"
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Log every snapshot, which slows the replay down",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    stats = run_replay(
+        args.path, args.engine, args.sport, args.output, args.start, args.end
+    )
+    print(
+        f"Replayed {stats['snapshots']} snapshots in {stats['seconds']:.3f} seconds "
+        f"({stats['snapshots_per_second']:.1f} snapshots/s): "
+        f"{stats['opportunities']} opportunities, {stats['profitable']} profitable"
+    )
@@ -0,0 +1,294 @@
+"""Fixed-rate scheduler running arbitrage cycles for every registered sport."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import aiohttp
+
+from kalshi import Kalshi
+from normalize import SPORT_CONFIG
+from polymarket import Polymarket
+from rate_limit import RateLimiter
+from request_policy import RequestPolicy
+from sinks import OpportunitySink
+from ticks import TickRecorder
+
+from .pipeline import fetch_matched_markets
+from .streaming import calculate_snapshot, stream_sport
+
+logger = logging.getLogger(__name__)
+
+# Seconds between cycle starts for sports without an explicit interval
+DEFAULT_INTERVAL = 30.0
+# Snapshots buffered between the fetch and processing stages when pipelined
+PIPELINE_QUEUE_SIZE = 1
+
+
+def create_clients(
+    sport: str,
+    session: aiohttp.ClientSession | None = None,
+    rate_limiter: RateLimiter | None = None,
+    request_policy: RequestPolicy | None = None,
+    depth: bool = False,
+    recorder: TickRecorder | None = None,
+    kalshi_ws_headers: Callable[[], dict[str, str]] | None = None,
+) -> tuple[Kalshi, Polymarket]:
+    """Build the venue clients for a registered sport.
+
+    With ``depth``, both clients also fetch order book ask ladders. A shared
+    ``recorder`` logs every quote either client receives.
+    ``kalshi_ws_headers`` authenticates the Kalshi websocket.
+    """
+    config = SPORT_CONFIG[sport]
+    kalshi = Kalshi(
+        series_ticker=config["series_ticker"],
+        market=sport,
+        session=session,
+        rate_limiter=rate_limiter,
+        request_policy=request_policy,
+        depth=depth,
+        recorder=recorder,
+        ws_headers=kalshi_ws_headers,
+    )
+    polymarket = Polymarket(
+        tag_id=config["tag_id"],
+        market=sport,
+        session=session,
+        rate_limiter=rate_limiter,
+        request_policy=request_policy,
+        depth=depth,
+        recorder=recorder,
+    )
+    return kalshi, polymarket
+
+
+async def fetch_snapshot(
+    kalshi: Kalshi, polymarket: Polymarket, sport: str, match_first: bool = False
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Fetch both venues and return copies safe to process concurrently."""
+    # Fetch market data concurrently
+    logger.info("Fetching %s market data from Kalshi and Polymarket...", sport)
+    if match_first:
+        markets_kalshi, markets_polymarket = await fetch_matched_markets(
+            kalshi, polymarket, sport
+        )
+    else:
+        markets_kalshi, markets_polymarket = await asyncio.gather(
+            kalshi.get_market_data(), polymarket.get_market_data()
+        )
+
+    logger.info("Loaded %d Kalshi markets", len(markets_kalshi))
+    logger.info("Loaded %d Polymarket markets", len(markets_polymarket))
+
+    # Clients update their records in place on the next refresh
+    return [dict(m) for m in markets_kalshi], [dict(m) for m in markets_polymarket]
+
+
+async def run_cycle(
+    kalshi: Kalshi,
+    polymarket: Polymarket,
+    sport: str,
+    match_first: bool = False,
+    sink: OpportunitySink | None = None,
+    engine: str = "python",
+) -> None:
+    """Fetch both venues, normalize and calculate arbitrage once."""
+    markets_kalshi, markets_polymarket = await fetch_snapshot(
+        kalshi, polymarket, sport, match_first
+    )
+    calculate_snapshot(markets_kalshi, markets_polymarket, sport, sink, engine)
+
+
+async def run_pipelined(
+    kalshi: Kalshi,
+    polymarket: Polymarket,
+    sport: str,
+    interval: float,
+    match_first: bool = False,
+    queue_size: int = PIPELINE_QUEUE_SIZE,
+    sink: OpportunitySink | None = None,
+    engine: str = "python",
+) -> None:
+    """Fetch the next snapshot while the previous one is being processed.
+
+    A fixed-rate fetch stage feeds a bounded queue drained by a processing
+    stage that normalizes, calculates and persists in a worker thread. When
+    processing falls behind, the oldest queued snapshot is dropped in favor
+    of the fresh one rather than stalling the fetch schedule.
+    """
+    snapshots: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    async def fetch() -> None:
+        snapshot = await fetch_snapshot(kalshi, polymarket, sport, match_first)
+        if snapshots.full():
+            snapshots.get_nowait()
+            logger.warning("%s processing is behind, dropped a stale snapshot", sport)
+        snapshots.put_nowait(snapshot)
+
+    async def process() -> None:
+        while True:
+            markets_kalshi, markets_polymarket = await snapshots.get()
+            start_time = time.time()
+            try:
+                await asyncio.to_thread(
+                    calculate_snapshot,
+                    markets_kalshi,
+                    markets_polymarket,
+                    sport,
+                    sink,
+                    engine,
+                )
+            except Exception:
+                logger.exception("%s snapshot processing failed", sport)
+                continue
+            logger.info(
+                "Processed %s snapshot in %.2f seconds",
+                sport,
+                time.time() - start_time,
+            )
+
+    await asyncio.gather(run_fixed_rate(sport, interval, fetch), process())
+
+
+async def run_fixed_rate(
+    name: str, interval: float, cycle: Callable[[], Awaitable[None]]
+) -> None:
+    """Start ``cycle`` every ``interval`` seconds, measured start to start.
+
+    Sleeping until the next scheduled start instead of a fixed delay after
+    each cycle keeps the period from drifting with cycle time. A cycle that
+    overruns its slot is reported as a missed deadline and the next one
+    starts immediately, re-anchoring the schedule from there.
+    """
+    loop = asyncio.get_running_loop()
+    next_start = loop.time()
+    missed_deadlines = 0
+    while True:
+        cycle_start = loop.time()
+        try:
+            await cycle()
+        except Exception:
+            logger.exception("%s cycle failed", name)
+        elapsed_time = loop.time() - cycle_start
+
+        next_start += interval
+        now = loop.time()
+        if now > next_start:
+            missed_deadlines += 1
+            logger.warning(
+                "%s cycle took %.2f seconds and overran its %.1f second interval "
+                "(%d missed deadlines)",
+                name,
+                elapsed_time,
+                interval,
+                missed_deadlines,
+            )
+            next_start = now
+        else:
+            logger.info(
+                "%s cycle completed in %.2f seconds, next in %.2f seconds",
+                name,
+                elapsed_time,
+                next_start - now,
+            )
+        await asyncio.sleep(next_start - now)
+
+
+async def run_sport(
+    sport: str,
+    session: aiohttp.ClientSession | None = None,
+    rate_limiter: RateLimiter | None = None,
+    request_policy: RequestPolicy | None = None,
+    stream: bool = False,
+    match_first: bool = False,
+    pipeline: bool = False,
+    sink: OpportunitySink | None = None,
+    engine: str = "python",
+    depth: bool = False,
+    recorder: TickRecorder | None = None,
+    stream_kalshi: bool = False,
+    kalshi_ws_headers: Callable[[], dict[str, str]] | None = None,
+) -> None:
+    """Run arbitrage for one registered sport until cancelled.
+
+    In ``stream`` mode Polymarket is streamed, and Kalshi too with
+    ``stream_kalshi`` (authenticated by ``kalshi_ws_headers``); otherwise
+    Kalshi is polled.
+    """
+    kalshi, polymarket = create_clients(
+        sport,
+        session,
+        rate_limiter,
+        request_policy,
+        depth,
+        recorder,
+        kalshi_ws_headers,
+    )
+    if stream:
+        await stream_sport(
+            kalshi,
+            polymarket,
+            sport,
+            stream_kalshi=stream_kalshi,
+            sink=sink,
+            engine=engine,
+        )
+        return
+
+    interval = SPORT_CONFIG[sport].get("interval", DEFAULT_INTERVAL)
+    if pipeline:
+        await run_pipelined(
+            kalshi, polymarket, sport, interval, match_first, sink=sink, engine=engine
+        )
+        return
+    await run_fixed_rate(
+        sport,
+        interval,
+        lambda: run_cycle(kalshi, polymarket, sport, match_first, sink, engine),
+    )
+
+
+async def run_scheduler(
+    sports: list[str],
+    session: aiohttp.ClientSession | None = None,
+    rate_limiter: RateLimiter | None = None,
+    request_policy: RequestPolicy | None = None,
+    stream: bool = False,
+    match_first: bool = False,
+    pipeline: bool = False,
+    sink: OpportunitySink | None = None,
+    engine: str = "python",
+    depth: bool = False,
+    recorder: TickRecorder | None = None,
+    stream_kalshi: bool = False,
+    kalshi_ws_headers: Callable[[], dict[str, str]] | None = None,
+) -> None:
+    """Run every listed sport concurrently on its own schedule."""
+    start_time = time.time()
+    logger.info("Scheduling sports: %s", ", ".join(sports))
+    try:
+        await asyncio.gather(
+            *[
+                run_sport(
+                    sport,
+                    session,
+                    rate_limiter,
+                    request_policy,
+                    stream=stream,
+                    match_first=match_first,
+                    pipeline=pipeline,
+                    sink=sink,
+                    engine=engine,
+                    depth=depth,
+                    recorder=recorder,
+                    stream_kalshi=stream_kalshi,
+                    kalshi_ws_headers=kalshi_ws_headers,
+                )
+                for sport in sports
+            ]
+        )
+    finally:
+        logger.info("Scheduler stopped after %.2f seconds", time.time() - start_time)
@@ -0,0 +1,97 @@
+"""Streaming arbitrage loop driven by live venue updates."""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from arbitrage import ENGINES
+from kalshi import Kalshi
+from normalize import NormalizeSportsMarket
+from polymarket import Polymarket
+from sinks import OpportunitySink
+from supabase_client import delete_by_sport
+
+logger = logging.getLogger(__name__)
+
+
+async def stream_sport(
+    kalshi: Kalshi,
+    polymarket: Polymarket,
+    sport: str,
+    stream_kalshi: bool = False,
+    kalshi_interval: float = 30.0,
+    min_recompute_interval: float = 1.0,
+    sink: OpportunitySink | None = None,
+    engine: str = "python",
+) -> None:
+    """Recompute arbitrage whenever streamed venue prices change.
+
+    Polymarket is always streamed. Kalshi is streamed when ``stream_kalshi``
+    is set (its websocket requires authenticated ``ws_headers``), otherwise it
+    is polled every ``kalshi_interval`` seconds. Bursts of book updates are
+    coalesced into at most one recompute per ``min_recompute_interval``.
+    """
+    changed = asyncio.Event()
+
+    async def poll_kalshi() -> None:
+        while True:
+            try:
+                await kalshi.get_market_data()
+                changed.set()
+            except Exception as e:
+                logger.error("Failed to refresh Kalshi markets for %s: %s", sport, e)
+            await asyncio.sleep(kalshi_interval)
+
+    async def consume_kalshi() -> None:
+        async for _ in kalshi.stream_market_data():
+            changed.set()
+
+    async def consume_polymarket() -> None:
+        async for _ in polymarket.stream_market_data():
+            changed.set()
+
+    async def recompute() -> None:
+        while True:
+            await changed.wait()
+            changed.clear()
+            start_time = time.time()
+            calculate_snapshot(
+                kalshi.market_data, polymarket.market_data, sport, sink, engine
+            )
+            elapsed_time = time.time() - start_time
+            logger.info("Recomputed %s arbitrage in %.3f seconds", sport, elapsed_time)
+            await asyncio.sleep(max(0.0, min_recompute_interval - elapsed_time))
+
+    kalshi_task = consume_kalshi() if stream_kalshi else poll_kalshi()
+    await asyncio.gather(kalshi_task, consume_polymarket(), recompute())
+
+
+def calculate_snapshot(
+    kalshi_markets: list[dict[str, Any]],
+    polymarket_markets: list[dict[str, Any]],
+    sport: str,
+    sink: OpportunitySink | None = None,
+    engine: str = "python",
+) -> None:
+    """Normalize a snapshot of both venues and calculate arbitrage.
+
+    ``engine`` names the calculator in ``arbitrage.ENGINES``. Without a
+    ``sink`` the sport's Supabase rows are replaced synchronously.
+    """
+    normalizer = NormalizeSportsMarket(
+        polymarket_markets=polymarket_markets,
+        kalshi_markets=kalshi_markets,
+        sport=sport,
+    )
+    kalshi, polymarket = normalizer.normalize_markets()
+
+    arbitrage_calculator = ENGINES[engine](
+        kalshi_markets=kalshi,
+        polymarket_markets=polymarket,
+        sport=sport,
+        sink=sink,
+    )
+    if sink is None:
+        delete_by_sport(sport)
+    arbitrage_calculator.calculate()
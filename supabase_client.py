@@ -14,8 +14,34 @@ logger = logging.getLogger(__name__)
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 
+# Columns of the sports table; rows are keyed by the unique market hash
+SPORTS_COLUMNS = (
+    "hash",
+    "question",
+    "date",
+    "kalshi",
+    "polymarket",
+    "profit",
+    "fee",
+    "net_profit",
+    "break_even_size",
+    "kalshi_link",
+    "polymarket_link",
+    "sport",
+)
+# Columns added to the original table by misc/sports_hash.sql
+MIGRATED_SPORTS_COLUMNS = ("hash", "fee", "net_profit", "break_even_size")
+# Columns of tables the migration has not been applied to
+LEGACY_SPORTS_COLUMNS = tuple(
+    column for column in SPORTS_COLUMNS if column not in MIGRATED_SPORTS_COLUMNS
+)
+# PostgreSQL error code for a column the table does not have
+UNDEFINED_COLUMN = "42703"
+
 # Initialize Supabase client
 _supabase_client: Any | None = None
+# Whether the sports table has the hash column, once probed
+_hash_keyed: bool | None = None
 
 
 def _get_supabase_client() -> Any:
@@ -30,6 +56,42 @@ def _get_supabase_client() -> Any:
     return _supabase_client
 
 
+def hash_keyed() -> bool:
+    """Return True when the sports table has the migrated columns, probing once.
+
+    Tables created before ``misc/sports_hash.sql`` was applied lack the hash
+    key and fee columns, and are written by replacing each sport's rows
+    instead of diff-syncing.
+    """
+    global _hash_keyed
+    if _hash_keyed is None:
+        client = _get_supabase_client()
+        try:
+            columns = ",".join(MIGRATED_SPORTS_COLUMNS)
+            client.table("sports").select(columns).limit(1).execute()
+        except Exception as e:
+            if getattr(e, "code", None) != UNDEFINED_COLUMN:
+                raise
+            logger.warning(
+                "The sports table lacks the hash and fee columns; replacing rows "
+                "per sport. Apply misc/sports_hash.sql to write only changed rows"
+            )
+            _hash_keyed = False
+        else:
+            _hash_keyed = True
+    return _hash_keyed
+
+
+def _sports_rows(opportunities: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Keep only the columns the sports table has."""
+    # Engines may add analysis fields the table has no columns for
+    columns = SPORTS_COLUMNS if hash_keyed() else LEGACY_SPORTS_COLUMNS
+    return [
+        {column: opportunity.get(column) for column in columns}
+        for opportunity in opportunities
+    ]
+
+
 def write_sports_arbitrage_to_supabase(opportunities: list[dict[str, Any]]) -> None:
     """Write sports arbitrage opportunities to Supabase via client batch insert."""
     if not opportunities:
@@ -37,8 +99,9 @@ def write_sports_arbitrage_to_supabase(opportunities: list[dict[str, Any]]) -> N
         return
 
     try:
+        rows = _sports_rows(opportunities)
         client = _get_supabase_client()
-        response = client.table("sports").insert(opportunities).execute()
+        response = client.table("sports").insert(rows).execute()
         logger.info(
             "Successfully wrote %d opportunities to Supabase", len(opportunities)
         )
@@ -54,3 +117,73 @@ def delete_by_sport(sport: str) -> None:
         logger.info("Successfully deleted all rows for sport: %s", sport)
     except Exception as e:
         logger.error("Failed to delete rows for sport %s: %s", sport, e)
+
+
+def replace_sport_opportunities(
+    sport: str, opportunities: list[dict[str, Any]], batch_size: int
+) -> None:
+    """Replace a sport's rows with a snapshot; raises if a request fails."""
+    rows = _sports_rows(opportunities)
+    client = _get_supabase_client()
+    client.table("sports").delete().eq("sport", sport).execute()
+    for i in range(0, len(rows), batch_size):
+        client.table("sports").insert(rows[i : i + batch_size]).execute()
+    logger.info("Replaced %s: %d rows written", sport, len(rows))
+
+
+def fetch_written_rows(sport: str) -> dict[str, dict[str, Any]]:
+    """Load a sport's rows from the sports table, keyed by market hash."""
+    client = _get_supabase_client()
+    response = (
+        client.table("sports").select(",".join(SPORTS_COLUMNS)).eq("sport", sport)
+    ).execute()
+    return {row["hash"]: row for row in response.data}
+
+
+def sync_sport_opportunities(
+    sport: str,
+    opportunities: list[dict[str, Any]],
+    written: dict[str, dict[str, Any]],
+    batch_size: int,
+) -> None:
+    """Bring a sport's rows in line with a new snapshot using only the changes.
+
+    ``written`` is the last state known to be in the table and is updated in
+    place. New and changed rows are sent as upserts on ``hash`` (a unique
+    column added by ``misc/sports_hash.sql``) and rows that disappeared are
+    removed with a single targeted delete, so unchanged rows are never
+    rewritten.
+    """
+    rows = {
+        opportunity["hash"]: {
+            column: opportunity.get(column) for column in SPORTS_COLUMNS
+        }
+        for opportunity in opportunities
+    }
+    changed = [
+        row for market_hash, row in rows.items() if written.get(market_hash) != row
+    ]
+    stale = [market_hash for market_hash in written if market_hash not in rows]
+    if not changed and not stale:
+        logger.debug("No changes to write for sport: %s", sport)
+        return
+
+    client = _get_supabase_client()
+    for i in range(0, len(changed), batch_size):
+        client.table("sports").upsert(
+            changed[i : i + batch_size], on_conflict="hash"
+        ).execute()
+    if stale:
+        client.table("sports").delete().in_("hash", stale).execute()
+
+    for market_hash in stale:
+        del written[market_hash]
+    for row in changed:
+        written[row["hash"]] = row
+    logger.info(
+        "Synced %s: %d upserted, %d deleted, %d unchanged",
+        sport,
+        len(changed),
+        len(stale),
+        len(rows) - len(changed),
+    )
@@ -0,0 +1,127 @@
+"""Two-team calculator tests over the recorded fixtures."""
+
+import copy
+import json
+
+import pytest
+
+from arbitrage import ENGINES
+from normalize import Market, NormalizeSportsMarket
+from normalize.records import Quote
+
+# Question -> profit of every opportunity found in each sport's fixtures
+EXPECTED = {
+    "nba": {
+        "Mavericks vs Nuggets": 0.01,
+        "Cavaliers vs Pacers": -0.01,
+        "Clippers vs Heat": -0.01,
+        "Lakers vs Pelicans": -0.01,
+        "Lakers vs Suns": -0.01,
+        "Spurs vs Timberwolves": -0.01,
+    },
+    "nhl": {
+        "Blackhawks vs Ducks": -0.01,
+        "Capitals vs Islanders": -0.01,
+        "Senators vs Stars": -0.01,
+        "Flyers vs Penguins": -0.02,
+        "Jets vs Sabres": -0.04,
+        "Blues vs Ducks": -0.05,
+        "Maple Leafs vs Panthers": -0.05,
+        "Oilers vs Wild": -0.08,
+        "Avalanche vs Canucks": -0.09,
+        "Canadiens vs Senators": -0.09,
+        "Flames vs Predators": -0.1,
+        "Rangers vs Stars": -0.1,
+        "Bruins vs Red Wings": -0.11,
+    },
+    "nfl": {
+        "Bears vs Packers": -0.01,
+        "Bills vs Steelers": -0.01,
+        "Broncos vs Commanders": -0.01,
+        "Buccaneers vs Cardinals": -0.01,
+        "Falcons vs Seahawks": -0.01,
+        "Bengals vs Bills": -0.02,
+        "Buccaneers vs Saints": -0.02,
+        "Cowboys vs Lions": -0.02,
+        "Commanders vs Vikings": -0.03,
+        "Ravens vs Steelers": -0.03,
+        "Chiefs vs Texans": -0.04,
+        "Dolphins vs Jets": -0.06,
+        "Browns vs Titans": -0.07,
+        "Cardinals vs Rams": -0.16,
+        "Chargers vs Eagles": -0.35,
+    },
+    "cs2": {
+        "Liquid vs MIBR": 0.01,
+        "FaZe vs NIP": -0.01,
+        "M80 vs TYLOO": -0.01,
+        "B8 vs NAVI": -0.02,
+        "Imperial vs fnatic": -0.02,
+    },
+}
+
+
+def load_markets(sport: str) -> tuple[dict[str, Market], dict[str, Market]]:
+    markets = []
+    for venue in ("polymarket", "kalshi"):
+        with open(f"data/{sport}_markets_{venue}.json", encoding="utf-8") as f:
+            markets.append(json.load(f))
+    return NormalizeSportsMarket(*markets, sport).normalize_markets(save=False)
+
+
+def market(venue: str, quotes: dict[str, float], complements=None) -> Market:
+    return Market(
+        "game",
+        "Home vs. Away",
+        "2025-12-01",
+        venue,
+        quotes={team: Quote(team, price) for team, price in quotes.items()},
+        complements={
+            team: Quote(team, price, side="no")
+            for team, price in (complements or {}).items()
+        },
+    )
+
+
+@pytest.mark.parametrize("sport", EXPECTED)
+def test_fixture_opportunities(sport):
+    kalshi_markets, polymarket_markets = load_markets(sport)
+    results = {
+        engine: calculator(
+            copy.deepcopy(kalshi_markets), copy.deepcopy(polymarket_markets), sport
+        ).calculate(persist=False)
+        for engine, calculator in ENGINES.items()
+        if engine != "solver"
+    }
+
+    found = {
+        opportunity["question"]: opportunity["profit"]
+        for opportunity in results["python"]
+    }
+    assert found == EXPECTED[sport]
+    assert results["numpy"] == results["python"]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_complement_tie_keeps_the_cross_venue_cover(engine):
+    # Home costs 0.50 on both venues, the Polymarket one via the Away bid, and
+    # Away is cheapest on Polymarket. Home must still go to Kalshi.
+    calculator = ENGINES[engine](
+        {"game": market("kalshi", {"Home": 0.50, "Away": 0.52})},
+        {"game": market("polymarket", {"Home": 0.55, "Away": 0.45}, {"Home": 0.50})},
+        "nba",
+    )
+    (opportunity,) = calculator.calculate(persist=False)
+
+    assert opportunity["profit"] == pytest.approx(0.05)
+    assert opportunity["net_profit"] < opportunity["profit"]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_break_even_covers_are_dropped(engine):
+    calculator = ENGINES[engine](
+        {"game": market("kalshi", {"Home": 0.40, "Away": 0.65})},
+        {"game": market("polymarket", {"Home": 0.45, "Away": 0.60})},
+        "nba",
+    )
+    assert calculator.calculate(persist=False) == []
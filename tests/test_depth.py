@@ -0,0 +1,58 @@
+"""Order book depth walks over hand-built ask ladders."""
+
+import pytest
+
+from arbitrage.depth import walk_depth
+
+
+def points(curve: list[tuple[float, float]]) -> list:
+    return [(size, pytest.approx(profit)) for size, profit in curve]
+
+
+def test_walks_uneven_levels_until_a_book_is_exhausted():
+    ladders = [
+        [(0.40, 100.0), (0.45, 50.0)],
+        [(0.50, 30.0), (0.52, 200.0)],
+    ]
+    size, curve = walk_depth(ladders)
+    # 30 at 0.90, 70 more at 0.92 once the second leg moves up, then 50 at
+    # 0.97 until the first leg's book runs out
+    assert size == 150.0
+    assert curve == points([(30.0, 3.0), (100.0, 8.6), (150.0, 10.1)])
+
+
+def test_stops_at_the_first_unprofitable_level():
+    ladders = [
+        [(0.40, 100.0), (0.60, 100.0)],
+        [(0.50, 50.0), (0.55, 500.0)],
+    ]
+    size, curve = walk_depth(ladders)
+    # Both books have size left, but 0.60 + 0.55 costs more than the payout
+    assert size == 100.0
+    assert curve == points([(50.0, 5.0), (100.0, 7.5)])
+
+
+def test_break_even_level_is_not_bought():
+    assert walk_depth([[(0.45, 10.0)], [(0.55, 10.0)]]) == (0.0, [])
+
+
+def test_levels_ending_together_advance_both_legs():
+    ladders = [
+        [(0.30, 10.0), (0.35, 10.0)],
+        [(0.60, 10.0), (0.62, 5.0)],
+    ]
+    size, curve = walk_depth(ladders)
+    assert size == 15.0
+    assert curve == points([(10.0, 1.0), (15.0, 1.15)])
+
+
+@pytest.mark.parametrize(
+    "ladders",
+    [
+        [],
+        [[], [(0.40, 10.0)]],
+        [[(0.40, 10.0)], []],
+    ],
+)
+def test_empty_ladder_has_no_depth(ladders):
+    assert walk_depth(ladders) == (0.0, [])
@@ -0,0 +1,72 @@
+"""Fee table and break-even size tests."""
+
+import itertools
+
+import pytest
+
+from arbitrage.fees import (
+    FEE_TABLES,
+    KALSHI_FEE_RATE,
+    break_even_size,
+    fee_per_contract,
+    order_fee,
+)
+
+
+def test_fee_table_covers_every_cent():
+    table = FEE_TABLES["kalshi"]
+    assert len(table) == 101
+    # Contracts priced at 0 or 1 carry no fee
+    assert table[0] == table[100] == 0.0
+    assert table[50] == pytest.approx(KALSHI_FEE_RATE * 0.25)
+    assert max(table) == table[50]
+
+
+def test_fee_per_contract_looks_up_the_nearest_cent():
+    assert fee_per_contract("kalshi", 0.5) == FEE_TABLES["kalshi"][50]
+    # 0.29 * 100 is 28.999999999999996 in floating point
+    assert fee_per_contract("kalshi", 0.29) == FEE_TABLES["kalshi"][29]
+    assert fee_per_contract("kalshi", 0.0) == 0.0
+    assert fee_per_contract("kalshi", 1.0) == 0.0
+    assert fee_per_contract("polymarket", 0.5) == 0.0
+    assert fee_per_contract("unknown", 0.5) == 0.0
+
+
+def test_order_fee_rounds_up_to_the_cent():
+    fee = fee_per_contract("kalshi", 0.5)
+    assert order_fee(fee, 1) == 0.02
+    assert order_fee(fee, 100) == 1.75
+    assert order_fee(fee, 101) == 1.77
+    assert order_fee(0.0, 10) == 0.0
+    # 0.07 * 100 carries float noise above 7 cents
+    assert order_fee(0.0007, 100) == 0.07
+
+
+def test_break_even_size_needs_a_positive_margin():
+    assert break_even_size(0.01, [0.01]) is None
+    assert break_even_size(-0.02, [0.0, 0.0]) is None
+
+
+def test_break_even_size_without_fees_is_one_contract():
+    assert break_even_size(0.01, [0.0, 0.0]) == 1
+
+
+def test_break_even_size_covers_a_cent_of_rounding_per_charged_leg():
+    fee = fee_per_contract("kalshi", 0.5)
+    # A 0.0025 margin per contract absorbs a full cent of rounding at 4
+    assert break_even_size(0.02, [fee, 0.0]) == 4
+    assert break_even_size(0.0375, [fee, fee]) == 8
+
+
+@pytest.mark.parametrize(
+    "profit, cents",
+    list(itertools.product([0.01, 0.02, 0.05, 0.1], [(50, 0), (30, 70), (10, 5)])),
+)
+def test_break_even_size_holds_for_every_larger_order(profit, cents):
+    fees = [fee_per_contract("kalshi", cent / 100) for cent in cents]
+    size = break_even_size(profit, fees)
+    if size is None:
+        assert profit <= sum(fees)
+        return
+    for n in range(size, size + 200):
+        assert n * profit >= sum(order_fee(fee, n) for fee in fees) - 1e-9
@@ -0,0 +1,80 @@
+"""Rate limiting and request policy tests against a local server."""
+
+import asyncio
+
+import aiohttp
+from aiohttp import web
+
+from http_session import request_json
+from rate_limit import RateLimiter
+from request_policy import RequestPolicy
+
+
+async def serve(handler) -> tuple[web.AppRunner, str]:
+    """Serve ``handler`` on an ephemeral port and return the runner and URL."""
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner, f"http://127.0.0.1:{runner.addresses[0][1]}/"
+
+
+def test_token_waits_do_not_count_against_the_deadline():
+    hits = 0
+
+    async def handler(request):
+        nonlocal hits
+        hits += 1
+        return web.json_response({"ok": True})
+
+    async def run():
+        runner, url = await serve(handler)
+        try:
+            # Two requests per second, so the last of eight waits ~3 seconds
+            rate_limiter = RateLimiter(host_rates={"127.0.0.1": 2.0})
+            policy = RequestPolicy(deadline=0.5, max_retries=0, hedge=False)
+            async with aiohttp.ClientSession() as session:
+                return await asyncio.gather(
+                    *[
+                        request_json(
+                            session,
+                            "GET",
+                            url,
+                            rate_limiter=rate_limiter,
+                            policy=policy,
+                        )
+                        for _ in range(8)
+                    ]
+                )
+        finally:
+            await runner.cleanup()
+
+    assert asyncio.run(run()) == [{"ok": True}] * 8
+    # No attempt timed out waiting for a token, so nothing was re-sent
+    assert hits == 8
+
+
+def test_retry_after_pauses_do_not_count_against_the_deadline():
+    hits = 0
+
+    async def handler(request):
+        nonlocal hits
+        hits += 1
+        if hits <= 2:
+            return web.json_response({}, status=429, headers={"Retry-After": "0.6"})
+        return web.json_response({"ok": True})
+
+    async def run():
+        runner, url = await serve(handler)
+        try:
+            policy = RequestPolicy(deadline=0.5, max_retries=0, hedge=False)
+            async with aiohttp.ClientSession() as session:
+                return await request_json(
+                    session, "GET", url, rate_limiter=RateLimiter(), policy=policy
+                )
+        finally:
+            await runner.cleanup()
+
+    assert asyncio.run(run()) == {"ok": True}
+    assert hits == 3
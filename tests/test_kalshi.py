@@ -0,0 +1,144 @@
+"""Kalshi client tests against the fake Kalshi server."""
+
+import asyncio
+import json
+
+import pytest
+
+from fakes import FakeKalshiServer
+
+SPORTS = ["nba", "nfl", "nhl"]
+
+
+def load_fixture(sport: str) -> dict[str, dict]:
+    """Return a sport's recorded Kalshi records by market ticker."""
+    with open(f"data/{sport}_markets_kalshi.json", encoding="utf-8") as f:
+        return {record["market_ticker"]: record for record in json.load(f)}
+
+
+@pytest.mark.parametrize("bulk", [True, False])
+@pytest.mark.parametrize("sport", SPORTS)
+def test_discovery_pages_through_every_event(sport, bulk):
+    fixture = load_fixture(sport)
+
+    async def run():
+        server = FakeKalshiServer(sport)
+        await server.start()
+        try:
+            client = server.client(bulk=bulk)
+            # Several event pages per series
+            client.EVENTS_PAGE_LIMIT = 3
+            assert await client.ensure_discovered()
+            assert not await client.ensure_discovered()
+            return client.market_data
+        finally:
+            await server.stop()
+
+    records = asyncio.run(run())
+    assert {r["market_ticker"]: r for r in records} == fixture
+
+
+def test_refresh_prices_picks_up_book_changes():
+    async def run():
+        server = FakeKalshiServer("nba")
+        await server.start()
+        try:
+            client = server.client()
+            await client.ensure_discovered()
+            ticker = client.market_data[0]["market_ticker"]
+            book = server.books[ticker]
+            yes_bid = book.best_bid()
+            book.replace([(yes_bid - 1, 100)], list(book.asks.items()))
+            await client.refresh_prices([ticker])
+            return ticker, yes_bid, client.market_data
+        finally:
+            await server.stop()
+
+    ticker, yes_bid, records = asyncio.run(run())
+    fixture = load_fixture("nba")
+    for record in records:
+        if record["market_ticker"] == ticker:
+            assert record["yes_bid"] == yes_bid - 1
+            assert record["no_ask"] == 100 - (yes_bid - 1)
+        else:
+            assert record == fixture[record["market_ticker"]]
+
+
+def test_depth_carries_ask_ladders():
+    async def run():
+        server = FakeKalshiServer("nba")
+        await server.start()
+        try:
+            client = server.client(depth=True)
+            return await client.get_market_data()
+        finally:
+            await server.stop()
+
+    records = asyncio.run(run())
+    assert records
+    for record in records:
+        assert record["yes_asks"] == [(record["yes_ask"], 100)]
+        assert record["no_asks"] == [(record["no_ask"], 100)]
+
+
+# Gaps land after the 32 snapshots so each connection reaches the deltas
+@pytest.mark.parametrize("gap_every", [None, 40])
+def test_stream_tracks_the_server_books(gap_every):
+    async def run():
+        server = FakeKalshiServer("nba", interval=0.02, gap_every=gap_every)
+        await server.start()
+        try:
+            client = server.client()
+            client.WS_RECONNECT_DELAY = 0.01
+            stream = client.stream_market_data()
+            updates = 0
+            async for record in stream:
+                updates += 1
+                # A move arrives as two deltas; stop once one has fully landed
+                market = server._market(record["market_ticker"])
+                settled = all(record[key] == market[key] for key in client.QUOTE_SIDES)
+                if updates >= 10 and settled:
+                    break
+            # Close the websocket before the server waits on it
+            await stream.aclose()
+            expected = {
+                record["market_ticker"]: server._market(record["market_ticker"])
+                for record in client.market_data
+            }
+            return client.market_data, expected, server.connections
+        finally:
+            await server.stop()
+
+    records, expected, connections = asyncio.run(run())
+    for record in records:
+        market = expected[record["market_ticker"]]
+        assert {key: record[key] for key in ("yes_bid", "yes_ask", "no_bid")} == {
+            key: market[key] for key in ("yes_bid", "yes_ask", "no_bid")
+        }
+    if gap_every:
+        # Sequence gaps force a resubscribe
+        assert connections > 1
+
+
+def test_stream_picks_up_new_events():
+    async def run():
+        server = FakeKalshiServer("nba", interval=0.02)
+        listed = server.events.pop()
+        await server.start()
+        try:
+            client = server.client(discovery_interval=0.2)
+            stream = client.stream_market_data()
+            tickers = {market["ticker"] for market in listed["markets"]}
+            async for _ in stream:
+                if listed not in server.events:
+                    server.events.append(listed)
+                # Resubscribing sends the new markets' book snapshots
+                if tickers <= set(client.books):
+                    break
+            await stream.aclose()
+            return tickers, client.market_data
+        finally:
+            await server.stop()
+
+    tickers, records = asyncio.run(asyncio.wait_for(run(), 10))
+    assert tickers <= {record["market_ticker"] for record in records}
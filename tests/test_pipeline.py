@@ -0,0 +1,36 @@
+"""Match-first fetching against both fake venue servers."""
+
+import asyncio
+import copy
+
+import pytest
+
+from fakes import FakeKalshiServer, FakePolymarketServer
+from sports.pipeline import fetch_matched_markets
+
+
+@pytest.mark.parametrize("sport", ["nba", "nhl"])
+def test_matched_markets_carry_depth_from_the_first_cycle(sport):
+    async def run():
+        kalshi_server = FakeKalshiServer(sport)
+        polymarket_server = FakePolymarketServer(sport)
+        await kalshi_server.start()
+        await polymarket_server.start()
+        try:
+            kalshi = kalshi_server.client(depth=True)
+            polymarket = polymarket_server.client(depth=True)
+            # Discovery cycle, then a refresh cycle; records are updated in
+            # place, so keep a copy of each cycle's view
+            return [
+                copy.deepcopy(await fetch_matched_markets(kalshi, polymarket, sport))
+                for _ in range(2)
+            ]
+        finally:
+            await kalshi_server.stop()
+            await polymarket_server.stop()
+
+    for markets_kalshi, markets_polymarket in asyncio.run(run()):
+        assert markets_kalshi and markets_polymarket
+        for record in markets_kalshi:
+            assert record["yes_asks"] == [(record["yes_ask"], 100)]
+            assert record["no_asks"] == [(record["no_ask"], 100)]
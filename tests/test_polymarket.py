@@ -0,0 +1,213 @@
+"""Polymarket client tests against the fake Polymarket server."""
+
+import asyncio
+import json
+
+import pytest
+
+from fakes import FakePolymarketServer
+from fakes.polymarket_server import LEVEL_SIZE, SPREAD
+from normalize.resolver import normalize_name
+
+SPORTS = ["nba", "nfl", "nhl", "cs2"]
+
+
+def load_asks(sport: str) -> dict[str, dict[str, float | None]]:
+    """Return each recorded question's BUY prices by normalized team name."""
+    with open(f"data/{sport}_markets_polymarket.json", encoding="utf-8") as f:
+        fixture = json.load(f)
+    return {
+        entry["question"]: {
+            normalize_name(key[: -len(" BUY")]): value
+            for key, value in entry.items()
+            if key.endswith(" BUY")
+        }
+        for entry in fixture
+    }
+
+
+def entry_asks(entry: dict) -> dict[str, float | None]:
+    """Return a market entry's BUY prices by normalized team name."""
+    return {
+        normalize_name(key[: -len(" BUY")]): value
+        for key, value in entry.items()
+        if key.endswith(" BUY")
+    }
+
+
+@pytest.mark.parametrize("sport", SPORTS)
+def test_discovery_pages_through_every_market(sport):
+    asks = load_asks(sport)
+
+    async def run():
+        server = FakePolymarketServer(sport)
+        await server.start()
+        try:
+            client = server.client(price_batch_size=7, discovery_prefetch=2)
+            # Several Gamma pages per sport
+            client.GAMMA_PAGE_LIMIT = 5
+            return await client.get_market_data()
+        finally:
+            await server.stop()
+
+    entries = asyncio.run(run())
+    assert {entry["question"]: entry_asks(entry) for entry in entries} == asks
+
+
+def test_failed_discovery_keeps_the_catalog():
+    async def run():
+        server = FakePolymarketServer("nba")
+        await server.start()
+        try:
+            client = server.client()
+            client.GAMMA_PAGE_LIMIT = 5
+            first = await client.get_market_data()
+            # Serve one short page so the walk stops early, then fail the next
+            client.discovered_at = 0
+            fetch_json = client._fetch_json
+
+            async def flaky(session, url, params):
+                if params.get("offset"):
+                    raise RuntimeError("Gamma unavailable")
+                return await fetch_json(session, url, params)
+
+            client._fetch_json = flaky
+            second = await client.get_market_data()
+            return first, second, client.discovered_at
+        finally:
+            await server.stop()
+
+    first, second, discovered_at = asyncio.run(run())
+    assert second == first
+    # Discovery stays due so the next cycle retries
+    assert discovered_at == 0
+
+
+def test_refresh_prices_picks_up_book_changes():
+    async def run():
+        server = FakePolymarketServer("nba")
+        await server.start()
+        try:
+            client = server.client()
+            await client.get_market_data()
+            token = next(iter(client.token_teams))
+            book = server.books[token]
+            ask = book.best_ask()
+            book.set_level("ask", ask, 0)
+            book.set_level("ask", round(ask + SPREAD, 2), LEVEL_SIZE)
+            entries = await client.refresh_prices([token])
+            return client.token_teams[token], round(ask + SPREAD, 2), entries
+        finally:
+            await server.stop()
+
+    (question, team), ask, entries = asyncio.run(run())
+    entry = next(entry for entry in entries if entry["question"] == question)
+    assert entry[f"{team} BUY"] == ask
+
+
+def test_depth_carries_ladders():
+    async def run():
+        server = FakePolymarketServer("nhl")
+        await server.start()
+        try:
+            client = server.client(depth=True)
+            return await client.get_market_data(), client.token_teams
+        finally:
+            await server.stop()
+
+    entries, token_teams = asyncio.run(run())
+    by_question = {entry["question"]: entry for entry in entries}
+    for question, team in token_teams.values():
+        entry = by_question[question]
+        ask, bid = entry[f"{team} BUY"], entry[f"{team} BID"]
+        assert entry[f"{team} DEPTH"] == ([(ask, LEVEL_SIZE)] if ask else [])
+        assert entry[f"{team} BID DEPTH"] == ([(bid, LEVEL_SIZE)] if bid else [])
+
+
+def test_stream_tracks_the_server_books():
+    async def run():
+        server = FakePolymarketServer("nba", interval=0.02)
+        await server.start()
+        try:
+            client = server.client()
+            stream = client.stream_market_data()
+            updates = 0
+            async for _ in stream:
+                updates += 1
+                if updates >= 10:
+                    break
+            # Close the websocket before the server waits on it
+            await stream.aclose()
+            expected = {
+                token: server.books[token].best_ask() for token in client.token_teams
+            }
+            return client.market_data, client.token_teams, expected
+        finally:
+            await server.stop()
+
+    entries, token_teams, expected = asyncio.run(run())
+    by_question = {entry["question"]: entry for entry in entries}
+    for token, (question, team) in token_teams.items():
+        assert by_question[question][f"{team} BUY"] == expected[token]
+
+
+def test_stream_picks_up_new_markets():
+    async def run():
+        server = FakePolymarketServer("nba", interval=0.02)
+        listed = server.markets.pop()
+        await server.start()
+        try:
+            client = server.client(discovery_interval=0.2)
+            stream = client.stream_market_data()
+            async for _ in stream:
+                if listed not in server.markets:
+                    server.markets.append(listed)
+                # Resubscribing sends the new tokens' book snapshots
+                if set(json.loads(listed["clobTokenIds"])) <= set(client.books):
+                    break
+            await stream.aclose()
+            return listed["question"], client.market_data
+        finally:
+            await server.stop()
+
+    question, entries = asyncio.run(asyncio.wait_for(run(), 10))
+    assert question in {entry["question"] for entry in entries}
+
+
+def test_stream_keeps_updating_after_failed_rediscovery():
+    async def run():
+        server = FakePolymarketServer("nba", interval=0.02)
+        await server.start()
+        try:
+            client = server.client(discovery_interval=0.1)
+            client.DISCOVERY_RETRY_DELAY = 0.1
+            fetch_json = client._fetch_json
+            failures = 0
+
+            async def flaky(session, url, params):
+                nonlocal failures
+                if client.discovered_at is not None:
+                    failures += 1
+                    raise RuntimeError("Gamma unavailable")
+                return await fetch_json(session, url, params)
+
+            client._fetch_json = flaky
+            stream = client.stream_market_data()
+            updates = 0
+            async for _ in stream:
+                if failures >= 2:
+                    updates += 1
+                    if updates >= 20:
+                        break
+            await stream.aclose()
+            expected = {
+                token: server.books[token].best_ask() for token in client.token_teams
+            }
+            return client.market_data, client.token_teams, expected
+        finally:
+            await server.stop()
+
+    entries, token_teams, expected = asyncio.run(asyncio.wait_for(run(), 10))
+    by_question = {entry["question"]: entry for entry in entries}
+    for token, (question, team) in token_teams.items():
+        assert by_question[question][f"{team} BUY"] == expected[token]
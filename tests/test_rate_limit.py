@@ -0,0 +1,140 @@
+"""AIMD rate adaptation and Retry-After pauses on a fake clock."""
+
+import asyncio
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import pytest
+
+import rate_limit
+from rate_limit import HostRateLimiter, RateLimiter, parse_retry_after
+
+NOW = 1_000.0
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Run the limiter on a fake clock that sleeping advances."""
+    now = SimpleNamespace(value=NOW, sleeps=[])
+
+    async def sleep(delay):
+        now.sleeps.append(delay)
+        now.value += delay
+        await asyncio.sleep(0)
+
+    monkeypatch.setattr(
+        rate_limit,
+        "time",
+        SimpleNamespace(monotonic=lambda: now.value, time=lambda: now.value),
+    )
+    monkeypatch.setattr(
+        rate_limit, "asyncio", SimpleNamespace(sleep=sleep, Lock=asyncio.Lock)
+    )
+    return now
+
+
+def acquire(limiter: HostRateLimiter, count: int = 1) -> None:
+    async def run():
+        for _ in range(count):
+            await limiter.acquire()
+
+    asyncio.run(run())
+
+
+def test_bucket_allows_a_burst_then_paces(clock):
+    limiter = HostRateLimiter("example.com", 10.0)
+    acquire(limiter, 10)
+    assert clock.sleeps == []
+
+    acquire(limiter, 2)
+    assert clock.sleeps == pytest.approx([0.1, 0.1])
+    assert clock.value == pytest.approx(NOW + 0.2)
+
+
+def test_throttling_halves_the_rate_once_per_pause(clock):
+    limiter = HostRateLimiter("example.com", 10.0)
+    limiter.on_throttled(None)
+    assert limiter.rate == 5.0
+    assert limiter.tokens == 0.0
+    assert limiter.blocked_until == NOW + rate_limit.DEFAULT_RETRY_AFTER
+
+    # Responses to requests already in flight do not halve it again
+    clock.value += 0.5
+    limiter.on_throttled(None)
+    assert limiter.rate == 5.0
+
+    clock.value = limiter.blocked_until
+    limiter.on_throttled(None)
+    assert limiter.rate == 2.5
+
+
+def test_rate_never_drops_below_the_minimum(clock):
+    limiter = HostRateLimiter("example.com", 10.0)
+    for _ in range(10):
+        clock.value = limiter.blocked_until
+        limiter.on_throttled(0.0)
+    assert limiter.rate == limiter.min_rate == pytest.approx(0.5)
+
+
+def test_clean_responses_recover_the_rate_additively(clock):
+    limiter = HostRateLimiter("example.com", 10.0)
+    limiter.on_throttled(None)
+    step = 10.0 * rate_limit.INCREASE_FRACTION
+
+    limiter.on_success()
+    assert limiter.rate == pytest.approx(5.0 + step)
+    for _ in range(round(5.0 / step) - 2):
+        limiter.on_success()
+    assert limiter.rate == pytest.approx(10.0 - step)
+
+    limiter.on_success()
+    limiter.on_success()
+    assert limiter.rate == 10.0
+
+
+def test_retry_after_pauses_the_host(clock):
+    limiter = HostRateLimiter("example.com", 10.0)
+    limiter.on_throttled(3.0)
+    acquire(limiter)
+    # Wait out the pause, then for a token at the halved rate: tokens do
+    # not accrue while the host is paused
+    assert clock.sleeps == pytest.approx([3.0, 0.2])
+
+
+def test_shorter_retry_after_does_not_cut_a_pause_short(clock):
+    limiter = HostRateLimiter("example.com", 10.0)
+    limiter.on_throttled(5.0)
+    limiter.on_throttled(1.0)
+    assert limiter.blocked_until == NOW + 5.0
+
+
+@pytest.mark.parametrize(
+    "value, seconds",
+    [
+        (None, None),
+        ("", None),
+        ("2", 2.0),
+        ("1.5", 1.5),
+        ("-3", 0.0),
+        ("soon", None),
+    ],
+)
+def test_parse_retry_after_seconds(value, seconds):
+    assert parse_retry_after(value) == seconds
+
+
+def test_parse_retry_after_http_date(clock):
+    retry_at = datetime.fromtimestamp(NOW + 30, timezone.utc)
+    assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == 30.0
+    past = datetime.fromtimestamp(NOW - 30, timezone.utc)
+    assert parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+
+def test_registry_shares_one_limiter_per_host():
+    limiter = RateLimiter(host_rates={"example.com": 4.0}, default_rate=2.0)
+    kalshi = limiter.for_url("https://api.elections.kalshi.com/trade-api/v2/markets")
+    assert kalshi is limiter.for_url("https://api.elections.kalshi.com/other")
+    assert kalshi.max_rate == rate_limit.DEFAULT_HOST_RATES[kalshi.host]
+    assert limiter.for_url("https://example.com/a").max_rate == 4.0
+    assert limiter.for_url("https://unknown.example/a").max_rate == 2.0
@@ -0,0 +1,138 @@
+"""Offline replay over the recorded fixtures, logs and tick logs."""
+
+import asyncio
+import json
+import os
+import shutil
+
+from sports.replay import iter_directory, iter_log, iter_ticks, replay, run_replay
+from ticks import TickRecorder
+
+SPORTS = ["cs2", "nba", "nfl", "nhl"]
+# Opportunities the python engine finds in each sport's fixtures
+OPPORTUNITIES = {"cs2": 5, "nba": 6, "nfl": 15, "nhl": 13}
+PROFITABLE = {"cs2": 1, "nba": 1, "nfl": 0, "nhl": 0}
+
+
+def load_fixture(sport: str) -> tuple[list[dict], list[dict]]:
+    markets = []
+    for venue in ("kalshi", "polymarket"):
+        with open(f"data/{sport}_markets_{venue}.json", encoding="utf-8") as f:
+            markets.append(json.load(f))
+    return markets[0], markets[1]
+
+
+def counts(snapshots) -> dict[str, int]:
+    return {
+        sport: len(opportunities) for _, sport, opportunities in replay(snapshots)
+    }
+
+
+def test_replays_the_fixture_directory():
+    # cfb has no Polymarket fixture, so it is skipped
+    assert [sport for _, sport, _, _ in iter_directory("data")] == SPORTS
+    assert counts(iter_directory("data")) == OPPORTUNITIES
+
+    stats = run_replay("data", engine="numpy")
+    assert stats["snapshots"] == len(SPORTS)
+    assert stats["opportunities"] == sum(OPPORTUNITIES.values())
+    assert stats["profitable"] == sum(PROFITABLE.values())
+
+
+def test_directory_time_range_uses_modification_times(tmp_path):
+    for minute, sport in enumerate(SPORTS):
+        # One snapshot directory per sport, a minute apart
+        directory = tmp_path / sport
+        directory.mkdir()
+        for venue in ("kalshi", "polymarket"):
+            name = f"{sport}_markets_{venue}.json"
+            shutil.copy(os.path.join("data", name), directory / name)
+            os.utime(directory / name, (minute * 60, minute * 60))
+
+    snapshots = iter_directory(str(tmp_path), start=60, end=180)
+    assert counts(snapshots) == {"nba": 6, "nfl": 15}
+    assert counts(iter_directory(str(tmp_path), sports={"nhl"})) == {"nhl": 13}
+
+
+def test_replays_a_log_within_the_time_range(tmp_path):
+    path = tmp_path / "snapshots.jsonl"
+    with open(path, "w", encoding="utf-8") as f:
+        for ts, sport in enumerate(SPORTS):
+            kalshi, polymarket = load_fixture(sport)
+            record = {"ts": ts, "sport": sport, "kalshi": kalshi}
+            record["polymarket"] = polymarket
+            f.write(json.dumps(record) + "\n")
+
+    assert counts(iter_log(str(path))) == OPPORTUNITIES
+    assert counts(iter_log(str(path), start=1, end=3)) == {"nba": 6, "nfl": 15}
+    assert counts(iter_log(str(path), sports={"cs2"})) == {"cs2": 5}
+
+    output = tmp_path / "results.jsonl"
+    stats = run_replay(str(path), sports=["nba"], output=str(output), start=1)
+    assert stats["snapshots"] == 1
+    with open(output, encoding="utf-8") as f:
+        (result,) = [json.loads(line) for line in f]
+    assert result["sport"] == "nba"
+    assert len(result["opportunities"]) == OPPORTUNITIES["nba"]
+
+
+def test_replays_recorded_ticks(tmp_path):
+    kalshi, polymarket = load_fixture("nba")
+
+    async def record():
+        recorder = TickRecorder(str(tmp_path), flush_interval=0.01)
+        await recorder.start()
+        recorder.record_catalog(
+            "nba",
+            "kalshi",
+            {
+                record["market_ticker"]: {
+                    "event_title": record["event_title"],
+                    "game_date": record["game_date"],
+                }
+                for record in kalshi
+            },
+            100.0,
+        )
+        tokens = {}
+        quotes = []
+        for entry in polymarket:
+            for key, price in entry.items():
+                if key.endswith(" BUY"):
+                    team = key[: -len(" BUY")]
+                    token = f"{entry['question']}|{team}"
+                    tokens[token] = {
+                        "question": entry["question"],
+                        "date": entry["date"],
+                        "slug": entry["slug"],
+                        "team": team,
+                    }
+                    quotes.append((token, "BUY", price))
+        recorder.record_catalog("nba", "polymarket", tokens, 100.0)
+        # The same quotes received in two cycles ten seconds apart
+        for timestamp in (100.0, 110.0):
+            recorder.record_quotes(
+                "nba",
+                "kalshi",
+                [
+                    (record["market_ticker"], side, record[side])
+                    for record in kalshi
+                    for side in ("yes_bid", "yes_ask", "no_bid", "no_ask")
+                ],
+                timestamp,
+            )
+            recorder.record_quotes("nba", "polymarket", quotes, timestamp)
+            # Flush each cycle into its own frames
+            while recorder.pending_count:
+                await asyncio.sleep(0.01)
+        await recorder.close()
+
+    asyncio.run(record())
+
+    replayed = list(replay(iter_ticks(str(tmp_path))))
+    assert [(ts, sport, len(found)) for ts, sport, found in replayed] == [
+        (100.0, "nba", OPPORTUNITIES["nba"]),
+        (110.0, "nba", OPPORTUNITIES["nba"]),
+    ]
+    assert counts(iter_ticks(str(tmp_path), start=105.0)) == {"nba": 6}
+    assert counts(iter_ticks(str(tmp_path), sports={"nhl"})) == {}
@@ -0,0 +1,154 @@
+"""Team resolution and cross-venue matching over the recorded fixtures."""
+
+import json
+
+import pytest
+
+from normalize import SPORT_CONFIG, NormalizeSportsMarket, TeamResolver
+from normalize.resolver import normalize_name, split_question
+
+# Polymarket questions matched to a Kalshi game in each sport's fixtures,
+# two Kalshi tickers each. The "LAR" and "Natus Vincere" games are found
+# through aliases that whole-name lookups resolve.
+MATCHED_QUESTIONS = {
+    "nba": [
+        "Bucks vs. Wizards",
+        "Bulls vs. Magic",
+        "Cavaliers vs. Pacers",
+        "Celtics vs. Cavaliers",
+        "Clippers vs. Heat",
+        "Grizzlies vs. Kings",
+        "Hawks vs. 76ers",
+        "Hawks vs. Pistons",
+        "Mavericks vs. Nuggets",
+        "Pelicans vs. Lakers",
+        "Raptors vs. Knicks",
+        "Spurs vs. Timberwolves",
+        "Suns vs. Lakers",
+        "Thunder vs. Trail Blazers",
+    ],
+    "nhl": [
+        "Blue Jackets vs. Devils",
+        "Bruins vs. Red Wings",
+        "Canucks vs. Avalanche",
+        "Capitals vs. Islanders",
+        "Ducks vs. Blackhawks",
+        "Ducks vs. Blues",
+        "Flames vs. Hurricanes",
+        "Flames vs. Predators",
+        "Jets vs. Sabres",
+        "Maple Leafs vs. Panthers",
+        "Penguins vs. Flyers",
+        "Senators vs. Canadiens",
+        "Senators vs. Stars",
+        "Stars vs. Rangers",
+        "Utah vs. Sharks",
+        "Wild vs. Oilers",
+    ],
+    "nfl": [
+        "49ers vs. Browns",
+        "Bears vs. Packers",
+        "Bengals vs. Bills",
+        "Bills vs. Steelers",
+        "Broncos vs. Commanders",
+        "Cardinals vs. Buccaneers",
+        "Commanders vs. Vikings",
+        "Cowboys vs. Lions",
+        "Dolphins vs. Jets",
+        "Eagles vs. Chargers",
+        "Falcons vs. Jets",
+        "Giants vs. Patriots",
+        "LAR vs. Cardinals",
+        "LAR vs. Panthers",
+        "Raiders vs. Chargers",
+        "Saints vs. Buccaneers",
+        "Seahawks vs. Falcons",
+        "Steelers vs. Ravens",
+        "Texans vs. Chiefs",
+        "Texans vs. Colts",
+        "Titans vs. Browns",
+        "Vikings vs. Seahawks",
+    ],
+    "cs2": [
+        "Counter-Strike: FaZe vs NIP (BO3)",
+        "Counter-Strike: M80 vs TYLOO (BO1)",
+        "Counter-Strike: MIBR vs Liquid (BO3)",
+        "Counter-Strike: Natus Vincere vs B8 (BO3)",
+        "Counter-Strike: fnatic vs Imperial (BO1)",
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "name, normalized",
+    [
+        ("Trail Blazers", "trailblazers"),
+        ("TrailBlazers", "trailblazers"),
+        ("trail-blazers", "trailblazers"),
+        ("St. Louis Blues", "stlouisblues"),
+        ("76ers", "76ers"),
+        ("Team_Liquid", "teamliquid"),
+        ("Ñublense", "ñublense"),
+    ],
+)
+def test_normalize_name(name, normalized):
+    assert normalize_name(name) == normalized
+
+
+@pytest.mark.parametrize(
+    "question, teams",
+    [
+        ("Celtics vs. Cavaliers", ("Celtics", "Cavaliers")),
+        ("Celtics vs Cavaliers", ("Celtics", "Cavaliers")),
+        ("Trail Blazers  vs.  Maple Leafs", ("Trail Blazers", "Maple Leafs")),
+        ("Counter-Strike: FaZe vs NIP (BO3)", ("FaZe", "NIP")),
+        ("Will the Celtics win the title?", None),
+        ("A vs. B vs. C", None),
+    ],
+)
+def test_split_question(question, teams):
+    assert split_question(question) == teams
+
+
+def test_resolver_maps_aliases_and_canonical_names():
+    resolver = TeamResolver({"LAR": "Rams", "Los Angeles R": "Rams", "NAVI": "NAVI"})
+    assert resolver.resolve("LAR") == "Rams"
+    assert resolver.resolve("los angeles r") == "Rams"
+    assert resolver.resolve("Rams") == "Rams"
+    assert resolver.resolve("navi") == "NAVI"
+
+
+def test_resolver_only_matches_whole_names():
+    resolver = SPORT_CONFIG["cs2"]["resolver"]
+    assert resolver.resolve("Natus Vincere") == "NAVI"
+    # An academy roster must not resolve to its main team
+    assert resolver.resolve("MOUZ NXT") is None
+    assert resolver.resolve("Unknown Team") is None
+    assert resolver.resolve("") is None
+
+
+def test_resolver_keeps_unknown_teams_as_written():
+    resolver = SPORT_CONFIG["nfl"]["resolver"]
+    assert resolver.teams("LAR vs. Cardinals") == ("Rams", "Cardinals")
+    assert resolver.teams("Rams vs. Expansion Team") == ("Rams", "Expansion Team")
+    assert resolver.teams("Super Bowl winner") is None
+
+
+def test_resolver_caches_parsed_questions():
+    resolver = TeamResolver({"LAR": "Rams"}, cache_size=2)
+    for _ in range(3):
+        resolver.teams("LAR vs. Cardinals")
+    info = resolver._cached_teams.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+
+
+@pytest.mark.parametrize("sport", MATCHED_QUESTIONS)
+def test_match_markets_on_fixtures(sport):
+    markets = []
+    for venue in ("polymarket", "kalshi"):
+        with open(f"data/{sport}_markets_{venue}.json", encoding="utf-8") as f:
+            markets.append(json.load(f))
+    tickers, questions = NormalizeSportsMarket(*markets, sport).match_markets()
+
+    assert sorted(questions) == MATCHED_QUESTIONS[sport]
+    assert len(tickers) == 2 * len(questions)
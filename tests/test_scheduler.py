@@ -0,0 +1,128 @@
+"""Fixed-rate and pipelined scheduling on a fake clock."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from sports import scheduler
+
+INTERVAL = 10.0
+
+
+class Stop(Exception):
+    """Ends a scheduler loop once a test has seen enough cycles."""
+
+
+@pytest.fixture
+def fake_asyncio(monkeypatch):
+    """Run the scheduler on a fake clock that only sleeping advances.
+
+    Every sleep yields to the other tasks, then calls ``on_sleep``, which a
+    test sets to raise ``Stop`` once it has seen enough.
+    """
+    fake = SimpleNamespace(
+        now=0.0,
+        sleeps=[],
+        on_sleep=lambda: None,
+        Queue=asyncio.Queue,
+        gather=asyncio.gather,
+        to_thread=asyncio.to_thread,
+    )
+    fake.get_running_loop = lambda: SimpleNamespace(time=lambda: fake.now)
+
+    async def sleep(delay):
+        fake.sleeps.append(delay)
+        fake.now += delay
+        for _ in range(5):
+            await asyncio.sleep(0)
+        fake.on_sleep()
+
+    fake.sleep = sleep
+    monkeypatch.setattr(scheduler, "asyncio", fake)
+    return fake
+
+
+def run_fixed_rate(fake_asyncio, durations: list[float], fail: bool = False) -> list:
+    """Run one cycle per duration and return the cycle start times."""
+    starts = []
+
+    async def cycle():
+        starts.append(fake_asyncio.now)
+        fake_asyncio.now += durations[len(starts) - 1]
+        if fail:
+            raise RuntimeError("venue unavailable")
+
+    def on_sleep():
+        if len(starts) == len(durations):
+            raise Stop
+
+    fake_asyncio.on_sleep = on_sleep
+    with pytest.raises(Stop):
+        asyncio.run(scheduler.run_fixed_rate("nba", INTERVAL, cycle))
+    return starts
+
+
+def missed_deadline_warnings(caplog) -> list[str]:
+    return [message for message in caplog.messages if "missed deadlines" in message]
+
+
+def test_sleep_compensates_for_cycle_time(fake_asyncio, caplog):
+    starts = run_fixed_rate(fake_asyncio, [3.0, 4.0, 2.0, 5.0])
+    assert starts == [0.0, 10.0, 20.0, 30.0]
+    assert fake_asyncio.sleeps == [7.0, 6.0, 8.0, 5.0]
+    assert missed_deadline_warnings(caplog) == []
+
+
+def test_overrun_counts_a_missed_deadline_and_reanchors(fake_asyncio, caplog):
+    starts = run_fixed_rate(fake_asyncio, [3.0, 12.0, 4.0, 25.0, 1.0])
+    # Overrunning cycles are followed immediately, then the period resumes
+    assert starts == [0.0, 10.0, 22.0, 32.0, 57.0]
+    assert fake_asyncio.sleeps == [7.0, 0.0, 6.0, 0.0, 9.0]
+    warnings = missed_deadline_warnings(caplog)
+    assert len(warnings) == 2
+    assert "(1 missed deadlines)" in warnings[0]
+    assert "(2 missed deadlines)" in warnings[1]
+
+
+def test_failed_cycle_keeps_the_schedule(fake_asyncio, caplog):
+    starts = run_fixed_rate(fake_asyncio, [1.0, 1.0, 1.0], fail=True)
+    assert starts == [0.0, 10.0, 20.0]
+    assert caplog.messages.count("nba cycle failed") == 3
+
+
+def test_pipeline_drops_stale_snapshots(fake_asyncio, monkeypatch, caplog):
+    fetched = []
+    processed = []
+    release = SimpleNamespace(event=None)
+
+    async def fetch_snapshot(kalshi, polymarket, sport, match_first):
+        fetched.append(fake_asyncio.now)
+        if len(fetched) == 4:
+            release.event.set()
+        return [{"snapshot": len(fetched) - 1}], []
+
+    async def to_thread(function, markets_kalshi, *args):
+        assert function is scheduler.calculate_snapshot
+        processed.append(markets_kalshi[0]["snapshot"])
+        if len(processed) == 1:
+            # The first snapshot is processed for three fetch intervals
+            release.event = asyncio.Event()
+            await release.event.wait()
+
+    def on_sleep():
+        if len(processed) == 2:
+            raise Stop
+
+    monkeypatch.setattr(scheduler, "fetch_snapshot", fetch_snapshot)
+    fake_asyncio.to_thread = to_thread
+    fake_asyncio.on_sleep = on_sleep
+
+    with pytest.raises(Stop):
+        asyncio.run(scheduler.run_pipelined(None, None, "nba", INTERVAL))
+
+    # Fetching kept its schedule while the first snapshot was processed
+    assert fetched == [0.0, 10.0, 20.0, 30.0]
+    # Snapshots 1 and 2 went stale in the queue; only the freshest was kept
+    assert processed == [0, 3]
+    assert sum("dropped a stale snapshot" in m for m in caplog.messages) == 2
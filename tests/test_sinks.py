@@ -0,0 +1,123 @@
+"""Background writing of opportunity snapshots by the local sinks."""
+
+import asyncio
+import json
+import sqlite3
+
+import pytest
+
+from sinks import JSONLSink, SQLiteSink, create_sink
+
+
+def snapshot(label: str, count: int) -> list[dict]:
+    return [
+        {
+            "hash": f"{label}-{i}",
+            "question": f"Game {i}",
+            "date": "2025-12-01",
+            "kalshi": "Celtics|0.45",
+            "polymarket": "Cavaliers|0.5",
+            "profit": 0.05,
+            "kalshi_link": f"https://kalshi/{i}",
+            "polymarket_link": f"https://polymarket/{i}",
+            "sport": "nba",
+        }
+        for i in range(count)
+    ]
+
+
+async def write_each(sink, snapshots: list[list[dict]]) -> None:
+    """Submit the snapshots one at a time, each written before the next."""
+    await sink.start()
+    expected = 0
+    for opportunities in snapshots:
+        sink.submit("nba", opportunities)
+        expected += len(opportunities)
+        while sink.written_count < expected:
+            await asyncio.sleep(0.001)
+    await sink.close()
+
+
+async def write_together(sink, snapshots: list[list[dict]]) -> None:
+    """Submit the snapshots before the writer gets a chance to run."""
+    await sink.start()
+    for opportunities in snapshots:
+        sink.submit("nba", opportunities)
+    await sink.close()
+
+
+def sqlite_rows(path) -> list[tuple]:
+    with sqlite3.connect(path) as connection:
+        return connection.execute(
+            "SELECT ts, sport, hash FROM opportunities ORDER BY rowid"
+        ).fetchall()
+
+
+def jsonl_records(path) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_sqlite_keeps_only_the_latest_unwritten_snapshot(tmp_path):
+    path = tmp_path / "opportunities.db"
+    sink = SQLiteSink(str(path))
+    asyncio.run(write_together(sink, [snapshot("old", 3), snapshot("new", 2)]))
+
+    assert [hash for _, _, hash in sqlite_rows(path)] == ["new-0", "new-1"]
+    assert sink.written_count == 2
+
+
+def test_sqlite_records_written_snapshots_with_timestamps(tmp_path):
+    path = tmp_path / "nested" / "opportunities.db"
+    sink = SQLiteSink(str(path), batch_size=2)
+    asyncio.run(write_each(sink, [snapshot("first", 3), snapshot("second", 2)]))
+
+    rows = sqlite_rows(path)
+    assert [hash for _, _, hash in rows] == [
+        "first-0",
+        "first-1",
+        "first-2",
+        "second-0",
+        "second-1",
+    ]
+    assert {sport for _, sport, _ in rows} == {"nba"}
+    # Rows of one snapshot share its submission time
+    assert len({ts for ts, _, _ in rows[:3]}) == 1
+    assert rows[0][0] <= rows[3][0]
+
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        indexes = connection.execute("PRAGMA index_list(opportunities)").fetchall()
+    assert "opportunities_sport_hash_ts" in {index[1] for index in indexes}
+
+
+def test_jsonl_appends_batches_in_order(tmp_path):
+    path = tmp_path / "opportunities.jsonl"
+    first, second = snapshot("first", 2), snapshot("second", 3)
+    asyncio.run(write_each(JSONLSink(str(path)), [first, second]))
+    # A new sink appends to the existing file
+    asyncio.run(write_each(JSONLSink(str(path)), [snapshot("third", 1)]))
+
+    records = jsonl_records(path)
+    assert [record["hash"] for record in records] == [
+        "first-0",
+        "first-1",
+        "second-0",
+        "second-1",
+        "second-2",
+        "third-0",
+    ]
+    assert {key: records[2][key] for key in second[0]} == second[0]
+    assert records[0]["ts"] <= records[2]["ts"] <= records[5]["ts"]
+
+
+def test_jsonl_skips_empty_snapshots(tmp_path):
+    path = tmp_path / "opportunities.jsonl"
+    asyncio.run(write_each(JSONLSink(str(path)), [[]]))
+    assert not path.exists()
+
+
+def test_submit_requires_a_started_sink(tmp_path):
+    sink = create_sink("jsonl", path=str(tmp_path / "opportunities.jsonl"))
+    with pytest.raises(RuntimeError, match="start"):
+        sink.submit("nba", snapshot("early", 1))
@@ -0,0 +1,117 @@
+"""Cover solver tests with three or more outcomes."""
+
+import itertools
+import random
+
+import pytest
+
+from arbitrage import SolverArbitrageCalculator, solve_cover
+from normalize import Market
+from normalize.records import Quote
+
+OUTCOMES = ["Home", "Draw", "Away"]
+
+
+def cost(legs) -> float:
+    return sum(price for _, _, price in legs)
+
+
+def brute_force(quotes, outcomes, require_cross_venue):
+    """Return the cheapest cover's cost by trying every venue assignment."""
+    best = None
+    for venues in itertools.product(quotes, repeat=len(outcomes)):
+        if require_cross_venue and len(set(venues)) < 2:
+            continue
+        prices = [
+            quotes[venue].get(outcome) for venue, outcome in zip(venues, outcomes)
+        ]
+        if None in prices:
+            continue
+        if best is None or sum(prices) < best:
+            best = sum(prices)
+    return best
+
+
+def test_three_outcomes_take_the_cheapest_venue_each():
+    quotes = {
+        "kalshi": {"Home": 0.40, "Draw": 0.30, "Away": 0.35},
+        "polymarket": {"Home": 0.42, "Draw": 0.25, "Away": 0.33},
+    }
+    assert solve_cover(quotes, OUTCOMES) == [
+        ("Home", "kalshi", 0.40),
+        ("Draw", "polymarket", 0.25),
+        ("Away", "polymarket", 0.33),
+    ]
+
+
+def test_single_venue_cover_moves_the_cheapest_leg():
+    quotes = {
+        "kalshi": {"Home": 0.30, "Draw": 0.20, "Away": 0.30},
+        "polymarket": {"Home": 0.40, "Draw": 0.22, "Away": 0.50},
+    }
+    assert solve_cover(quotes, OUTCOMES) == [
+        ("Home", "kalshi", 0.30),
+        ("Draw", "polymarket", 0.22),
+        ("Away", "kalshi", 0.30),
+    ]
+    assert {venue for _, venue, _ in solve_cover(quotes, OUTCOMES, False)} == {
+        "kalshi"
+    }
+
+
+def test_missing_outcome_has_no_cover():
+    quotes = {
+        "kalshi": {"Home": 0.30, "Away": 0.30},
+        "polymarket": {"Home": 0.40, "Draw": None, "Away": 0.50},
+    }
+    assert solve_cover(quotes, OUTCOMES) is None
+
+
+@pytest.mark.parametrize("require_cross_venue", [True, False])
+def test_matches_brute_force(require_cross_venue):
+    rng = random.Random(0)
+    for _ in range(500):
+        outcomes = [f"o{i}" for i in range(rng.randint(3, 5))]
+        quotes = {
+            f"v{v}": {
+                outcome: round(rng.uniform(0.05, 0.6), 2)
+                for outcome in outcomes
+                if rng.random() < 0.9
+            }
+            for v in range(rng.randint(2, 4))
+        }
+        legs = solve_cover(quotes, outcomes, require_cross_venue)
+        expected = brute_force(quotes, outcomes, require_cross_venue)
+        if expected is None:
+            assert legs is None
+            continue
+        assert [outcome for outcome, _, _ in legs] == outcomes
+        assert all(quotes[venue][outcome] == price for outcome, venue, price in legs)
+        assert cost(legs) == pytest.approx(expected)
+        if require_cross_venue:
+            assert len({venue for _, venue, _ in legs}) > 1
+
+
+def market(venue: str, prices: dict[str, float]) -> Market:
+    quotes = {team: Quote(team, price) for team, price in prices.items()}
+    return Market("game", "Home vs. Away", "2025-12-01", venue, quotes=quotes)
+
+
+def test_calculator_covers_three_outcomes_across_three_venues():
+    other = market("other", {"Home": 0.50, "Draw": 0.20, "Away": 0.36})
+    calculator = SolverArbitrageCalculator(
+        {"game": market("kalshi", {"Home": 0.40, "Draw": 0.35, "Away": 0.40})},
+        {"game": market("polymarket", {"Home": 0.30, "Draw": 0.40, "Away": 0.45})},
+        "soccer",
+        extra_venues={"other": {"game": other}},
+    )
+    (opportunity,) = calculator.calculate(persist=False)
+
+    assert opportunity["legs"] == [
+        {"outcome": "Away", "venue": "other", "price": 0.36},
+        {"outcome": "Draw", "venue": "other", "price": 0.20},
+        {"outcome": "Home", "venue": "polymarket", "price": 0.30},
+    ]
+    assert opportunity["profit"] == pytest.approx(0.14)
+    assert opportunity["kalshi"] is None
+    assert opportunity["polymarket"] == "Home|0.3"
@@ -0,0 +1,142 @@
+"""Supabase writes against an in-memory stand-in for the sports table."""
+
+from types import SimpleNamespace
+
+import pytest
+from postgrest.exceptions import APIError
+
+import supabase_client
+from sinks import SupabaseSink
+
+
+class Table:
+    """Query builder over a list of rows with the sports table's columns."""
+
+    def __init__(self, rows: list[dict], columns: set[str]) -> None:
+        self.rows = rows
+        self.columns = columns
+        self.calls: list[str] = []
+        self._query = None
+
+    def table(self, name: str) -> "Table":
+        return self
+
+    def _check(self, columns) -> None:
+        missing = set(columns) - self.columns
+        if missing:
+            raise APIError({"code": "42703", "message": f"no column {missing}"})
+
+    def select(self, columns: str) -> "Table":
+        self._check(columns.split(","))
+        self._query = ("select", lambda row: True)
+        return self
+
+    def limit(self, count: int) -> "Table":
+        return self
+
+    def delete(self) -> "Table":
+        self._query = ("delete", lambda row: True)
+        return self
+
+    def eq(self, column: str, value) -> "Table":
+        kind, _ = self._query
+        self._query = (kind, lambda row: row.get(column) == value)
+        return self
+
+    def in_(self, column: str, values) -> "Table":
+        kind, _ = self._query
+        self._query = (kind, lambda row: row.get(column) in values)
+        return self
+
+    def insert(self, rows: list[dict]) -> "Table":
+        for row in rows:
+            self._check(row)
+        self._query = ("insert", rows)
+        return self
+
+    def upsert(self, rows: list[dict], on_conflict: str) -> "Table":
+        for row in rows:
+            self._check(row)
+        self._query = ("upsert", rows)
+        return self
+
+    def execute(self) -> SimpleNamespace:
+        kind, arg = self._query
+        self.calls.append(kind)
+        if kind == "select":
+            return SimpleNamespace(data=[row for row in self.rows if arg(row)])
+        if kind == "delete":
+            self.rows[:] = [row for row in self.rows if not arg(row)]
+        elif kind == "insert":
+            self.rows.extend(dict(row) for row in arg)
+        elif kind == "upsert":
+            for row in arg:
+                self.rows[:] = [r for r in self.rows if r["hash"] != row["hash"]]
+                self.rows.append(dict(row))
+        return SimpleNamespace(data=[])
+
+
+def opportunity(market_hash: str, profit: float) -> dict:
+    return {
+        "hash": market_hash,
+        "question": f"Game {market_hash}",
+        "profit": profit,
+        "fee": 0.01,
+        "net_profit": profit - 0.01,
+        "break_even_size": 1,
+        "sport": "nba",
+        "roi": profit / 100,
+    }
+
+
+@pytest.fixture
+def use_table(monkeypatch):
+    def install(columns: tuple[str, ...]) -> Table:
+        table = Table([], set(columns))
+        monkeypatch.setattr(supabase_client, "_supabase_client", table)
+        monkeypatch.setattr(supabase_client, "_hash_keyed", None)
+        return table
+
+    return install
+
+
+def write(sink: SupabaseSink, *snapshots: list[dict]) -> None:
+    for snapshot in snapshots:
+        sink._write_batch({"nba": (0.0, snapshot)})
+
+
+def test_hash_keyed_table_only_writes_changes(use_table):
+    table = use_table(supabase_client.SPORTS_COLUMNS)
+    write(
+        SupabaseSink(),
+        [opportunity("a", 1.0), opportunity("b", 2.0)],
+        [opportunity("a", 1.0), opportunity("c", 3.0)],
+    )
+
+    assert sorted(row["hash"] for row in table.rows) == ["a", "c"]
+    assert all(row["net_profit"] == row["profit"] - 0.01 for row in table.rows)
+    assert all("roi" not in row for row in table.rows)
+    assert "insert" not in table.calls
+    assert table.calls.count("upsert") == 2
+
+
+def test_legacy_table_is_replaced_without_the_hash(use_table):
+    table = use_table(supabase_client.LEGACY_SPORTS_COLUMNS)
+    write(
+        SupabaseSink(),
+        [opportunity("a", 1.0), opportunity("b", 2.0)],
+        [opportunity("a", 1.0), opportunity("c", 3.0)],
+    )
+
+    assert sorted(row["question"] for row in table.rows) == ["Game a", "Game c"]
+    legacy = set(supabase_client.LEGACY_SPORTS_COLUMNS)
+    assert all(row.keys() == legacy for row in table.rows)
+    assert "upsert" not in table.calls
+
+
+def test_direct_write_fits_a_legacy_table(use_table):
+    columns = supabase_client.LEGACY_SPORTS_COLUMNS
+    table = use_table(columns)
+    supabase_client.write_sports_arbitrage_to_supabase([opportunity("a", 1.0)])
+    expected = opportunity("a", 1.0)
+    assert table.rows == [{column: expected.get(column) for column in columns}]
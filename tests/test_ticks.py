@@ -0,0 +1,240 @@
+"""Tick recorder and reader round trips over the nba fixtures."""
+
+import asyncio
+import glob
+import json
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import ticks.recorder
+from normalize import NormalizeSportsMarket
+from ticks import TickLog, TickRecorder
+from ticks.reader import INDEX_SUFFIX
+
+START = 1_764_590_400.0
+# Seconds between recorded cycles; segments rotate every third cycle
+CYCLE_SECONDS = 5.0
+SEGMENT_SECONDS = 12.0
+CYCLES = 10
+KALSHI_SIDES = ("yes_bid", "yes_ask", "no_bid", "no_ask")
+
+
+def load_fixtures() -> tuple[list[dict], list[dict]]:
+    markets = []
+    for venue in ("kalshi", "polymarket"):
+        with open(f"data/nba_markets_{venue}.json", encoding="utf-8") as f:
+            markets.append(json.load(f))
+    return markets[0], markets[1]
+
+
+def polymarket_tokens(entries: list[dict]) -> dict[str, dict]:
+    """Give every team of every question a token ID and its metadata."""
+    return {
+        f"{entry['question']}|{key[: -len(' BUY')]}": {
+            "question": entry["question"],
+            "date": entry["date"],
+            "slug": entry["slug"],
+            "team": key[: -len(" BUY")],
+        }
+        for entry in entries
+        for key in entry
+        if key.endswith(" BUY")
+    }
+
+
+def kalshi_state(records: list[dict], cycle: int) -> dict[str, dict]:
+    """Return each ticker's quotes at ``cycle``, moving a cent per cycle."""
+    return {
+        record["market_ticker"]: {
+            side: None if record[side] is None else record[side] + cycle % 3
+            for side in KALSHI_SIDES
+        }
+        for record in records
+    }
+
+
+def polymarket_state(entries: list[dict], cycle: int) -> dict[str, dict]:
+    """Return each token's BUY and BID at ``cycle``."""
+    state = {}
+    for token, metadata in polymarket_tokens(entries).items():
+        entry = next(e for e in entries if e["question"] == metadata["question"])
+        buy = entry[f"{metadata['team']} BUY"]
+        buy = None if buy is None else round(buy + cycle % 3 / 100, 2)
+        state[token] = {"BUY": buy, "BID": None if buy is None else buy - 0.01}
+    return state
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive the recorder's segment names and rotation from a fake clock."""
+    now = SimpleNamespace(value=START)
+    monkeypatch.setattr(
+        ticks.recorder,
+        "time",
+        SimpleNamespace(
+            time=lambda: now.value, strftime=time.strftime, gmtime=time.gmtime
+        ),
+    )
+    return now
+
+
+@pytest.fixture
+def log_dir(tmp_path, clock):
+    """Record CYCLES cycles of both venues' nba quotes and return the directory."""
+    kalshi_records, polymarket_entries = load_fixtures()
+
+    async def record():
+        recorder = TickRecorder(
+            str(tmp_path),
+            segment_seconds=SEGMENT_SECONDS,
+            flush_interval=60.0,
+            flush_ticks=1,
+        )
+        await recorder.start()
+        recorder.record_catalog(
+            "nba",
+            "kalshi",
+            {
+                record["market_ticker"]: {
+                    "event_title": record["event_title"],
+                    "game_date": record["game_date"],
+                }
+                for record in kalshi_records
+            },
+            START,
+        )
+        recorder.record_catalog(
+            "nba", "polymarket", polymarket_tokens(polymarket_entries), START
+        )
+        expected = 0
+        for cycle in range(CYCLES):
+            clock.value = START + cycle * CYCLE_SECONDS
+            for venue, state in (
+                ("kalshi", kalshi_state(kalshi_records, cycle)),
+                ("polymarket", polymarket_state(polymarket_entries, cycle)),
+            ):
+                quotes = [
+                    (market, side, price)
+                    for market, sides in state.items()
+                    for side, price in sides.items()
+                ]
+                recorder.record_quotes("nba", venue, quotes, clock.value)
+                expected += len(quotes)
+            while recorder.written_count < expected:
+                await asyncio.sleep(0.001)
+        await recorder.close()
+
+    asyncio.run(record())
+    return str(tmp_path)
+
+
+def expected_snapshot(cycle: int) -> tuple[list[dict], list[dict]]:
+    """Return the client-format records the reader should rebuild."""
+    kalshi_records, polymarket_entries = load_fixtures()
+    kalshi_quotes = kalshi_state(kalshi_records, cycle)
+    kalshi = [
+        {
+            "market_ticker": record["market_ticker"],
+            "event_title": record["event_title"],
+            "game_date": record["game_date"],
+            **kalshi_quotes[record["market_ticker"]],
+        }
+        for record in kalshi_records
+    ]
+    polymarket_quotes = polymarket_state(polymarket_entries, cycle)
+    polymarket = {}
+    for token, metadata in polymarket_tokens(polymarket_entries).items():
+        entry = polymarket.setdefault(
+            metadata["question"],
+            {key: metadata[key] for key in ("question", "date", "slug")},
+        )
+        for side, price in polymarket_quotes[token].items():
+            entry[f"{metadata['team']} {side}"] = price
+    return kalshi, list(polymarket.values())
+
+
+def snapshots(directory: str, **kwargs) -> list:
+    return list(TickLog(directory).snapshots("nba", **kwargs))
+
+
+def test_snapshots_round_trip_across_segments(log_dir):
+    assert len(glob.glob(os.path.join(log_dir, "nba-*.ticks"))) == 4
+
+    rebuilt = snapshots(log_dir)
+    assert [timestamp for timestamp, *_ in rebuilt] == [
+        START + cycle * CYCLE_SECONDS for cycle in range(CYCLES)
+    ]
+    for cycle, (_, sport, kalshi, polymarket) in enumerate(rebuilt):
+        assert sport == "nba"
+        assert (kalshi, polymarket) == expected_snapshot(cycle)
+
+
+def test_ticks_filter_by_market_and_hash(log_dir):
+    kalshi_records, polymarket_entries = load_fixtures()
+    ticker = kalshi_records[0]["market_ticker"]
+    log = TickLog(log_dir)
+
+    by_ticker = list(log.ticks("nba", markets={ticker}))
+    assert {(venue, tick[1]) for venue, tick in by_ticker} == {("kalshi", ticker)}
+    assert len(by_ticker) == CYCLES * len(KALSHI_SIDES)
+
+    kalshi_hashes, question_hashes = NormalizeSportsMarket(
+        polymarket_entries, kalshi_records, "nba"
+    ).market_hashes()
+    market_hash = kalshi_hashes[ticker]
+    expected = {("kalshi", t) for t, h in kalshi_hashes.items() if h == market_hash}
+    expected |= {
+        ("polymarket", token)
+        for token, metadata in polymarket_tokens(polymarket_entries).items()
+        if question_hashes.get(metadata["question"]) == market_hash
+    }
+    assert any(venue == "polymarket" for venue, _ in expected)
+    by_hash = log.ticks("nba", market_hashes={market_hash})
+    assert {(venue, tick[1]) for venue, tick in by_hash} == expected
+
+
+def test_start_and_end_window(log_dir):
+    start = START + 3 * CYCLE_SECONDS
+    end = START + 6 * CYCLE_SECONDS
+    timestamps = {tick[0] for _, tick in TickLog(log_dir).ticks("nba", start, end)}
+    assert timestamps == {START + cycle * CYCLE_SECONDS for cycle in (3, 4, 5)}
+
+    rebuilt = snapshots(log_dir, start=start, end=end)
+    assert [timestamp for timestamp, *_ in rebuilt] == sorted(timestamps)
+    assert (rebuilt[0][2], rebuilt[0][3]) == expected_snapshot(3)
+
+
+@pytest.mark.parametrize("damage", ["missing", "corrupt"])
+def test_unusable_index_is_rebuilt(log_dir, damage):
+    expected = snapshots(log_dir)
+    index_paths = glob.glob(os.path.join(log_dir, f"*{INDEX_SUFFIX}"))
+    assert len(index_paths) == 4
+
+    for path in index_paths:
+        if damage == "missing":
+            os.remove(path)
+        else:
+            with open(path, "wb") as f:
+                f.write(b"not an index")
+
+    assert snapshots(log_dir) == expected
+    assert sorted(glob.glob(os.path.join(log_dir, f"*{INDEX_SUFFIX}"))) == sorted(
+        index_paths
+    )
+
+
+def test_truncated_trailing_frame_is_skipped(log_dir):
+    # Index the complete segment first, so the stale index must be noticed
+    expected = snapshots(log_dir)
+    last = sorted(glob.glob(os.path.join(log_dir, "nba-*.ticks")))[-1]
+    with open(last, "r+b") as f:
+        f.truncate(os.path.getsize(last) - 10)
+
+    rebuilt = snapshots(log_dir)
+    # The last cycle's Polymarket frame is lost; its Kalshi frame survives
+    assert rebuilt[:-1] == expected[:-1]
+    assert rebuilt[-1][2] == expected_snapshot(CYCLES - 1)[0]
+    assert rebuilt[-1][3] == expected_snapshot(CYCLES - 2)[1]
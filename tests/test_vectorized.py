@@ -0,0 +1,88 @@
+"""NumPy engine parity with the reference calculator, and its speed."""
+
+import random
+import time
+
+from arbitrage import ArbitrageSportsCalculator, VectorizedArbitrageCalculator
+from normalize import Market
+from normalize.records import Quote
+
+
+def random_markets(
+    count: int, seed: int
+) -> tuple[dict[str, Market], dict[str, Market]]:
+    """Build matched games with ties, complements, gaps and order books."""
+    rng = random.Random(seed)
+
+    def price() -> float | None:
+        if rng.random() < 0.05:
+            return None
+        # Mostly cents, so prices often tie across venues, some in tenths
+        cents = rng.randint(1, 99)
+        if rng.random() < 0.2:
+            return round(cents / 100 + rng.randint(0, 9) / 1000, 3)
+        return cents / 100
+
+    def ladder(best: float | None):
+        if best is None or rng.random() < 0.5:
+            return None
+        return [
+            (round(best + level / 100, 2), float(rng.randint(1, 500)))
+            for level in range(rng.randint(0, 3))
+        ]
+
+    def market(index: int, venue: str, teams: list[str]) -> Market:
+        quotes = {}
+        complements = {}
+        for team in teams:
+            own = price()
+            quotes[team] = Quote(team, own, ladder(own))
+            if rng.random() < 0.6:
+                complement = price()
+                complements[team] = Quote(team, complement, ladder(complement), "no")
+        return Market(
+            f"game{index}",
+            f"Game {index}" if rng.random() < 0.98 else "",
+            rng.choice(["2025-12-01", None]),
+            venue,
+            link=f"https://{venue}/{index}",
+            quotes=quotes,
+            complements=complements,
+        )
+
+    kalshi, polymarket = {}, {}
+    for index in range(count):
+        teams = ["Home", "Away"]
+        if rng.random() < 0.05:
+            teams.append("Draw")
+        kalshi[f"game{index}"] = market(index, "kalshi", teams)
+        polymarket[f"game{index}"] = market(index, "polymarket", teams)
+    return kalshi, polymarket
+
+
+def opportunities(calculator_type, markets) -> list[dict]:
+    return calculator_type(*markets, "nba").calculate(persist=False)
+
+
+def test_matches_the_reference_calculator():
+    for seed in range(5):
+        markets = random_markets(2000, seed)
+        expected = opportunities(ArbitrageSportsCalculator, markets)
+        assert expected
+        assert opportunities(VectorizedArbitrageCalculator, markets) == expected
+
+
+def test_faster_than_the_reference_calculator():
+    markets = random_markets(5000, 0)
+
+    def best_time(calculator_type) -> float:
+        times = []
+        for _ in range(3):
+            start = time.perf_counter()
+            opportunities(calculator_type, markets)
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    assert best_time(VectorizedArbitrageCalculator) < best_time(
+        ArbitrageSportsCalculator
+    )
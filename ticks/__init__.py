@@ -0,0 +1,6 @@
+"""Compact binary recording of every quote received from the venues."""
+
+from .reader import TickLog, TickSegment
+from .recorder import TickRecorder
+
+__all__ = ["TickLog", "TickRecorder", "TickSegment"]
@@ -0,0 +1,46 @@
+"""Print recorded ticks, or per-sport totals, from a tick log directory."""
+
+import argparse
+import json
+import logging
+
+from .reader import TickLog
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Read recorded tick logs")
+    parser.add_argument("directory", help="Directory of .ticks segments")
+    parser.add_argument("--sport", action="append", help="Only read this sport")
+    parser.add_argument("--start", type=float, help="Earliest receive time (Unix)")
+    parser.add_argument("--end", type=float, help="Receive time to stop at (Unix)")
+    parser.add_argument("--market", action="append", help="Only print this market ID")
+    parser.add_argument(
+        "--hash", action="append", help="Only print markets of this market hash"
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="Print tick counts and time spans instead of ticks",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    log = TickLog(args.directory)
+    for sport in args.sport or log.sports():
+        ticks = log.ticks(sport, args.start, args.end, args.market, args.hash)
+        if not args.summary:
+            for venue, (timestamp, market, side, price) in ticks:
+                record = {"ts": timestamp, "sport": sport, "venue": venue}
+                record.update({"market": market, "side": side, "price": price})
+                print(json.dumps(record))
+            continue
+        tick_count = 0
+        first = last = None
+        for _, (timestamp, _, _, _) in ticks:
+            tick_count += 1
+            first = timestamp if first is None else min(first, timestamp)
+            last = timestamp if last is None else max(last, timestamp)
+        print(f"{sport}: {tick_count} ticks from {first} to {last}")
@@ -0,0 +1,121 @@
+"""Binary layout of recorded tick log segments.
+
+A segment starts with ``SEGMENT_MAGIC`` and is followed by frames. Each frame
+is a ``FRAME_HEADER``, the UTF-8 venue name and a zlib-compressed payload of
+``FRAME_HEADER.payload_length`` bytes. Tick payloads are a run of
+``TICK_HEADER`` records grouped by market ID, each followed by its side and
+market ID; catalog payloads are a JSON object of market ID -> metadata.
+"""
+
+import json
+import math
+import struct
+import zlib
+from collections.abc import Iterator
+from operator import itemgetter
+from typing import Any
+
+SEGMENT_MAGIC = b"TICKLOG1"
+SEGMENT_SUFFIX = ".ticks"
+
+# Payload length, payload CRC-32, record count, kind, venue length,
+# first and last receive timestamps
+FRAME_HEADER = struct.Struct("<IIIBBdd")
+# Receive timestamp, price (NaN when absent), side length, market ID length
+TICK_HEADER = struct.Struct("<ddBH")
+
+FRAME_TICKS = 0
+FRAME_CATALOG = 1
+
+# (receive timestamp, market ID, side, price)
+Tick = tuple[float, str, str, float | None]
+
+
+def encode_ticks(ticks: list[Tick]) -> bytes:
+    """Encode ticks grouped by market ID, keeping each market's order."""
+    parts = []
+    for timestamp, market, side, price in sorted(ticks, key=itemgetter(1)):
+        side_bytes = side.encode()
+        market_bytes = market.encode()
+        parts.append(
+            TICK_HEADER.pack(
+                timestamp,
+                math.nan if price is None else price,
+                len(side_bytes),
+                len(market_bytes),
+            )
+        )
+        parts.append(side_bytes)
+        parts.append(market_bytes)
+    return b"".join(parts)
+
+
+def decode_ticks(payload: bytes | memoryview) -> Iterator[Tick]:
+    """Yield the ticks of a decompressed tick payload or a slice of one."""
+    view = memoryview(payload)
+    offset = 0
+    end = len(view)
+    while offset < end:
+        timestamp, price, side_length, market_length = TICK_HEADER.unpack_from(
+            view, offset
+        )
+        offset += TICK_HEADER.size
+        side = str(view[offset : offset + side_length], "utf-8")
+        offset += side_length
+        market = str(view[offset : offset + market_length], "utf-8")
+        offset += market_length
+        yield timestamp, market, side, None if math.isnan(price) else price
+
+
+def market_ranges(payload: bytes) -> Iterator[tuple[str, int, int]]:
+    """Yield (market ID, start, end) byte ranges of a tick payload's markets.
+
+    Ticks are encoded grouped by market, so each market is one contiguous
+    run. Only the record headers and market IDs are read.
+    """
+    view = memoryview(payload)
+    offset = 0
+    end = len(view)
+    market = None
+    start = 0
+    while offset < end:
+        _, _, side_length, market_length = TICK_HEADER.unpack_from(view, offset)
+        market_offset = offset + TICK_HEADER.size + side_length
+        tick_market = view[market_offset : market_offset + market_length]
+        if market is None or tick_market != market:
+            if market is not None:
+                yield str(market, "utf-8"), start, offset
+            market = tick_market
+            start = offset
+        offset = market_offset + market_length
+    if market is not None:
+        yield str(market, "utf-8"), start, offset
+
+
+def encode_catalog(catalog: dict[str, dict[str, Any]]) -> bytes:
+    """Encode a venue's market ID -> metadata catalog."""
+    return json.dumps(catalog, separators=(",", ":")).encode()
+
+
+def encode_frame(
+    kind: int,
+    venue: str,
+    payload: bytes,
+    count: int,
+    first_timestamp: float,
+    last_timestamp: float,
+    level: int = zlib.Z_DEFAULT_COMPRESSION,
+) -> bytes:
+    """Compress a payload and prefix it with its frame header and venue."""
+    compressed = zlib.compress(payload, level)
+    venue_bytes = venue.encode()
+    header = FRAME_HEADER.pack(
+        len(compressed),
+        zlib.crc32(compressed),
+        count,
+        kind,
+        len(venue_bytes),
+        first_timestamp,
+        last_timestamp,
+    )
+    return header + venue_bytes + compressed
@@ -0,0 +1,431 @@
+"""Memory-mapped reader and sidecar index over recorded tick logs.
+
+Segments are read in place through ``mmap``; frames outside the requested
+time range are skipped from their headers and only the requested markets'
+ticks are decoded:
+
+    python -m ticks data/ticks --sport nba --hash <market hash>
+"""
+
+import calendar
+import glob
+import json
+import logging
+import mmap
+import os
+import time
+import zlib
+from collections import defaultdict
+from collections.abc import Collection, Iterator
+from typing import Any
+
+from normalize import NormalizeSportsMarket
+
+from .format import (
+    FRAME_CATALOG,
+    FRAME_HEADER,
+    FRAME_TICKS,
+    SEGMENT_MAGIC,
+    SEGMENT_SUFFIX,
+    Tick,
+    decode_ticks,
+    market_ranges,
+)
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 1
+# Frames starting within this many seconds of each other form one snapshot
+DEFAULT_SNAPSHOT_INTERVAL = 1.0
+
+# Payload offset, payload length, kind, venue, record count,
+# first and last receive timestamps
+Frame = tuple[int, int, int, str, int, float, float]
+# (timestamp, sport, raw Kalshi records, raw Polymarket entries)
+Snapshot = tuple[float, str, list[dict[str, Any]], list[dict[str, Any]]]
+
+
+def _overlaps(
+    first: float, last: float, start: float | None, end: float | None
+) -> bool:
+    """Return True if [first, last] intersects the half-open [start, end)."""
+    return (start is None or last >= start) and (end is None or first < end)
+
+
+class TickSegment:
+    """A memory-mapped tick log segment and its sidecar index.
+
+    The index lists every complete frame with its time bounds, the byte
+    range of each market's ticks inside every tick payload and the market
+    hash of each recorded market, derived from the segment's catalogs. It is
+    kept next to the segment as ``<segment>.idx``; reopening a segment only
+    scans frames appended since the index was written.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Map the segment at ``path`` and load or extend its index."""
+        self.path = path
+        self.sport = os.path.basename(path).rsplit("-", 1)[0]
+        self._file = open(path, "rb")
+        # Empty files cannot be mapped
+        if os.fstat(self._file.fileno()).st_size:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.view = memoryview(self._mmap)
+        else:
+            self._mmap = None
+            self.view = memoryview(b"")
+        self.frames: list[Frame] = []
+        # Venue -> market ID -> (frame number, start, end) payload ranges
+        self.markets: dict[str, dict[str, list[tuple[int, int, int]]]] = {}
+        # Venue -> market ID -> market hash
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.indexed_size = 0
+        self._load_index()
+
+    def __enter__(self) -> "TickSegment":
+        """Return the segment for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the segment on leaving the context."""
+        self.close()
+
+    @property
+    def index_path(self) -> str:
+        """Return the path of the sidecar index."""
+        return self.path + INDEX_SUFFIX
+
+    def close(self) -> None:
+        """Unmap and close the segment."""
+        self.view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def read_frame(self, number: int) -> bytes:
+        """Decompress a frame's payload straight from the mapping."""
+        offset, length = self.frames[number][:2]
+        return zlib.decompress(self.view[offset : offset + length])
+
+    def frame_numbers(
+        self, start: float | None = None, end: float | None = None
+    ) -> list[int]:
+        """Return the frames that may hold ticks received in [start, end).
+
+        Catalog frames are always included, as they apply to later ticks.
+        """
+        return [
+            number
+            for number, (_, _, kind, _, _, first, last) in enumerate(self.frames)
+            if kind == FRAME_CATALOG or _overlaps(first, last, start, end)
+        ]
+
+    def select_markets(
+        self,
+        markets: Collection[str] | None = None,
+        market_hashes: Collection[str] | None = None,
+    ) -> set[tuple[str, str]]:
+        """Return the (venue, market ID) pairs matching IDs or market hashes."""
+        selected = set()
+        for venue, venue_markets in self.markets.items():
+            venue_hashes = self.hashes.get(venue, {})
+            for market in venue_markets:
+                if (markets and market in markets) or (
+                    market_hashes and venue_hashes.get(market) in market_hashes
+                ):
+                    selected.add((venue, market))
+        return selected
+
+    def ticks(
+        self,
+        start: float | None = None,
+        end: float | None = None,
+        markets: Collection[str] | None = None,
+        market_hashes: Collection[str] | None = None,
+    ) -> Iterator[tuple[str, Tick]]:
+        """Yield (venue, tick) pairs received in [start, end), frame by frame.
+
+        With ``markets`` or ``market_hashes``, only frames holding those
+        markets are decompressed and only their ticks are decoded.
+        """
+        if markets is None and market_hashes is None:
+            for number in self.frame_numbers(start, end):
+                venue = self.frames[number][3]
+                if self.frames[number][2] != FRAME_TICKS:
+                    continue
+                for tick in decode_ticks(self.read_frame(number)):
+                    if _overlaps(tick[0], tick[0], start, end):
+                        yield venue, tick
+            return
+
+        # Frame number -> (venue, start, end) ranges to decode
+        ranges = defaultdict(list)
+        for venue, market in self.select_markets(markets, market_hashes):
+            for number, range_start, range_end in self.markets[venue][market]:
+                ranges[number].append((venue, range_start, range_end))
+        for number in sorted(ranges):
+            _, _, _, _, _, first, last = self.frames[number]
+            if not _overlaps(first, last, start, end):
+                continue
+            payload = memoryview(self.read_frame(number))
+            for venue, range_start, range_end in sorted(ranges[number]):
+                for tick in decode_ticks(payload[range_start:range_end]):
+                    if _overlaps(tick[0], tick[0], start, end):
+                        yield venue, tick
+
+    def _load_index(self) -> None:
+        """Load the sidecar index, then index any frames appended since."""
+        try:
+            with open(self.index_path, "rb") as f:
+                index = json.loads(zlib.decompress(f.read()))
+        except (OSError, ValueError, zlib.error):
+            index = None
+        if (
+            index is not None
+            and index.get("version") == INDEX_VERSION
+            and index["size"] <= len(self.view)
+        ):
+            self.frames = [tuple(frame) for frame in index["frames"]]
+            self.markets = index["markets"]
+            self.hashes = index["hashes"]
+            self.indexed_size = index["size"]
+        if self._scan():
+            self._save_index()
+
+    def _scan(self) -> bool:
+        """Index complete frames past ``indexed_size``; True if any were found.
+
+        A frame still being appended is left for the next scan.
+        """
+        view = self.view
+        offset = self.indexed_size
+        if not offset:
+            if len(view) < len(SEGMENT_MAGIC):
+                return False
+            if view[: len(SEGMENT_MAGIC)] != SEGMENT_MAGIC:
+                raise ValueError(f"{self.path} is not a tick log segment")
+            offset = len(SEGMENT_MAGIC)
+
+        frame_count = len(self.frames)
+        while offset + FRAME_HEADER.size <= len(view):
+            length, crc, count, kind, venue_length, first, last = (
+                FRAME_HEADER.unpack_from(view, offset)
+            )
+            payload_offset = offset + FRAME_HEADER.size + venue_length
+            payload_end = payload_offset + length
+            if payload_end > len(view):
+                break
+            compressed = view[payload_offset:payload_end]
+            if zlib.crc32(compressed) != crc:
+                logger.warning(
+                    "Corrupt frame at offset %d of %s, ignoring the rest",
+                    offset,
+                    self.path,
+                )
+                break
+            venue = str(view[offset + FRAME_HEADER.size : payload_offset], "utf-8")
+            payload = zlib.decompress(compressed)
+            number = len(self.frames)
+            self.frames.append(
+                (payload_offset, length, kind, venue, count, first, last)
+            )
+            if kind == FRAME_CATALOG:
+                self._hash_catalog(venue, json.loads(payload))
+            else:
+                venue_markets = self.markets.setdefault(venue, {})
+                for market, range_start, range_end in market_ranges(payload):
+                    venue_markets.setdefault(market, []).append(
+                        (number, range_start, range_end)
+                    )
+            offset = payload_end
+        self.indexed_size = offset
+        return len(self.frames) > frame_count
+
+    def _hash_catalog(self, venue: str, catalog: dict[str, dict[str, Any]]) -> None:
+        """Record the market hash of every game in a venue catalog."""
+        if venue == "kalshi":
+            records = [
+                {"market_ticker": ticker, **metadata}
+                for ticker, metadata in catalog.items()
+            ]
+            hashes, _ = NormalizeSportsMarket([], records, self.sport).market_hashes()
+        elif venue == "polymarket":
+            _, question_hashes = NormalizeSportsMarket(
+                list(catalog.values()), [], self.sport
+            ).market_hashes()
+            hashes = {
+                token: question_hashes[metadata["question"]]
+                for token, metadata in catalog.items()
+                if metadata.get("question") in question_hashes
+            }
+        else:
+            return
+        self.hashes.setdefault(venue, {}).update(hashes)
+
+    def _save_index(self) -> None:
+        """Atomically replace the sidecar index; failures only cost a rescan."""
+        index = {
+            "version": INDEX_VERSION,
+            "size": self.indexed_size,
+            "frames": self.frames,
+            "markets": self.markets,
+            "hashes": self.hashes,
+        }
+        data = zlib.compress(json.dumps(index, separators=(",", ":")).encode())
+        temp_path = f"{self.index_path}.tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            logger.warning("Failed to write tick log index %s: %s", self.index_path, e)
+
+
+class TickLog:
+    """The recorded segments in a directory, read per sport in time order."""
+
+    def __init__(self, directory: str) -> None:
+        """Initialize reader over the segments in ``directory``."""
+        self.directory = directory
+
+    def sports(self) -> list[str]:
+        """Return the sports with recorded segments."""
+        return sorted(
+            {
+                os.path.basename(path).rsplit("-", 1)[0]
+                for path in glob.glob(
+                    os.path.join(self.directory, f"*{SEGMENT_SUFFIX}")
+                )
+            }
+        )
+
+    def segments(
+        self, sport: str, start: float | None = None
+    ) -> Iterator[TickSegment]:
+        """Yield a sport's segments in order, each closed once the next is due.
+
+        Every tick in a segment was written before the next one was opened,
+        so segments followed by one opened before ``start`` are not mapped.
+        """
+        paths = sorted(
+            glob.glob(os.path.join(self.directory, f"{sport}-*{SEGMENT_SUFFIX}"))
+        )
+        for path, next_path in zip(paths, paths[1:] + [None]):
+            if (
+                start is not None
+                and next_path is not None
+                and self._opened_at(next_path) < start
+            ):
+                continue
+            with TickSegment(path) as segment:
+                yield segment
+
+    def ticks(
+        self,
+        sport: str,
+        start: float | None = None,
+        end: float | None = None,
+        markets: Collection[str] | None = None,
+        market_hashes: Collection[str] | None = None,
+    ) -> Iterator[tuple[str, Tick]]:
+        """Yield a sport's (venue, tick) pairs; see ``TickSegment.ticks``."""
+        for segment in self.segments(sport, start):
+            yield from segment.ticks(start, end, markets, market_hashes)
+
+    def snapshots(
+        self,
+        sport: str,
+        start: float | None = None,
+        end: float | None = None,
+        interval: float = DEFAULT_SNAPSHOT_INTERVAL,
+    ) -> Iterator[Snapshot]:
+        """Rebuild the raw venue records the clients held over time.
+
+        Frames are applied in write order, and a snapshot is emitted whenever
+        the next frame starts ``interval`` seconds or more after the first
+        one applied since the last snapshot, so both venues' fetches of one
+        cycle land in the same snapshot. Quotes recorded earlier in the first
+        segment of the range seed its state.
+        """
+        catalogs: dict[str, dict[str, dict[str, Any]]] = {}
+        # Venue -> market ID -> side -> price
+        quotes: dict[str, dict[str, dict[str, float | None]]] = {}
+        group_start = None
+        group_end = None
+        for segment in self.segments(sport, start):
+            for number in segment.frame_numbers(end=end):
+                _, _, kind, venue, _, first, last = segment.frames[number]
+                if (
+                    kind == FRAME_TICKS
+                    and group_start is not None
+                    and first - group_start >= interval
+                ):
+                    if start is None or group_end >= start:
+                        yield self._snapshot(sport, group_end, catalogs, quotes)
+                    group_start = None
+
+                payload = segment.read_frame(number)
+                if kind == FRAME_CATALOG:
+                    catalog = json.loads(payload)
+                    catalogs[venue] = catalog
+                    venue_quotes = quotes.get(venue, {})
+                    quotes[venue] = {
+                        market: market_quotes
+                        for market, market_quotes in venue_quotes.items()
+                        if market in catalog
+                    }
+                    continue
+                venue_quotes = quotes.setdefault(venue, {})
+                for timestamp, market, side, price in decode_ticks(payload):
+                    if end is None or timestamp < end:
+                        venue_quotes.setdefault(market, {})[side] = price
+                if group_start is None:
+                    group_start = first
+                group_end = last if group_end is None else max(group_end, last)
+
+        if group_start is not None and (start is None or group_end >= start):
+            yield self._snapshot(sport, group_end, catalogs, quotes)
+
+    @staticmethod
+    def _snapshot(
+        sport: str,
+        timestamp: float,
+        catalogs: dict[str, dict[str, dict[str, Any]]],
+        quotes: dict[str, dict[str, dict[str, float | None]]],
+    ) -> Snapshot:
+        """Build client-format records from the catalogs and latest quotes."""
+        kalshi_quotes = quotes.get("kalshi", {})
+        kalshi_markets = []
+        for ticker, metadata in catalogs.get("kalshi", {}).items():
+            # The normalizer reads the YES ask of every record
+            record = {"market_ticker": ticker, **metadata, "yes_ask": None}
+            for side, price in kalshi_quotes.get(ticker, {}).items():
+                record[side] = int(price) if price is not None else None
+            kalshi_markets.append(record)
+
+        polymarket_quotes = quotes.get("polymarket", {})
+        entries = {}
+        for token, metadata in catalogs.get("polymarket", {}).items():
+            question = metadata.get("question")
+            if not question:
+                continue
+            entry = entries.get(question)
+            if entry is None:
+                entry = {
+                    key: value
+                    for key, value in metadata.items()
+                    if key in ("question", "date", "slug")
+                }
+                entries[question] = entry
+            for side, price in polymarket_quotes.get(token, {}).items():
+                entry[f"{metadata['team']} {side}"] = price
+        return timestamp, sport, kalshi_markets, list(entries.values())
+
+    @staticmethod
+    def _opened_at(path: str) -> float:
+        """Return the UTC open time encoded in a segment's file name."""
+        stamp = os.path.basename(path).rsplit("-", 1)[1][: -len(SEGMENT_SUFFIX)]
+        opened_at = calendar.timegm(time.strptime(stamp[:15], "%Y%m%dT%H%M%S"))
+        return opened_at + int(stamp[15:]) / 1000
+
@@ -0,0 +1,226 @@
+"""Append-only recorder writing every fetched quote to rotating tick logs."""
+
+import asyncio
+import logging
+import os
+import time
+import zlib
+from collections.abc import Iterable
+from typing import Any, BinaryIO
+
+from .format import (
+    FRAME_CATALOG,
+    FRAME_TICKS,
+    SEGMENT_MAGIC,
+    SEGMENT_SUFFIX,
+    Tick,
+    encode_catalog,
+    encode_frame,
+    encode_ticks,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DIRECTORY = "data/ticks"
+# A sport's segment is rotated once it grows past this size or age
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+DEFAULT_SEGMENT_SECONDS = 3600.0
+# Seconds between background flushes
+DEFAULT_FLUSH_INTERVAL = 1.0
+# Buffered ticks that trigger a flush before the interval is up
+DEFAULT_FLUSH_TICKS = 50_000
+
+# (sport, venue) -> buffered ticks
+TickBatch = dict[tuple[str, str], list[Tick]]
+# (sport, venue) -> (discovery timestamp, market ID -> metadata)
+CatalogBatch = dict[tuple[str, str], tuple[float, dict[str, dict[str, Any]]]]
+
+
+class TickRecorder:
+    """Record quotes as they are received into compressed, rotating segments.
+
+    ``record_quotes`` only appends to an in-memory buffer, so recording costs
+    the fetch path a few list appends. A background task hands the buffer to
+    a worker thread every ``flush_interval`` seconds, or sooner once
+    ``flush_ticks`` are pending, where each (sport, venue) batch becomes one
+    length-prefixed zlib frame appended to ``<sport>-<start time>.ticks``.
+    Segments rotate by size and age, and each new segment starts with the
+    latest market catalogs so it can be read on its own.
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_DIRECTORY,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        segment_seconds: float = DEFAULT_SEGMENT_SECONDS,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        flush_ticks: int = DEFAULT_FLUSH_TICKS,
+        compression_level: int = zlib.Z_DEFAULT_COMPRESSION,
+    ) -> None:
+        """Initialize recorder writing segments under ``directory``."""
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.flush_interval = flush_interval
+        self.flush_ticks = flush_ticks
+        self.compression_level = compression_level
+        self.pending: TickBatch = {}
+        self.pending_catalogs: CatalogBatch = {}
+        self.pending_count = 0
+        self.written_count = 0
+        # Writer thread state: sport -> (file, size, opened at)
+        self._segments: dict[str, tuple[BinaryIO, int, float]] = {}
+        self._catalogs: CatalogBatch = {}
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._closing = False
+
+    async def start(self) -> None:
+        """Start the background flush task on the running loop."""
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    def record_quotes(
+        self,
+        sport: str,
+        venue: str,
+        quotes: Iterable[tuple[str, str, float | None]],
+        timestamp: float | None = None,
+    ) -> None:
+        """Buffer (market ID, side, price) quotes received at ``timestamp``.
+
+        Must be called from the event loop thread.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        ticks = self.pending.setdefault((sport, venue), [])
+        count = len(ticks)
+        ticks.extend((timestamp, market, side, price) for market, side, price in quotes)
+        self.pending_count += len(ticks) - count
+        if self.pending_count >= self.flush_ticks and self._wakeup is not None:
+            self._wakeup.set()
+
+    def record_catalog(
+        self,
+        sport: str,
+        venue: str,
+        catalog: dict[str, dict[str, Any]],
+        timestamp: float | None = None,
+    ) -> None:
+        """Buffer a venue's market ID -> metadata catalog after discovery."""
+        if timestamp is None:
+            timestamp = time.time()
+        self.pending_catalogs[(sport, venue)] = (timestamp, catalog)
+
+    async def close(self) -> None:
+        """Flush every buffered tick, stop the writer and close the segments."""
+        if self._task is None:
+            return
+        self._closing = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+        await asyncio.to_thread(self._close)
+
+    async def _run(self) -> None:
+        """Flush the buffer every interval, or early when it fills up."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if self.pending or self.pending_catalogs:
+                batch, self.pending = self.pending, {}
+                catalogs, self.pending_catalogs = self.pending_catalogs, {}
+                count, self.pending_count = self.pending_count, 0
+                start_time = time.time()
+                try:
+                    await asyncio.to_thread(self._write_batch, batch, catalogs)
+                except Exception as e:
+                    logger.error("Tick recorder failed to write batch: %s", e)
+                else:
+                    self.written_count += count
+                    logger.debug(
+                        "Recorded %d ticks in %.3f seconds",
+                        count,
+                        time.time() - start_time,
+                    )
+            if self._closing:
+                return
+
+    def _write_batch(self, batch: TickBatch, catalogs: CatalogBatch) -> None:
+        """Append catalogs, then ticks, one frame per (sport, venue)."""
+        frames: dict[str, list[bytes]] = {}
+        for (sport, venue), (timestamp, catalog) in catalogs.items():
+            frames.setdefault(sport, []).append(
+                self._catalog_frame(venue, catalog, timestamp)
+            )
+        for (sport, venue), ticks in batch.items():
+            if not ticks:
+                continue
+            frames.setdefault(sport, []).append(
+                encode_frame(
+                    FRAME_TICKS,
+                    venue,
+                    encode_ticks(ticks),
+                    len(ticks),
+                    min(tick[0] for tick in ticks),
+                    max(tick[0] for tick in ticks),
+                    self.compression_level,
+                )
+            )
+        for sport, sport_frames in frames.items():
+            data = b"".join(sport_frames)
+            f, size = self._segment(sport)
+            f.write(data)
+            f.flush()
+            self._segments[sport] = (f, size + len(data), self._segments[sport][2])
+        self._catalogs.update(catalogs)
+
+    def _catalog_frame(
+        self, venue: str, catalog: dict[str, dict[str, Any]], timestamp: float
+    ) -> bytes:
+        """Encode a catalog frame stamped with ``timestamp``."""
+        return encode_frame(
+            FRAME_CATALOG,
+            venue,
+            encode_catalog(catalog),
+            len(catalog),
+            timestamp,
+            timestamp,
+            self.compression_level,
+        )
+
+    def _segment(self, sport: str) -> tuple[BinaryIO, int]:
+        """Return the sport's open segment, rotating it when full or old."""
+        now = time.time()
+        segment = self._segments.get(sport)
+        if segment is not None:
+            f, size, opened_at = segment
+            if size < self.segment_bytes and now - opened_at < self.segment_seconds:
+                return f, size
+            f.close()
+
+        os.makedirs(self.directory, exist_ok=True)
+        # UTC start time to the millisecond, so names sort chronologically
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(now))
+        stamp += f"{int(now % 1 * 1000):03d}"
+        path = os.path.join(self.directory, f"{sport}-{stamp}{SEGMENT_SUFFIX}")
+        logger.info("Opening tick log segment %s", path)
+        f = open(path, "ab")
+        # Repeat the known catalogs so the segment can be read on its own
+        data = SEGMENT_MAGIC + b"".join(
+            self._catalog_frame(venue, catalog, timestamp)
+            for (catalog_sport, venue), (timestamp, catalog) in self._catalogs.items()
+            if catalog_sport == sport
+        )
+        f.write(data)
+        self._segments[sport] = (f, len(data), now)
+        return f, len(data)
+
+    def _close(self) -> None:
+        """Close every open segment; runs in a worker thread after the flush."""
+        for f, _, _ in self._segments.values():
+            f.close()
+        self._segments = {}
@@ -9,10 +9,14 @@ from typing import Any
 from dateutil import tz
 
 
+def saving_enabled() -> bool:
+    """Return True when the SAVE env var asks for JSON snapshots."""
+    return os.getenv("SAVE") in {"1", "true", "True"}
+
+
 def save_to_json(data: Any, path: str) -> bool:
     """Save data to JSON file if SAVE env var is truthy. Returns True when saved."""
-    should_save = os.getenv("SAVE") in {"1", "true", "True"}
-    if not should_save:
+    if not saving_enabled():
         return False
 
     with open(path, "w", encoding="utf-8") as f: